@@ -0,0 +1,130 @@
+"""
+Accuracy against wall time of the interplanetary integrators on the default Earth-Mars flight.
+
+Run with `python -m benchmarks.flight_to_mars_integrators`.
+"""
+
+import math
+import time
+from dataclasses import replace
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from labs.flight_to_mars.model.flight import IntegratorType
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.space.calculator import RocketInterplanetaryFlightCalculator
+from labs.flight_to_mars.stage.space.equation import interplanetary_engine_off_equation
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.model.constant import (
+    DAY,
+    EARTH_MASS,
+    EARTH_ORBIT_RADIUS,
+    EARTH_ORBITAL_VELOCITY,
+    EARTH_RADIUS,
+    MARS_MASS,
+    MARS_ORBIT_RADIUS,
+    MARS_RADIUS,
+    SUN_MASS,
+    SUN_RADIUS,
+)
+from labs.model.vector import Vector2D
+
+# The page default: Earth is at -180 deg from Sun, so Mars is behind Sun
+EARTH = Planet(x=0, y=0, mass=EARTH_MASS, radius=EARTH_RADIUS)
+MARS = Planet(x=EARTH_ORBIT_RADIUS + MARS_ORBIT_RADIUS, y=0, mass=MARS_MASS, radius=MARS_RADIUS)
+SUN = Planet(x=EARTH_ORBIT_RADIUS, y=0, mass=SUN_MASS, radius=SUN_RADIUS)
+PLANETS = [EARTH, MARS, SUN]
+
+DEFAULT_VELOCITY = 11_300
+DEFAULT_ANGLE = math.radians(-18.19)
+TAKE_OFF_HEIGHT = 2_336_000
+SAMPLING_DELTA = 4 * 60 * 60
+
+HORIZON = 120 * DAY
+DEPARTURE_LEG = 5 * DAY
+MAX_STEPS = (4 * 60 * 60, 60 * 60, 15 * 60)
+
+
+def main() -> None:
+    gravity = GravityKernel.from_planets(PLANETS)
+    departure = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    departure_state = _reference_state(departure, gravity, DEPARTURE_LEG)
+    coast = replace(
+        departure,
+        x=departure_state[0],
+        y=departure_state[1],
+        velocity_x=departure_state[2],
+        velocity_y=departure_state[3],
+    )
+
+    print(f"{'Integrator':<16}{'Max step, s':>12}{'Time, s':>10}{'Error, km':>14}{'Drift':>10}")
+    for title, rocket in (("Whole flight", departure), ("Coast after Earth", coast)):
+        print(title)
+        _benchmark(rocket, gravity)
+
+
+def launch_rocket(relative_velocity_norm: float, angle: float) -> Rocket:
+    velocity = Vector2D.from_polar(relative_velocity_norm, angle) + Vector2D(
+        0, -EARTH_ORBITAL_VELOCITY
+    )
+    start = Vector2D.from_polar(EARTH_RADIUS + TAKE_OFF_HEIGHT, velocity.angle)
+    return Rocket(
+        x=start.x,
+        y=start.y,
+        velocity_x=velocity.x,
+        velocity_y=velocity.y,
+        netto_mass=0,
+        fuel_mass=0,
+        stream_velocity=0,
+        acceleration_x=0,
+        acceleration_y=0,
+    )
+
+
+def _benchmark(rocket: Rocket, gravity: GravityKernel) -> None:
+    initial_state = np.array([rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y])
+    reference = _reference_state(rocket, gravity, HORIZON)
+
+    def energy(state: np.ndarray) -> float:
+        return 0.5 * state[2:] @ state[2:] + gravity.potential(state[:2])
+
+    initial_energy = energy(initial_state)
+
+    for integrator in IntegratorType:
+        for max_step in MAX_STEPS if integrator != IntegratorType.DOPRI5 else (None,):
+            calculator = RocketInterplanetaryFlightCalculator(
+                rocket,
+                interplanetary_engine_off_equation,
+                PLANETS,
+                integrator=integrator,
+                **({"max_step": max_step} if max_step else {}),
+            )
+            drift = 0.0
+            start = time.perf_counter()
+            for _ in range(int(HORIZON // SAMPLING_DELTA)):
+                calculator(SAMPLING_DELTA)
+                drift = max(drift, abs(energy(calculator.state) / initial_energy - 1))
+            elapsed = time.perf_counter() - start
+
+            error = np.hypot(*(calculator.state[:2] - reference[:2])) / 1000
+            print(
+                f"{integrator:<16}{max_step or 'adaptive':>12}{elapsed:>10.3f}"
+                f"{error:>14.3g}{drift:>10.1e}"
+            )
+
+
+def _reference_state(rocket: Rocket, gravity: GravityKernel, duration: float) -> np.ndarray:
+    return solve_ivp(
+        lambda _, state: interplanetary_engine_off_equation(state, gravity),
+        (0, duration),
+        (rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y),
+        method="DOP853",
+        rtol=1e-13,
+        atol=1e-6,
+    ).y[:, -1]
+
+
+if __name__ == "__main__":
+    main()
@@ -4,3 +4,14 @@ from enum import StrEnum
 class FlightEquationType(StrEnum):
     FIXED_ACCELERATION = "Fixed acceleration"
     FIXED_FUEL_RATE = "Fixed fuel rate"
+
+
+class IntegratorType(StrEnum):
+    DOPRI5 = "Dormand-Prince"
+    LEAPFROG = "Leapfrog"
+    YOSHIDA = "Yoshida"
+
+
+class PropagationType(StrEnum):
+    N_BODY = "N-body"
+    PATCHED_CONICS = "Patched conics"
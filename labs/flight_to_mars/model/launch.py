@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Launch:
+    """Space stage launch in the units of the sidebar sliders."""
+
+    earth_position: float  # deg
+    relative_velocity: float  # km/s
+    relative_angle: float  # deg
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import overload
+
+import numpy as np
+
+from labs.flight_to_mars.model.rocket import Rocket
+
+COLUMNS = (
+    "time",
+    "x",
+    "y",
+    "velocity_x",
+    "velocity_y",
+    "acceleration_x",
+    "acceleration_y",
+    "mass",
+)
+INITIAL_CAPACITY = 2**10
+
+
+class RocketLog:
+    """
+    Columnar rocket telemetry: time, position, velocity, acceleration and mass per sample.
+
+    Samples are stored as rows of a single float64 array, so each one takes 64 bytes.
+    The array is preallocated and grows geometrically when appended to. Netto mass and stream
+    velocity do not change during a flight, they are kept once. Indexing creates the `Rocket`
+    of a sample, slicing makes a log that shares the samples.
+    """
+
+    def __init__(
+        self,
+        netto_mass: float = 0.0,
+        stream_velocity: float = 0.0,
+        capacity: int = INITIAL_CAPACITY,
+    ) -> None:
+        self.netto_mass = netto_mass
+        self.stream_velocity = stream_velocity
+        self._data = np.empty((max(capacity, 1), len(COLUMNS)))
+        self._size = 0
+
+    @classmethod
+    def for_rocket(cls, rocket: Rocket, capacity: int = INITIAL_CAPACITY) -> RocketLog:
+        """Make an empty log of the rocket flight."""
+        return cls(rocket.netto_mass, rocket.stream_velocity, capacity)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        rocket: Rocket,
+        time: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        velocity_x: np.ndarray,
+        velocity_y: np.ndarray,
+        acceleration_x: np.ndarray,
+        acceleration_y: np.ndarray,
+        mass: np.ndarray | float,
+    ) -> RocketLog:
+        """Fill the log of the rocket flight at once, scalars are repeated for all samples."""
+        log = cls(rocket.netto_mass, rocket.stream_velocity, capacity=len(time))
+        log._data[: len(time)] = np.stack(
+            np.broadcast_arrays(
+                time, x, y, velocity_x, velocity_y, acceleration_x, acceleration_y, mass
+            ),
+            axis=-1,
+        )
+        log._size = len(time)
+        return log
+
+    def append(
+        self,
+        time: float,
+        x: float,
+        y: float,
+        velocity_x: float,
+        velocity_y: float,
+        acceleration_x: float,
+        acceleration_y: float,
+        mass: float,
+    ) -> None:
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, (2 * len(self._data), len(COLUMNS)))
+
+        self._data[self._size] = (
+            time,
+            x,
+            y,
+            velocity_x,
+            velocity_y,
+            acceleration_x,
+            acceleration_y,
+            mass,
+        )
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> Rocket: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RocketLog: ...
+
+    def __getitem__(self, index: int | slice) -> Rocket | RocketLog:
+        if isinstance(index, slice):
+            log = RocketLog(self.netto_mass, self.stream_velocity, capacity=0)
+            log._data = self.data[index]
+            log._size = len(log._data)
+            return log
+
+        _, x, y, velocity_x, velocity_y, acceleration_x, acceleration_y, mass = self.data[
+            index
+        ].tolist()
+        return Rocket(
+            x=x,
+            y=y,
+            velocity_x=velocity_x,
+            velocity_y=velocity_y,
+            netto_mass=self.netto_mass,
+            fuel_mass=mass - self.netto_mass,
+            stream_velocity=self.stream_velocity,
+            acceleration_x=acceleration_x,
+            acceleration_y=acceleration_y,
+        )
+
+    def __iter__(self) -> Iterator[Rocket]:
+        return (self[index] for index in range(self._size))
+
+    @property
+    def data(self) -> np.ndarray:
+        """All samples as a (len, 8) array view, columns are ordered as in `COLUMNS`."""
+        return self._data[: self._size]
+
+    @property
+    def time(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def velocity_x(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    @property
+    def velocity_y(self) -> np.ndarray:
+        return self.data[:, 4]
+
+    @property
+    def acceleration_x(self) -> np.ndarray:
+        return self.data[:, 5]
+
+    @property
+    def acceleration_y(self) -> np.ndarray:
+        return self.data[:, 6]
+
+    @property
+    def mass(self) -> np.ndarray:
+        return self.data[:, 7]
+
+    @property
+    def fuel_mass(self) -> np.ndarray:
+        return self.mass - self.netto_mass
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return np.hypot(self.velocity_x, self.velocity_y)
+
+    @property
+    def acceleration(self) -> np.ndarray:
+        return np.hypot(self.acceleration_x, self.acceleration_y)
+
+    @property
+    def angle(self) -> np.ndarray:
+        return np.arctan2(self.velocity_y, self.velocity_x)
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class SpaceView(StrEnum):
+    FLIGHT = "Flight"
+    PORKCHOP = "Porkchop plot"
@@ -1,7 +1,7 @@
 import math
-from collections.abc import Sequence
 from functools import partial
 
+import numpy as np
 import streamlit as st
 
 from labs.model.constant import (
@@ -23,21 +23,23 @@ from labs.model.constant import (
 )
 from labs.model.vector import Vector2D
 
-from .model.flight import FlightEquationType
+from .model.flight import FlightEquationType, PropagationType
+from .model.launch import Launch
 from .model.planet import Planet
 from .model.rocket import Rocket
+from .model.rocket_log import RocketLog
 from .model.stage import FlightStage
-from .stage.criteria import is_astronaut_dead
+from .model.view import SpaceView
+from .stage.criteria import AstronautMonitor
 from .stage.planet import flight_equations
+from .stage.planet.ascent import simulate_ascent
 from .stage.planet.calculator import RocketFlightCalculator
 from .stage.planet.criteria import did_leave_the_planet
 from .stage.planet.simulation import simulate_flight
-from .stage.space.calculator import RocketInterplanetaryFlightCalculator
-from .stage.space.criteria import check_planet_reach
-from .stage.space.equation import (
-    interplanetary_engine_off_equation,
-)
-from .stage.space.simulation import simulate_interplanetary_flight
+from .stage.space.ephemeris import Ephemeris
+from .stage.space.porkchop import compute_porkchop
+from .stage.space.propagation import propagate_interplanetary_flight
+from .stage.space.targeting import TargetingResult, target_planet
 from .visualization.chart import (
     plot_acceleration,
     plot_distance_to_target_chart,
@@ -49,10 +51,15 @@ from .visualization.entity import (
     earth_shape,
     mars_shape,
     orbit_shape,
-    rocket_shape,
     sun_shape,
 )
-from .visualization.render import render_animation
+from .visualization.porkchop import TRANSFER_SELECTION, create_porkchop_chart
+from .visualization.render import on_screen_size, render_animation
+
+APPROXIMATE_TAKE_OFF_HEIGHT = 2_336_000  # From Earth surface to orbit stage
+MIN_TRANSFER_TIME = 30 * DAY
+MAX_RELATIVE_VELOCITY = 20.0  # km/s
+DEFAULT_LAUNCH = Launch(earth_position=-180.0, relative_velocity=11.3, relative_angle=-18.19)
 
 
 def page() -> None:
@@ -65,57 +72,114 @@ def page() -> None:
         flight_equation_type = FlightEquationType.FIXED_ACCELERATION
 
         if flight_stage == FlightStage.SPACE:
+            st.session_state.setdefault("space_view", SpaceView.FLIGHT)
+            space_view: SpaceView | None = st.segmented_control(
+                "View",
+                options=list(SpaceView),
+                key="space_view",
+                help=(
+                    "Porkchop plot shows the Δv of Sun-only transfers, "
+                    "any of them can be simulated then."
+                ),
+            )
+            if space_view is None:
+                st.warning("Choose the view! Flight one is used now.")
+                space_view = SpaceView.FLIGHT
+
             show_real_size: bool = st.checkbox("Show real planets size")
             enable_planet_gravity: bool = st.checkbox(
                 "Take into account the gravity of both planets", value=True
             )
 
-            relative_rocket_velocity_norm: float = 1000 * st.slider(
-                "Relative initial velocity (km/s)",
-                min_value=10.0 if enable_planet_gravity else 5.0,
-                max_value=20.0,
-                value=11.3,
-                step=0.01,
-            )
-
-            rocket_angle = math.radians(
-                st.slider(
-                    "Relative start angle, deg",
-                    min_value=-90.0,
-                    max_value=90.0,
-                    value=-18.19,
+            if space_view == SpaceView.PORKCHOP:
+                grid_size: int = st.slider(
+                    "Grid size",
+                    min_value=16,
+                    max_value=128,
+                    value=64,
+                    step=16,
+                    help="Number of Earth positions and flight times of the grid.",
+                )
+            else:
+                launch: Launch = st.session_state.get("launch", DEFAULT_LAUNCH)
+
+                propagation: PropagationType | None = PropagationType.N_BODY
+                if enable_planet_gravity:
+                    propagation = st.segmented_control(
+                        "Propagation",
+                        options=list(PropagationType),
+                        default=PropagationType.N_BODY,
+                        help=(
+                            "Patched conics join Kepler orbits at the planets spheres of "
+                            "influence, it is faster but approximate."
+                        ),
+                    )
+                    if propagation is None:
+                        st.warning("Choose the propagation! N-body one is used now.")
+                        propagation = PropagationType.N_BODY
+
+                min_relative_velocity = 10.0 if enable_planet_gravity else 5.0
+                relative_rocket_velocity_norm: float = 1000 * st.slider(
+                    "Relative initial velocity (km/s)",
+                    min_value=min_relative_velocity,
+                    max_value=MAX_RELATIVE_VELOCITY,
+                    value=launch.relative_velocity,
                     step=0.01,
                 )
-            )
 
-            earth_position: Vector2D = Vector2D.from_polar(
-                EARTH_ORBIT_RADIUS,
-                math.radians(
+                rocket_angle = math.radians(
                     st.slider(
-                        "Earth position, deg",
-                        min_value=-180.0,
-                        max_value=180.0,
-                        value=-180.0,
-                        step=0.1,
+                        "Relative start angle, deg",
+                        min_value=-90.0,
+                        max_value=90.0,
+                        value=launch.relative_angle,
+                        step=0.01,
                     )
-                ),
-            )
+                )
 
-            st.info("Earth position is set by a radius-vector angle from Sun.")
+                earth_position: Vector2D = Vector2D.from_polar(
+                    EARTH_ORBIT_RADIUS,
+                    math.radians(
+                        st.slider(
+                            "Earth position, deg",
+                            min_value=-180.0,
+                            max_value=180.0,
+                            value=launch.earth_position,
+                            step=0.1,
+                        )
+                    ),
+                )
 
-            def relative_position(v: Vector2D) -> Vector2D:
-                return v - earth_position + Vector2D(EARTH_ORBIT_RADIUS, 0)
+                st.info("Earth position is set by a radius-vector angle from Sun.")
 
-            relative_rocket_velocity = Vector2D.from_polar(
-                relative_rocket_velocity_norm, angle=rocket_angle
-            )
-            earth_velocity = Vector2D.from_polar(
-                EARTH_ORBITAL_VELOCITY, earth_position.angle + math.pi / 2
-            )
-            rocket_velocity = relative_rocket_velocity + earth_velocity
+                enable_targeting: bool = st.checkbox(
+                    "Target Mars automatically",
+                    help=(
+                        "Velocity and angle are adjusted around the sliders values "
+                        "until the flight reaches Mars."
+                    ),
+                )
+                enable_moving_planets: bool = st.checkbox(
+                    "Move planets along their orbits",
+                    help=(
+                        "Earth and Mars circle Sun during the flight, planets are shown where "
+                        "they are at its end. Mars has to be aimed ahead of its start position."
+                    ),
+                )
 
-            with st.expander("Calculated parameters", expanded=True):
-                st.markdown(f"Initial velocity: {rocket_velocity.norm / 1000:.02f} km/s")
+                def relative_position(v: Vector2D) -> Vector2D:
+                    return v - earth_position + Vector2D(EARTH_ORBIT_RADIUS, 0)
+
+                relative_rocket_velocity = Vector2D.from_polar(
+                    relative_rocket_velocity_norm, angle=rocket_angle
+                )
+                earth_velocity = Vector2D.from_polar(
+                    EARTH_ORBITAL_VELOCITY, earth_position.angle + math.pi / 2
+                )
+                rocket_velocity = relative_rocket_velocity + earth_velocity
+
+                with st.expander("Calculated parameters", expanded=True):
+                    st.markdown(f"Initial velocity: {rocket_velocity.norm / 1000:.02f} km/s")
         else:
             initial_mass: float = 1000 * st.slider(
                 "Initial mass, ton",
@@ -155,6 +219,11 @@ def page() -> None:
                 step=0.02,
             )
 
+            stop_on_death: bool = st.checkbox(
+                "Stop the flight when the astronaut dies",
+                help="The flight is simulated only until the overload gets fatal.",
+            )
+
             with st.expander("Calculated parameters", expanded=True):
                 st.markdown(f"Fuel mass: {fuel_mass / 1000} ton")
 
@@ -180,10 +249,9 @@ def page() -> None:
     match flight_stage:
         case FlightStage.EARTH:
             sampling_delta = 1
-            st.session_state.sampling_delta = sampling_delta
 
             planet = earth_shape(x=0, y=0)
-            rocket_shape_at = partial(rocket_shape, size=EARTH_RADIUS / 100)
+            rocket_size = EARTH_RADIUS / 100
             initial_rocket = Rocket(
                 x=0,
                 y=EARTH_RADIUS,
@@ -195,23 +263,29 @@ def page() -> None:
                 acceleration_x=0,
                 acceleration_y=acceleration,
             )
-            calculator = RocketFlightCalculator(
-                rocket=initial_rocket,
-                flight_equation=flight_equations[flight_equation_type],
-                planet_mass=EARTH_MASS,
-            )
-            rockets: list[Rocket] = list(simulate_flight(calculator, sampling_delta))
+            monitor = AstronautMonitor(sampling_delta, stop_on_death=stop_on_death)
+            if flight_equation_type == FlightEquationType.FIXED_ACCELERATION:
+                rockets: RocketLog = simulate_ascent(
+                    initial_rocket, EARTH_MASS, sampling_delta, monitor
+                )
+            else:
+                calculator = RocketFlightCalculator(
+                    rocket=initial_rocket,
+                    flight_equation=flight_equations[flight_equation_type],
+                    planet_mass=EARTH_MASS,
+                )
+                rockets = simulate_flight(calculator, sampling_delta, monitor)
 
             if not rockets:
                 st.rerun()
 
-            figure = render_animation(rockets, rocket_shape_at, [planet])
+            figure = render_animation(rockets, rocket_size, [planet])
             st.plotly_chart(figure, key="animation")
 
             results = st.empty()
             telemetry_charts(rockets, EARTH_MASS, EARTH_RADIUS)
 
-            if is_astronaut_dead(rockets):
+            if monitor.is_dead_from_overload:
                 status, warning = results.columns(2)
                 warning.warning(
                     "The astronaut is dead. "
@@ -221,14 +295,18 @@ def page() -> None:
                 status = results.empty()
 
             with status.container():
-                if rockets and did_leave_the_planet(rockets[-1], EARTH_MASS):
+                if monitor.should_stop:
+                    st.error("The flight was stopped after the astronaut died.")
+                elif rockets and did_leave_the_planet(rockets[-1], EARTH_MASS):
                     st.success("You have successfully escaped Earth's gravitation!")
                 else:
                     st.error("You have not reached the speed to overcome gravitation.")
 
+        case FlightStage.SPACE if space_view == SpaceView.PORKCHOP:
+            render_porkchop(grid_size, enable_planet_gravity=enable_planet_gravity)
+
         case FlightStage.SPACE:
             sampling_delta = 60 * 60 * 4  # 4 hours
-            st.session_state.sampling_delta = sampling_delta
 
             sun_radius = SUN_RADIUS if show_real_size else EARTH_ORBIT_RADIUS / 20
             earth_radius = EARTH_RADIUS if show_real_size else EARTH_ORBIT_RADIUS / 50
@@ -240,9 +318,18 @@ def page() -> None:
             sun_position = relative_position(Vector2D(-EARTH_ORBIT_RADIUS, 0))
             sun = Planet(x=sun_position.x, y=sun_position.y, mass=SUN_MASS, radius=SUN_RADIUS)
 
-            sun_shape_at = sun_shape(x=sun.x, y=sun.y, radius=sun_radius)
-            earth_shape_at = earth_shape(x=earth.x, y=earth.y, radius=earth_radius)
-            mars_shape_at = mars_shape(x=mars.x, y=mars.y, radius=mars_radius)
+            ephemeris = None
+            if enable_moving_planets:
+                ephemeris = Ephemeris.from_orbits(
+                    [earth, mars, sun],
+                    [
+                        (earth_velocity.x, earth_velocity.y),
+                        (0, math.sqrt(G * SUN_MASS / MARS_ORBIT_RADIUS)),
+                        (0, 0),
+                    ],
+                    central_body=sun,
+                    duration=HUMAN_EXPIRATION_TIME,
+                )
 
             earth_orbit = orbit_shape(
                 center=sun_position,
@@ -255,43 +342,71 @@ def page() -> None:
                 semi_minor=MARS_ORBIT_RADIUS,
             )
 
-            approximate_take_off_height = 2_336_000  # From Earth surface to orbit stage
+            rocket_size = earth_radius / 3
+            planets = [earth, mars, sun] if enable_planet_gravity else [sun]
+
+            earth_velocity_xy = (earth_velocity.x, earth_velocity.y)
+
+            if enable_targeting:
+                targeting = target_mars(
+                    earth_velocity_xy,
+                    planets,
+                    mars,
+                    relative_rocket_velocity_norm,
+                    rocket_angle,
+                    bounds=(
+                        (1000 * min_relative_velocity, 1000 * MAX_RELATIVE_VELOCITY),
+                        (-math.pi / 2, math.pi / 2),
+                    ),
+                    propagation=propagation,
+                    ephemeris=ephemeris,
+                )
+                relative_rocket_velocity_norm, rocket_angle = (
+                    targeting.relative_velocity,
+                    targeting.angle,
+                )
+                st.info(
+                    f"Targeting {'converged' if targeting.reached_planet else 'did not converge'} "
+                    f"in {targeting.propagation_count} propagations: relative initial velocity "
+                    f"{relative_rocket_velocity_norm / 1000:.04f} km/s, "
+                    f"relative start angle {math.degrees(rocket_angle):.04f} deg."
+                )
 
-            rocket_start_point = Vector2D.from_polar(
-                EARTH_RADIUS + approximate_take_off_height, angle=rocket_velocity.angle
+            flight = propagate_interplanetary_flight(
+                launch_rocket(earth_velocity_xy, relative_rocket_velocity_norm, rocket_angle),
+                planets,
+                target_planet=mars,
+                propagation=propagation,
+                ephemeris=ephemeris,
             )
-            rocket_shape_at = partial(rocket_shape, size=earth_radius / 3)
-
-            initial_rocket = Rocket(
-                x=rocket_start_point.x,
-                y=rocket_start_point.y,
-                velocity_x=rocket_velocity.x,
-                velocity_y=rocket_velocity.y,
-                netto_mass=0,
-                fuel_mass=0,
-                stream_velocity=0,
-                acceleration_x=0,
-                acceleration_y=0,
+            rockets = flight.sample(sampling_delta)
+
+            earth_x, earth_y, *_ = flight.planet_solution(earth)(flight.flight_time)
+            mars_path = flight.planet_solution(mars)(flight.sample_time(sampling_delta))[:2].T
+            mars_x, mars_y = mars_path[-1]
+            scene_extent = abs(sun.x) + MARS_ORBIT_RADIUS
+            sun_shape_at = sun_shape(
+                x=sun.x,
+                y=sun.y,
+                radius=sun_radius,
+                pixel_size=on_screen_size(sun_radius, scene_extent),
             )
-
-            rockets = list(
-                simulate_interplanetary_flight(
-                    RocketInterplanetaryFlightCalculator(
-                        initial_rocket,
-                        interplanetary_engine_off_equation,
-                        [earth, mars, sun] if enable_planet_gravity else [sun],
-                    ),
-                    sampling_delta=sampling_delta,
-                    target_planet=mars,
-                )
+            earth_shape_at = earth_shape(
+                x=earth_x,
+                y=earth_y,
+                radius=earth_radius,
+                pixel_size=on_screen_size(earth_radius, scene_extent),
+            )
+            mars_shape_at = mars_shape(
+                x=mars_x,
+                y=mars_y,
+                radius=mars_radius,
+                pixel_size=on_screen_size(mars_radius, scene_extent),
             )
-
-            if not rockets:
-                st.rerun()
 
             figure = render_animation(
                 rockets,
-                rocket_shape_at,
+                rocket_size,
                 [earth_shape_at, mars_shape_at, sun_shape_at],
                 [earth_orbit, mars_orbit],
             )
@@ -299,9 +414,9 @@ def page() -> None:
 
             status = st.empty()
             with status.container():
-                if check_planet_reach(rockets[-2], rockets[-1], mars):
+                if flight.reached_planet:
                     st.success("Successfully reached Mars!")
-                elif len(rockets) * sampling_delta > HUMAN_EXPIRATION_TIME:
+                elif flight.flight_time >= HUMAN_EXPIRATION_TIME:
                     st.error(
                         f"The astronaut is dead from hunger. "
                         f"Try not to exceed {HUMAN_EXPIRATION_TIME / DAY} days."
@@ -316,17 +431,18 @@ def page() -> None:
             plot_velocity(col1, rockets[:-1], in_days=True)
 
             col1.write("**Distance to Target (km)**")
-            plot_distance_to_target_chart(col1, rockets, mars, in_days=True)
+            plot_distance_to_target_chart(
+                col1, rockets, mars, in_days=True, target_positions=mars_path
+            )
 
             col2.write("**Pure Acceleration (g)**")
             plot_acceleration(col2, rockets, in_days=True)
 
         case FlightStage.MARS:
             sampling_delta = 1
-            st.session_state.sampling_delta = sampling_delta
 
             planet = mars_shape(x=0, y=0)
-            rocket_shape_at = partial(rocket_shape, size=MARS_RADIUS / 100)
+            rocket_size = MARS_RADIUS / 100
             initial_rocket = Rocket(
                 x=0,
                 y=MARS_RADIUS,
@@ -343,21 +459,22 @@ def page() -> None:
                 rocket=initial_rocket,
                 flight_equation=flight_equations[flight_equation_type],
                 planet_mass=MARS_MASS,
+                max_mass=initial_mass,
             )
-            raw_rockets: list[Rocket] = list(simulate_flight(calculator, sampling_delta))
-            rockets: list[Rocket] = list(filter(lambda r: r.mass <= initial_mass, raw_rockets))
+            monitor = AstronautMonitor(sampling_delta, stop_on_death=stop_on_death)
+            rockets: RocketLog = simulate_flight(calculator, sampling_delta, monitor)
 
             if not rockets:
                 st.rerun()
 
-            figure = render_animation(rockets[::-1], rocket_shape_at, [planet])
+            figure = render_animation(rockets[::-1], rocket_size, [planet])
             st.plotly_chart(figure, key="animation")
 
             results = st.empty()
             if did_leave_the_planet(rockets[-1], MARS_MASS):
                 telemetry_charts(rockets[::-1], MARS_MASS, MARS_RADIUS)
 
-            if is_astronaut_dead(rockets):
+            if monitor.is_dead_from_overload:
                 status, warning = results.columns(2)
                 warning.warning(
                     f"The astronaut is dead. "
@@ -367,7 +484,9 @@ def page() -> None:
                 status = results.empty()
 
             with status.container():
-                if rockets and did_leave_the_planet(rockets[-1], MARS_MASS):
+                if monitor.should_stop:
+                    st.error("The flight was stopped after the astronaut died.")
+                elif rockets and did_leave_the_planet(rockets[-1], MARS_MASS):
                     st.success(
                         f"You have to turn on engine at "
                         f"{(rockets[-1].y - MARS_RADIUS) / 1000:.01f}km above to successfully land "
@@ -376,9 +495,18 @@ def page() -> None:
                         f"({rockets[-1].fuel_mass:.02f} ton) of a fuel tank to be full."
                     )
                 else:
+                    # Only a failed landing needs the flight beyond the mass budget
+                    required_rocket = simulate_flight(
+                        RocketFlightCalculator(
+                            rocket=initial_rocket,
+                            flight_equation=flight_equations[flight_equation_type],
+                            planet_mass=MARS_MASS,
+                        ),
+                        sampling_delta,
+                    )[-1]
                     st.error(
                         f"You probably have been smashed into pieces. You must have "
-                        f"{(raw_rockets[-1].fuel_mass / fuel_mass - 1) * 100:.02f}% "
+                        f"{(required_rocket.fuel_mass / fuel_mass - 1) * 100:.02f}% "
                         f"more fuel ({rockets[-1].fuel_mass:.02f} ton in total) "
                         f"while maintaining the same payload mass."
                     )
@@ -387,7 +515,120 @@ def page() -> None:
             st.warning("Choose one of the stages to simulate.")
 
 
-def telemetry_charts(rockets: Sequence[Rocket], planet_mass: float, planet_radius: float) -> None:
+def launch_rocket(
+    earth_velocity: tuple[float, float], relative_velocity_norm: float, angle: float
+) -> Rocket:
+    velocity = Vector2D.from_polar(relative_velocity_norm, angle) + Vector2D(*earth_velocity)
+    start_point = Vector2D.from_polar(
+        EARTH_RADIUS + APPROXIMATE_TAKE_OFF_HEIGHT, angle=velocity.angle
+    )
+    return Rocket(
+        x=start_point.x,
+        y=start_point.y,
+        velocity_x=velocity.x,
+        velocity_y=velocity.y,
+        netto_mass=0,
+        fuel_mass=0,
+        stream_velocity=0,
+        acceleration_x=0,
+        acceleration_y=0,
+    )
+
+
+@st.cache_data(max_entries=2**5, show_spinner="Targeting Mars...")
+def target_mars(
+    earth_velocity: tuple[float, float],
+    planets: list[Planet],
+    mars: Planet,
+    relative_velocity: float,
+    angle: float,
+    bounds: tuple[tuple[float, float], tuple[float, float]],
+    propagation: PropagationType,
+    ephemeris: Ephemeris | None,
+) -> TargetingResult:
+    """Keep the targeting results across reruns, they are keyed on all the flight inputs."""
+    return target_planet(
+        partial(launch_rocket, earth_velocity),
+        planets,
+        mars,
+        relative_velocity,
+        angle,
+        bounds,
+        propagation,
+        ephemeris,
+    )
+
+
+def render_porkchop(grid_size: int, *, enable_planet_gravity: bool) -> None:
+    """Plot Sun-only transfers over the Earth position-flight time grid, one can be simulated."""
+    angle_step = 360 / grid_size
+    # Cell centers of an even grid skip the degenerate 0 and 180 deg transfers
+    earth_position = np.arange(-180, 180, angle_step) + angle_step / 2
+    flight_time = np.linspace(MIN_TRANSFER_TIME, HUMAN_EXPIRATION_TIME, grid_size) / DAY
+    porkchop_df = compute_porkchop(
+        np.radians(earth_position),
+        flight_time * DAY,
+        EARTH_RADIUS + APPROXIMATE_TAKE_OFF_HEIGHT if enable_planet_gravity else None,
+    )
+
+    event = st.altair_chart(
+        create_porkchop_chart(porkchop_df, angle_step, flight_time[1] - flight_time[0]),
+        on_select="rerun",
+        key="porkchop",
+    )
+
+    min_velocity = 10.0 if enable_planet_gravity else 5.0
+    launchable = porkchop_df["relative_velocity"].between(
+        min_velocity, MAX_RELATIVE_VELOCITY
+    ) & porkchop_df["relative_angle"].between(-90.0, 90.0)
+
+    if selected := event.selection[TRANSFER_SELECTION]:
+        transfer = porkchop_df[
+            np.isclose(porkchop_df["earth_position"], selected[0]["earth_position"])
+            & np.isclose(porkchop_df["flight_time"], selected[0]["flight_time"])
+        ].iloc[0]
+    elif launchable.any():
+        transfer = porkchop_df[launchable].loc[porkchop_df[launchable]["delta_v"].idxmin()]
+        st.info("The cheapest transfer the sliders can launch is shown, pick another on the plot.")
+    else:
+        st.warning("None of the transfers can be launched with the sliders ranges.")
+        return
+
+    st.markdown(
+        f"""
+        | Measure | Value |
+        | --- | --- |
+        | Earth position | {transfer.earth_position:.1f}° |
+        | Flight time | {transfer.flight_time:.1f} days |
+        | Departure Δv | {transfer.departure_delta_v:.2f} km/s |
+        | Arrival Δv | {transfer.arrival_delta_v:.2f} km/s |
+        | Relative initial velocity | {transfer.relative_velocity:.2f} km/s |
+        | Relative start angle | {transfer.relative_angle:.2f}° |
+        """
+    )
+
+    if launchable[transfer.name]:
+        st.button(
+            "Simulate this transfer",
+            on_click=simulate_transfer,
+            args=(
+                Launch(
+                    earth_position=round(float(transfer.earth_position), 1),
+                    relative_velocity=round(float(transfer.relative_velocity), 2),
+                    relative_angle=round(float(transfer.relative_angle), 2),
+                ),
+            ),
+        )
+    else:
+        st.warning("This transfer is out of the sliders ranges, it cannot be simulated.")
+
+
+def simulate_transfer(launch: Launch) -> None:
+    st.session_state.launch = launch
+    st.session_state.space_view = SpaceView.FLIGHT
+
+
+def telemetry_charts(rockets: RocketLog, planet_mass: float, planet_radius: float) -> None:
     st.subheader("Rocket Metrics Over Time")
     col1, col2 = st.columns(2)
     with col1:
@@ -1,22 +1,62 @@
-from collections.abc import Callable
+import math
+
+import numpy as np
 
-from labs.flight_to_mars.model.rocket import Rocket
 from labs.model.constant import HUMAN_EXPIRATION_TIME, MAX_HUMANLY_VIABLE_OVERLOAD
 
 
-def is_astronaut_dead(rocket_logs: list[Rocket]) -> bool:
-    for i in range(len(rocket_logs)):
-        if rocket_logs[i].acceleration > MAX_HUMANLY_VIABLE_OVERLOAD:
-            return True
-    return False
+class AstronautMonitor:
+    def __init__(self, sampling_delta: float, *, stop_on_death: bool = False) -> None:
+        """
+        Track the astronaut survival sample by sample while the flight is simulated.
+
+        The maximal overload and the sample count are kept, so the flight time is never summed up.
+        With `stop_on_death` simulations end on the first sample the astronaut does not survive.
+        """
+        self.sampling_delta = sampling_delta
+        self.stop_on_death = stop_on_death
+        self.max_acceleration = 0.0
+        self.sample_count = 0
+
+    def record(self, acceleration_x: float, acceleration_y: float) -> None:
+        self.sample_count += 1
+        self.max_acceleration = max(
+            self.max_acceleration, math.hypot(acceleration_x, acceleration_y)
+        )
+
+    def record_all(self, acceleration_x: np.ndarray, acceleration_y: np.ndarray) -> int:
+        """
+        Record the samples at once, the count of recorded ones is returned.
+
+        With `stop_on_death` the samples after the first fatal one are not recorded.
+        """
+        overload = np.hypot(acceleration_x, acceleration_y)
+        if self.stop_on_death:
+            time = (self.sample_count + np.arange(1, overload.size + 1)) * self.sampling_delta
+            fatal = (overload > MAX_HUMANLY_VIABLE_OVERLOAD) | (time > HUMAN_EXPIRATION_TIME)
+            if fatal.any():
+                overload = overload[: np.argmax(fatal) + 1]
+
+        self.sample_count += overload.size
+        self.max_acceleration = max(self.max_acceleration, float(overload.max(initial=0)))
+        return overload.size
+
+    @property
+    def flight_time(self) -> float:
+        return self.sample_count * self.sampling_delta
 
+    @property
+    def is_dead_from_overload(self) -> bool:
+        return self.max_acceleration > MAX_HUMANLY_VIABLE_OVERLOAD
 
-def get_is_astronaut_dead_from_hunger_checker(sampling_delta: float) -> Callable[[], bool]:
-    time = 0
+    @property
+    def is_dead_from_hunger(self) -> bool:
+        return self.flight_time > HUMAN_EXPIRATION_TIME
 
-    def is_astronaut_dead_from_hunger() -> bool:
-        nonlocal time, sampling_delta
-        time += sampling_delta
-        return time > HUMAN_EXPIRATION_TIME
+    @property
+    def is_dead(self) -> bool:
+        return self.is_dead_from_overload or self.is_dead_from_hunger
 
-    return is_astronaut_dead_from_hunger
+    @property
+    def should_stop(self) -> bool:
+        return self.stop_on_death and self.is_dead
@@ -0,0 +1,162 @@
+import math
+
+import numpy as np
+from scipy.integrate import ode
+from scipy.optimize import brentq
+
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.stage.criteria import AstronautMonitor
+from labs.flight_to_mars.stage.planet.criteria import (
+    get_does_the_velocity_gap_increase_checker,
+    get_planet_escape_velocity,
+    is_escape_velocity,
+)
+from labs.flight_to_mars.stage.planet.equation import fixed_acceleration_flight_equation
+from labs.model.constant import G
+
+
+def simulate_ascent(
+    rocket: Rocket,
+    planet_mass: float,
+    sampling_delta: float,
+    monitor: AstronautMonitor | None = None,
+) -> RocketLog:
+    """
+    Simulate the fixed acceleration flight like `simulate_flight`, but evaluate it on a time grid.
+
+    While fuel lasts the velocity grows linearly and the height quadratically, so only the mass
+    depends on the gravity along the way: ln(m) = ln(m0) - (a * t + integral of g dt) / u. The
+    gravity integral is summed up by the Simpson rule at the sample midpoints. The burnout is
+    found between samples and the few samples after it are integrated numerically until the
+    flight is over.
+    """
+    acceleration = rocket.acceleration_y
+    if acceleration is None or acceleration <= 0 or rocket.velocity_y < 0:
+        raise ValueError("The ascent needs an upward velocity and acceleration")
+    monitor = monitor or AstronautMonitor(sampling_delta)
+
+    # Both are upper bounds: gravity burns fuel faster and escape velocity decreases with height
+    burnout_bound = (
+        rocket.stream_velocity * math.log(rocket.mass / rocket.netto_mass) / acceleration
+        if rocket.stream_velocity > 0
+        else math.inf
+    )
+    escape_bound = (
+        max(get_planet_escape_velocity(rocket.y, planet_mass) - rocket.velocity_y, 0) / acceleration
+    )
+    sample_count = math.ceil(min(burnout_bound, escape_bound) / sampling_delta) + 2
+
+    half_time = sampling_delta / 2 * np.arange(2 * sample_count + 1)
+    gravity = _gravity(rocket, planet_mass, acceleration, half_time)
+    gravity_impulse = np.cumsum(
+        sampling_delta / 6 * (gravity[:-1:2] + 4 * gravity[1::2] + gravity[2::2])
+    )
+    time = half_time[2::2]
+    y, velocity_y = _powered_state(rocket, acceleration, time)
+    mass = rocket.mass * np.exp(-(acceleration * time + gravity_impulse) / rocket.stream_velocity)
+
+    burnout = np.flatnonzero(mass <= rocket.netto_mass)
+    powered_count = int(burnout[0]) if burnout.size else sample_count
+    velocity = np.hypot(rocket.velocity_x, velocity_y[:powered_count])
+    escape_velocity = get_planet_escape_velocity(y[:powered_count], planet_mass)
+    gap = escape_velocity - velocity
+    is_over = velocity >= escape_velocity
+    is_over[1:] |= gap[1:] > gap[:-1]
+
+    if is_over.any():
+        sample_count = int(np.argmax(is_over)) + 1
+    else:
+        burnout_time = _burnout_time(
+            rocket,
+            planet_mass,
+            acceleration,
+            time[powered_count - 1] if powered_count else 0.0,
+            gravity_impulse[powered_count - 1] if powered_count else 0.0,
+            time[powered_count],
+        )
+        gap_checker = get_does_the_velocity_gap_increase_checker()
+        if powered_count:
+            gap_checker(velocity[-1], y[powered_count - 1], planet_mass)
+        after_burnout = ode(
+            f=lambda _, v: fixed_acceleration_flight_equation(rocket, planet_mass, *v)
+        ).set_integrator("dopri5")
+        after_burnout.set_initial_value(
+            [*_powered_state(rocket, acceleration, burnout_time), rocket.netto_mass],
+            burnout_time,
+        )
+
+        states = []
+        while True:
+            states.append(
+                after_burnout.integrate((powered_count + len(states) + 1) * sampling_delta)
+            )
+            velocity = math.hypot(rocket.velocity_x, states[-1][1])
+            if is_escape_velocity(velocity, states[-1][0], planet_mass) or gap_checker(
+                velocity, states[-1][0], planet_mass
+            ):
+                break
+
+        sample_count = powered_count + len(states)
+        time = sampling_delta * np.arange(1, sample_count + 1)
+        y, velocity_y, mass = (
+            np.concatenate((column[:powered_count], after))
+            for column, after in zip((y, velocity_y, mass), np.array(states).T, strict=True)
+        )
+
+    # The first sample only starts the velocity gap check, as in `simulate_flight`
+    logged = slice(1, sample_count)
+    recorded_count = monitor.record_all(
+        np.full(sample_count - 1, rocket.acceleration_x), np.full(sample_count - 1, acceleration)
+    )
+    return RocketLog.from_arrays(
+        rocket,
+        time[logged],
+        rocket.x,
+        y[logged],
+        rocket.velocity_x,
+        velocity_y[logged],
+        rocket.acceleration_x,
+        acceleration,
+        mass[logged],
+    )[:recorded_count]
+
+
+def _powered_state(
+    rocket: Rocket, acceleration: float, time: float | np.ndarray
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """(y, velocity_y) of the rocket accelerating for `time`."""
+    return (
+        rocket.y + rocket.velocity_y * time + acceleration * time**2 / 2,
+        rocket.velocity_y + acceleration * time,
+    )
+
+
+def _gravity(
+    rocket: Rocket, planet_mass: float, acceleration: float, time: float | np.ndarray
+) -> float | np.ndarray:
+    y, _ = _powered_state(rocket, acceleration, time)
+    return G * planet_mass / y**2
+
+
+def _burnout_time(
+    rocket: Rocket,
+    planet_mass: float,
+    acceleration: float,
+    start_time: float,
+    start_gravity_impulse: float,
+    end_time: float,
+) -> float:
+    """Find when the last fuel is burnt between the samples, the fuel lasts at `start_time`."""
+    fuel_impulse = rocket.stream_velocity * math.log(rocket.mass / rocket.netto_mass)
+
+    def remaining_impulse(time: float) -> float:
+        gravity = _gravity(
+            rocket, planet_mass, acceleration, np.array([start_time, (start_time + time) / 2, time])
+        )
+        gravity_impulse = start_gravity_impulse + (time - start_time) / 6 * (
+            gravity[0] + 4 * gravity[1] + gravity[2]
+        )
+        return fuel_impulse - acceleration * time - gravity_impulse
+
+    return brentq(remaining_impulse, start_time, end_time)
@@ -1,6 +1,8 @@
 from collections.abc import Callable
 
+import numpy as np
 from scipy.integrate import ode
+from scipy.optimize import brentq
 
 from labs.flight_to_mars.model.rocket import Rocket
 
@@ -11,18 +13,29 @@ class RocketFlightCalculator:
         rocket: Rocket,
         planet_mass: float,
         flight_equation: Callable[[Rocket, float, float, float, float], list[float]],
+        max_mass: float | None = None,
     ) -> None:
+        """
+        Integrate the vertical (y, velocity_y, mass) state by the given flight equation.
+
+        With `max_mass` the integration stops as soon as the mass exceeds it, the flight ends on
+        the state with exactly that mass and `reached_max_mass` is set.
+        """
         y0 = [rocket.y, rocket.velocity_y, rocket.mass]
         self.rocket = rocket
         self.planet_mass = planet_mass
-        self.equation_y = (
-            ode(f=lambda _, v: flight_equation(rocket, planet_mass, *v))
-            .set_integrator("dopri5")
-            .set_initial_value(y0, 0)
-        )
+        self.max_mass = max_mass
+        self.reached_max_mass = False
+        self._max_mass_time = 0.0
+        self._last_step = (0.0, np.array(y0, dtype=float))
+        self._function = lambda _, v: flight_equation(rocket, planet_mass, *v)
+        self.equation_y = ode(f=self._function).set_integrator("dopri5")
+        if max_mass is not None:
+            self.equation_y.set_solout(self._stop_on_max_mass)
+        self.equation_y.set_initial_value(y0, 0)
 
     def __call__(self, time_delta: float) -> Rocket:
-        y, velocity_y, mass = self.equation_y.integrate(self.equation_y.t + time_delta)
+        y, velocity_y, mass = self.advance(time_delta)
         return Rocket(
             x=self.rocket.x,
             y=y,
@@ -35,3 +48,46 @@ class RocketFlightCalculator:
             acceleration_x=self.rocket.acceleration_x,
             acceleration_y=self.rocket.acceleration_y,
         )
+
+    @property
+    def time(self) -> float:
+        if self.reached_max_mass:
+            return self._max_mass_time
+        return self.equation_y.t
+
+    def advance(self, time_delta: float) -> np.ndarray:
+        """Integrate `time_delta` further, the (y, velocity_y, mass) state is returned."""
+        state = self.equation_y.integrate(self.equation_y.t + time_delta)
+        if self.reached_max_mass:
+            return self._max_mass_state()
+        return state
+
+    def _stop_on_max_mass(self, time: float, state: np.ndarray) -> int:
+        """Remember the last integrator step within the mass budget, stop on the first beyond."""
+        if state[2] <= self.max_mass:
+            self._last_step = (time, state.copy())
+            return 0
+        self.reached_max_mass = True
+        return -1
+
+    def _max_mass_state(self) -> np.ndarray:
+        """Find the state with the max mass between the last two integrator steps."""
+        start_time, start_state = self._last_step
+        self._max_mass_time = start_time
+        if start_state[2] > self.max_mass:  # over the budget from the start
+            return start_state
+
+        def state_at(time: float) -> np.ndarray:
+            if time == start_time:
+                return start_state
+            return (
+                ode(f=self._function)
+                .set_integrator("dopri5")
+                .set_initial_value(start_state, start_time)
+                .integrate(time)
+            )
+
+        self._max_mass_time = brentq(
+            lambda time: state_at(time)[2] - self.max_mass, start_time, self.equation_y.t
+        )
+        return state_at(self._max_mass_time)
@@ -5,19 +5,23 @@ from labs.model.constant import G
 
 
 def did_leave_the_planet(rocket: Rocket, planet_mass: float) -> bool:
-    return rocket.velocity >= get_planet_escape_velocity(rocket.y, planet_mass)
+    return is_escape_velocity(rocket.velocity, rocket.y, planet_mass)
+
+
+def is_escape_velocity(velocity: float, height: float, planet_mass: float) -> bool:
+    return velocity >= get_planet_escape_velocity(height, planet_mass)
 
 
 def get_planet_escape_velocity(height: float, planet_mass: float) -> float:
     return (2 * G * planet_mass / height) ** 0.5
 
 
-def get_does_the_velocity_gap_increase_checker() -> Callable[[Rocket, float], bool]:
+def get_does_the_velocity_gap_increase_checker() -> Callable[[float, float, float], bool]:
     previous_gap = None
 
-    def does_the_velocity_gap_increase(rocket: Rocket, planet_mass: float) -> bool:
+    def does_the_velocity_gap_increase(velocity: float, height: float, planet_mass: float) -> bool:
         nonlocal previous_gap
-        new_gap = get_planet_escape_velocity(rocket.y, planet_mass) - rocket.velocity
+        new_gap = get_planet_escape_velocity(height, planet_mass) - velocity
 
         if previous_gap is None:
             previous_gap = new_gap
@@ -1,20 +1,48 @@
-from collections.abc import Generator
+import math
 
-from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.stage.criteria import AstronautMonitor
 from labs.flight_to_mars.stage.planet.calculator import RocketFlightCalculator
 from labs.flight_to_mars.stage.planet.criteria import (
-    did_leave_the_planet,
     get_does_the_velocity_gap_increase_checker,
+    is_escape_velocity,
 )
 
 
-def simulate_flight(calculator: RocketFlightCalculator, sampling_delta: float) -> Generator[Rocket]:
+def simulate_flight(
+    calculator: RocketFlightCalculator,
+    sampling_delta: float,
+    monitor: AstronautMonitor | None = None,
+) -> RocketLog:
+    """Simulate the flight until it escapes the planet or the velocity gap starts to increase."""
+    rocket = calculator.rocket
+    acceleration_x, acceleration_y = rocket.acceleration_x or 0.0, rocket.acceleration_y or 0.0
+    monitor = monitor or AstronautMonitor(sampling_delta)
+    rocket_log = RocketLog.for_rocket(rocket)
     velocity_gap_checker = get_does_the_velocity_gap_increase_checker()
-    rocket = calculator(sampling_delta)
 
-    while not (
-        did_leave_the_planet(rocket, calculator.planet_mass)
-        or velocity_gap_checker(rocket, calculator.planet_mass)
-    ):
-        rocket = calculator(sampling_delta)
-        yield rocket
+    def is_over(y: float, velocity_y: float) -> bool:
+        velocity = math.hypot(rocket.velocity_x, velocity_y)
+        return (
+            calculator.reached_max_mass
+            or is_escape_velocity(velocity, y, calculator.planet_mass)
+            or velocity_gap_checker(velocity, y, calculator.planet_mass)
+        )
+
+    y, velocity_y, mass = calculator.advance(sampling_delta)
+    while not is_over(y, velocity_y):
+        y, velocity_y, mass = calculator.advance(sampling_delta)
+        rocket_log.append(
+            calculator.time,
+            rocket.x,
+            y,
+            rocket.velocity_x,
+            velocity_y,
+            acceleration_x,
+            acceleration_y,
+            mass,
+        )
+        monitor.record(acceleration_x, acceleration_y)
+        if monitor.should_stop:
+            break
+    return rocket_log
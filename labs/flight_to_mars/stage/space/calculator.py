@@ -1,25 +1,57 @@
+import math
 from collections.abc import Callable
 
+import numpy as np
 from scipy.integrate import ode
 
+from labs.flight_to_mars.model.flight import IntegratorType
 from labs.flight_to_mars.model.planet import Planet
 from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.flight_to_mars.stage.space.symplectic import (
+    LEAPFROG_WEIGHTS,
+    YOSHIDA_WEIGHTS,
+    propagate_symplectic,
+)
+
+SYMPLECTIC_MAX_STEP = 60 * 60  # 1 hour
+
+symplectic_weights = {
+    IntegratorType.LEAPFROG: LEAPFROG_WEIGHTS,
+    IntegratorType.YOSHIDA: YOSHIDA_WEIGHTS,
+}
 
 
 class RocketInterplanetaryFlightCalculator:
     def __init__(
         self,
         rocket: Rocket,
-        flight_equation: Callable[[float, float, float, float, list[Planet]], list[float]],
+        flight_equation: Callable[[np.ndarray, GravityKernel], np.ndarray],
         planets: list[Planet],
+        integrator: IntegratorType = IntegratorType.DOPRI5,
+        max_step: float = SYMPLECTIC_MAX_STEP,
     ) -> None:
+        """
+        Prepare the flight integration, `max_step` is only used by symplectic integrators.
+
+        Symplectic ones split each call into equal steps and integrate the gravity directly,
+        `flight_equation` is ignored by them.
+        """
         x0 = (rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y)
+        gravity = GravityKernel.from_planets(planets)
         self.rocket = rocket
-        self.equation = (
-            ode(f=lambda _, v: flight_equation(v[0], v[1], v[2], v[3], planets))
-            .set_integrator("dopri5")
-            .set_initial_value(x0, 0)
-        )
+        self.integrator = integrator
+        self.max_step = max_step
+        self.gravity = gravity
+        self.state = np.array(x0, dtype=float)
+        self.time = 0.0
+        self.equation: ode | None = None
+        if integrator == IntegratorType.DOPRI5:
+            self.equation = (
+                ode(f=lambda _, v: flight_equation(v, gravity))
+                .set_integrator("dopri5")
+                .set_initial_value(x0, 0)
+            )
         self.previous_velocity_x = rocket.velocity_x
         self.previous_velocity_y = rocket.velocity_y
 
@@ -27,11 +59,7 @@ class RocketInterplanetaryFlightCalculator:
         if time_delta == 0:
             return self.rocket
 
-        x, y, velocity_x, velocity_y = self.equation.integrate(self.equation.t + time_delta)
-        acceleration_x = (velocity_x - self.previous_velocity_x) / time_delta
-        acceleration_y = (velocity_y - self.previous_velocity_y) / time_delta
-        self.previous_velocity_x = velocity_x
-        self.previous_velocity_y = velocity_y
+        x, y, velocity_x, velocity_y, acceleration_x, acceleration_y = self.advance(time_delta)
         return Rocket(
             x=x,
             y=y,
@@ -43,3 +71,29 @@ class RocketInterplanetaryFlightCalculator:
             netto_mass=self.rocket.netto_mass,
             fuel_mass=self.rocket.fuel_mass,
         )
+
+    def advance(self, time_delta: float) -> tuple[float, ...]:
+        """
+        Integrate `time_delta` further.
+
+        The (x, y, velocity_x, velocity_y) state is returned with the mean acceleration over
+        `time_delta`.
+        """
+        if self.equation is not None:
+            self.state = self.equation.integrate(self.equation.t + time_delta)
+        else:
+            self.state = propagate_symplectic(
+                self.state,
+                time_delta,
+                math.ceil(time_delta / self.max_step),
+                self.gravity,
+                symplectic_weights[self.integrator],
+            )
+        self.time += time_delta
+
+        x, y, velocity_x, velocity_y = self.state.tolist()
+        acceleration_x = (velocity_x - self.previous_velocity_x) / time_delta
+        acceleration_y = (velocity_y - self.previous_velocity_y) / time_delta
+        self.previous_velocity_x = velocity_x
+        self.previous_velocity_y = velocity_y
+        return x, y, velocity_x, velocity_y, acceleration_x, acceleration_y
@@ -12,17 +12,19 @@ def did_turn_back(rocket: Rocket) -> bool:
     return rocket.velocity_x < 0
 
 
-def get_planet_reach_checker(planet: Planet) -> Callable[[Rocket], bool]:
-    previous_rocket = None
-
-    def did_reach_planet(rocket: Rocket) -> bool:
-        nonlocal previous_rocket
-        # Line-circle intersection check if we have previous rocket
-        if previous_rocket is not None and check_planet_reach(previous_rocket, rocket, planet):
-            previous_rocket = rocket
+def get_planet_reach_checker(planet: Planet) -> Callable[[float, float], bool]:
+    previous_point = None
+
+    def did_reach_planet(x: float, y: float) -> bool:
+        nonlocal previous_point
+        # Line-circle intersection check if we have previous point
+        if previous_point is not None and _line_intersects_circle(
+            *previous_point, x, y, planet.x, planet.y, planet.orbit_radius
+        ):
+            previous_point = (x, y)
             return True
 
-        previous_rocket = rocket
+        previous_point = (x, y)
         return False
 
     return did_reach_planet
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.event import Solution
+from labs.flight_to_mars.stage.space.kepler import KeplerOrbit
+
+EPHEMERIS_STEP = 6 * 60 * 60  # 6 hours
+
+
+@dataclass(frozen=True)
+class Ephemeris:
+    """
+    Planet positions and velocities tabulated over the mission window.
+
+    Positions in between are interpolated by cubic Hermite splines, so a lookup costs the same
+    for any orbit. Times out of the window are clamped to it.
+    """
+
+    planets: tuple[Planet, ...]
+    step: float
+    position: np.ndarray  # (node, body, 2)
+    velocity: np.ndarray  # (node, body, 2)
+
+    @classmethod
+    def from_orbits(
+        cls,
+        planets: Sequence[Planet],
+        velocities: Sequence[tuple[float, float]],
+        central_body: Planet,
+        duration: float,
+        step: float = EPHEMERIS_STEP,
+    ) -> Ephemeris:
+        """
+        Tabulate planets moving on Kepler orbits around the central body, which stays still.
+
+        `velocities` are the initial planet velocities, the central body one is ignored.
+        A circular orbit velocity gives a circular orbit, any other gives an ellipse.
+        """
+        time = np.arange(0, duration + step, step)
+        states = np.stack(
+            [
+                np.repeat([[planet.x], [planet.y], [0], [0]], time.size, axis=1)
+                if planet is central_body
+                else KeplerOrbit.from_state(
+                    np.array((planet.x, planet.y, *velocity), dtype=float), central_body
+                )(time)
+                for planet, velocity in zip(planets, velocities, strict=True)
+            ]
+        ).transpose(2, 0, 1)  # (node, body, state)
+        return cls(
+            planets=tuple(planets), step=step, position=states[..., :2], velocity=states[..., 2:]
+        )
+
+    def select(self, planets: Sequence[Planet]) -> Ephemeris:
+        """Take the tables of the given planets, in their order."""
+        indices = [self._index(planet) for planet in planets]
+        return Ephemeris(
+            planets=tuple(planets),
+            step=self.step,
+            position=self.position[:, indices],
+            velocity=self.velocity[:, indices],
+        )
+
+    def is_moving(self, planet: Planet) -> bool:
+        return bool(np.any(self.velocity[:, self._index(planet)]))
+
+    def solution_of(self, planet: Planet) -> Solution:
+        """Make the (x, y, velocity_x, velocity_y) states of the planet a flight-like solution."""
+        ephemeris = self.select([planet])
+
+        def solution(time: ArrayLike) -> np.ndarray:
+            position, velocity = ephemeris.interpolate(time)
+            return np.moveaxis(
+                np.concatenate((position[..., 0, :], velocity[..., 0, :]), -1), -1, 0
+            )
+
+        return solution
+
+    def __call__(self, time: ArrayLike) -> np.ndarray:
+        """Interpolate positions of all planets at `time`, shaped (..., body, 2)."""
+        s, start, end, start_slope, end_slope = self._segment(time)
+        s2, s3 = s * s, s * s * s
+        return (
+            (2 * s3 - 3 * s2 + 1) * start
+            + (s3 - 2 * s2 + s) * start_slope
+            + (3 * s2 - 2 * s3) * end
+            + (s3 - s2) * end_slope
+        )
+
+    def interpolate(self, time: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Interpolate positions and velocities of all planets, both shaped (..., body, 2)."""
+        s, start, end, start_slope, end_slope = self._segment(time)
+        s2 = s * s
+        velocity = (
+            (6 * s2 - 6 * s) * (start - end)
+            + (3 * s2 - 4 * s + 1) * start_slope
+            + (3 * s2 - 2 * s) * end_slope
+        ) / self.step
+        return self(time), velocity
+
+    def _segment(self, time: ArrayLike) -> tuple[np.ndarray, ...]:
+        """Find the table interval of `time` and the position within it, from 0 to 1."""
+        scaled_time = np.clip(np.asarray(time, dtype=float) / self.step, 0, len(self.position) - 1)
+        index = np.minimum(scaled_time.astype(int), len(self.position) - 2)
+        return (
+            (scaled_time - index)[..., np.newaxis, np.newaxis],
+            self.position[index],
+            self.position[index + 1],
+            self.step * self.velocity[index],
+            self.step * self.velocity[index + 1],
+        )
+
+    def _index(self, planet: Planet) -> int:
+        return next(index for index, known in enumerate(self.planets) if known is planet)
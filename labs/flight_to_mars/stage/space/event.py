@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterator
+
+import numpy as np
+from scipy.optimize import brentq, minimize_scalar
+
+EVENT_SEARCH_STEP = 60 * 60  # 1 hour
+INITIAL_WINDOW_STEP_COUNT = 2**6
+
+type Solution = Callable[[np.ndarray], np.ndarray]  # (x, y, velocity_x, velocity_y) by time
+
+
+def find_first_crossing(
+    solution: Solution,
+    start: float,
+    end: float,
+    function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> float | None:
+    """
+    Find when `function` of (x, y) turns from positive to non-positive for the first time.
+
+    The crossing is searched on an `EVENT_SEARCH_STEP` grid of the dense solution and then refined
+    by root finding, so it is only fit for boundaries a flight takes longer to pass, like spheres
+    of influence. Planet orbits are entered by `find_first_orbit_entry`.
+    """
+    for time in _search_grids(start, end):
+        x, y, _, _ = solution(time)
+        values = function(x, y)
+        (crossings,) = np.nonzero((values[:-1] > 0) & (values[1:] <= 0))
+        if crossings.size:
+            return brentq(
+                lambda t: float(function(*solution(t)[:2])),
+                time[crossings[0]],
+                time[crossings[0] + 1],
+            )
+
+    return None
+
+
+def find_first_orbit_entry(
+    solution: Solution, start: float, end: float, orbit_radius: float
+) -> float | None:
+    """Find when the orbit is entered for the first time on an `EVENT_SEARCH_STEP` grid."""
+    for time in _search_grids(start, end):
+        entry_time = find_orbit_entry(solution, time, orbit_radius)
+        if entry_time is not None:
+            return entry_time
+
+    return None
+
+
+def find_orbit_entry(solution: Solution, time: np.ndarray, orbit_radius: float) -> float | None:
+    """
+    Find when the flight enters the planet orbit for the first time on the time grid.
+
+    The solution is relative to the planet, the distance to it is checked along the chords
+    between the grid points. So a pass that enters and leaves the orbit between two of them is
+    caught too. The entry is refined by root finding on the solution then.
+    """
+    x, y, _, _ = solution(time)
+    chord_x, chord_y = np.diff(x), np.diff(y)
+    chord_length = chord_x**2 + chord_y**2
+    closest_point = np.clip(
+        np.divide(
+            -(x[:-1] * chord_x + y[:-1] * chord_y),
+            chord_length,
+            out=np.zeros_like(chord_length),
+            where=chord_length > 0,
+        ),
+        0,
+        1,
+    )
+    distance = np.hypot(x, y)
+    chord_distance = np.hypot(x[:-1] + closest_point * chord_x, y[:-1] + closest_point * chord_y)
+    (chords,) = np.nonzero((distance[:-1] > orbit_radius) & (chord_distance <= orbit_radius))
+
+    def distance_to_orbit(t: float) -> float:
+        x, y, _, _ = solution(t)
+        return math.hypot(x, y) - orbit_radius
+
+    for chord in chords.tolist():
+        start, end = time[chord], time[chord + 1]
+        if distance[chord + 1] > orbit_radius:  # the pass is between the grid points
+            end = minimize_scalar(distance_to_orbit, bounds=(start, end), method="bounded").x
+            if distance_to_orbit(end) > 0:
+                continue
+        return brentq(distance_to_orbit, start, end)
+
+    return None
+
+
+def find_first_closest_approach(solution: Solution, start: float, end: float) -> float | None:
+    """Find when the flight gets closest to the planet for the first time on a search grid."""
+    for time in _search_grids(start, end):
+        approach_time = find_closest_approach(solution, time)
+        if approach_time is not None:
+            return approach_time
+
+    return None
+
+
+def find_closest_approach(solution: Solution, time: np.ndarray) -> float | None:
+    """
+    Find when the flight passes its closest approach to the planet for the first time on the grid.
+
+    The solution is relative to the planet, the approach is where the radial velocity turns from
+    negative to non-negative. It is refined by root finding on the solution then.
+    """
+
+    def radial_velocity(t: float | np.ndarray) -> float | np.ndarray:
+        x, y, velocity_x, velocity_y = solution(t)
+        return x * velocity_x + y * velocity_y
+
+    values = radial_velocity(time)
+    (approaches,) = np.nonzero((values[:-1] < 0) & (values[1:] >= 0))
+    if not approaches.size:
+        return None
+
+    return brentq(radial_velocity, time[approaches[0]], time[approaches[0] + 1])
+
+
+def _search_grids(start: float, end: float) -> Iterator[np.ndarray]:
+    """Split the span into grids of windows doubling in length, early events skip the rest."""
+    window = EVENT_SEARCH_STEP * INITIAL_WINDOW_STEP_COUNT
+    while start < end:
+        window_end = min(start + window, end)
+        yield np.append(np.arange(start, window_end, EVENT_SEARCH_STEP), window_end)
+        start, window = window_end, 2 * window
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.ephemeris import Ephemeris
+from labs.model.constant import G
+
+MIN_DISTANCE = 1.0
+
+
+@dataclass(frozen=True)
+class GravityKernel:
+    """
+    Summed gravity of several bodies, evaluated at once for any number of points.
+
+    Bodies stay at `position` unless the ephemeris moves them.
+    """
+
+    position: np.ndarray  # (body, 2)
+    gravitational_parameter: np.ndarray  # (body,), G * mass
+    ephemeris: Ephemeris | None = None
+
+    @classmethod
+    def from_planets(
+        cls, planets: Sequence[Planet], ephemeris: Ephemeris | None = None
+    ) -> GravityKernel:
+        return cls(
+            position=np.array([(planet.x, planet.y) for planet in planets], dtype=float).reshape(
+                -1, 2
+            ),
+            gravitational_parameter=G * np.array([planet.mass for planet in planets], dtype=float),
+            ephemeris=None if ephemeris is None else ephemeris.select(planets),
+        )
+
+    def __call__(self, point: np.ndarray, time: np.ndarray | float = 0.0) -> np.ndarray:
+        """
+        Calculate gravitational acceleration at `point`, shaped (..., 2).
+
+        `time` matters only with the ephemeris, it is broadcast against the `point` batch shape.
+        Distances are floored at `MIN_DISTANCE`, so a body does not attract its own center.
+        """
+        offset = self._position(time) - point[..., np.newaxis, :]
+        distance_squared = np.maximum(np.square(offset).sum(axis=-1), MIN_DISTANCE**2)
+        factor = self.gravitational_parameter / (distance_squared * np.sqrt(distance_squared))
+        return (factor[..., np.newaxis, :] @ offset)[..., 0, :]
+
+    def potential(self, point: np.ndarray, time: np.ndarray | float = 0.0) -> np.ndarray:
+        """Calculate gravitational potential energy per unit mass at `point`, shaped (...)."""
+        offset = self._position(time) - point[..., np.newaxis, :]
+        distance = np.maximum(np.hypot(offset[..., 0], offset[..., 1]), MIN_DISTANCE)
+        return -(self.gravitational_parameter / distance).sum(axis=-1)
+
+    def _position(self, time: np.ndarray | float) -> np.ndarray:
+        return self.position if self.ephemeris is None else self.ephemeris(time)
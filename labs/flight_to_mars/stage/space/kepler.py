@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.model.constant import G
+
+ITERATION_COUNT = 64
+TOLERANCE = 10 ** (-12)
+SERIES_THRESHOLD = 10 ** (-2)
+
+
+@dataclass(frozen=True)
+class KeplerOrbit:
+    """Two-body orbit around a fixed body, propagated in closed form with universal variables."""
+
+    center: np.ndarray
+    gravitational_parameter: float
+    position: np.ndarray  # relative to the center
+    velocity: np.ndarray
+
+    @classmethod
+    def from_rocket(cls, rocket: Rocket, planet: Planet) -> KeplerOrbit:
+        return cls.from_state(
+            np.array([rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y], dtype=float),
+            planet,
+        )
+
+    @classmethod
+    def from_state(cls, state: np.ndarray, planet: Planet) -> KeplerOrbit:
+        """Create the orbit of the (x, y, velocity_x, velocity_y) state around the `planet`."""
+        center = np.array([planet.x, planet.y], dtype=float)
+        return cls(
+            center=center,
+            gravitational_parameter=G * planet.mass,
+            position=state[:2] - center,
+            velocity=state[2:].copy(),
+        )
+
+    def __call__(self, time: ArrayLike) -> np.ndarray:
+        """Calculate (x, y, velocity_x, velocity_y) states at `time`, shaped (4, time) or (4,)."""
+        time = np.asarray(time, dtype=float)
+        if time.ndim == 0:
+            return self(time[np.newaxis])[:, 0]
+
+        mu, sqrt_mu = self.gravitational_parameter, np.sqrt(self.gravitational_parameter)
+        radius = float(np.hypot(*self.position))
+        radial_velocity = float(self.position @ self.velocity) / sqrt_mu
+        alpha = 2 / radius - float(self.velocity @ self.velocity) / mu  # inverse semi-major axis
+
+        chi = self._universal_anomaly(time, radius, radial_velocity, alpha)
+        z = alpha * chi**2
+        c, s = stumpff_c(z), stumpff_s(z)
+
+        f = 1 - chi**2 / radius * c
+        g = time - chi**3 * s / sqrt_mu
+        position = np.outer(self.position, f) + np.outer(self.velocity, g)
+        new_radius = np.hypot(*position)
+        f_dot = sqrt_mu / (new_radius * radius) * (alpha * chi**3 * s - chi)
+        g_dot = 1 - chi**2 / new_radius * c
+        velocity = np.outer(self.position, f_dot) + np.outer(self.velocity, g_dot)
+
+        return np.concatenate((position + self.center[:, np.newaxis], velocity))
+
+    def _universal_anomaly(
+        self, time: np.ndarray, radius: float, radial_velocity: float, alpha: float
+    ) -> np.ndarray:
+        """
+        Solve the universal Kepler equation by Newton steps guarded with bisection.
+
+        The anomaly grows no faster than sqrt(mu) / periapsis, this gives the initial bracket.
+        """
+        mu, sqrt_mu = self.gravitational_parameter, np.sqrt(self.gravitational_parameter)
+        (x, y), (velocity_x, velocity_y) = self.position, self.velocity
+        angular_momentum = abs(x * velocity_y - y * velocity_x)
+        eccentricity = np.sqrt(max(1 - alpha * angular_momentum**2 / mu, 0))
+        periapsis = angular_momentum**2 / (mu * (1 + eccentricity))
+        with np.errstate(over="ignore"):
+            bound = sqrt_mu * time / max(periapsis, np.finfo(float).tiny)
+        low, high = np.minimum(bound, 0), np.maximum(bound, 0)
+
+        chi = sqrt_mu * time / radius
+        if alpha < 0:
+            # Far from periapsis the elliptic guess overflows the hyperbolic functions
+            semi_major_axis = 1 / alpha
+            direction = np.sign(time)
+            denominator = radial_velocity * sqrt_mu + direction * np.sqrt(-mu * semi_major_axis) * (
+                1 - alpha * radius
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                hyperbolic_chi = (
+                    direction
+                    * np.sqrt(-semi_major_axis)
+                    * np.log(-2 * mu * alpha * time / denominator)
+                )
+            chi = np.where(np.isfinite(hyperbolic_chi), hyperbolic_chi, chi)
+        chi = np.clip(chi, low, high)
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            for _ in range(ITERATION_COUNT):
+                z = alpha * chi**2
+                c, s = stumpff_c(z), stumpff_s(z)
+                residual = (
+                    radial_velocity * chi**2 * c
+                    + (1 - alpha * radius) * chi**3 * s
+                    + radius * chi
+                    - sqrt_mu * time
+                )
+                derivative = (
+                    radial_velocity * chi * (1 - z * s) + (1 - alpha * radius) * chi**2 * c + radius
+                )
+                # The residual grows with the anomaly, an overflow means it has overshot
+                overshot = np.where(np.isfinite(residual), residual, chi)
+                low = np.where(overshot < 0, chi, low)
+                high = np.where(overshot > 0, chi, high)
+
+                step = residual / derivative
+                converged = np.abs(step) <= TOLERANCE * np.maximum(np.abs(chi), 1)
+                chi = chi - step
+                inside = (chi >= low) & (chi <= high)  # false for NaN as well
+                chi = np.where(converged | inside, chi, (low + high) / 2)
+                if converged.all():
+                    break
+
+        return chi
+
+
+def stumpff_c(z: np.ndarray) -> np.ndarray:
+    """Stumpff function C(z) = (1 - cos(sqrt(z))) / z, continued to negative z."""
+    small = np.abs(z) < SERIES_THRESHOLD
+    z_safe = np.where(small, 1, z)
+    root = np.sqrt(np.abs(z_safe))
+    return np.where(
+        small,
+        1 / 2 - z / 24 + z**2 / 720 - z**3 / 40320,
+        np.where(z_safe > 0, (1 - np.cos(root)) / z_safe, (np.cosh(root) - 1) / -z_safe),
+    )
+
+
+def stumpff_s(z: np.ndarray) -> np.ndarray:
+    """Stumpff function S(z) = (sqrt(z) - sin(sqrt(z))) / sqrt(z)^3, continued to negative z."""
+    small = np.abs(z) < SERIES_THRESHOLD
+    z_safe = np.where(small, 1, z)
+    root = np.sqrt(np.abs(z_safe))
+    return np.where(
+        small,
+        1 / 6 - z / 120 + z**2 / 5040 - z**3 / 362880,
+        np.where(z_safe > 0, (root - np.sin(root)) / root**3, (np.sinh(root) - root) / root**3),
+    )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from labs.flight_to_mars.stage.space.kepler import stumpff_c, stumpff_s
+
+BISECTION_COUNT = 2**6
+MIN_Z = -(2**8)  # hyperbolic arcs at hundreds of km/s
+MAX_Z = (2 * np.pi) ** 2  # a whole revolution
+
+
+@dataclass(frozen=True)
+class LambertTransfer:
+    """Velocities at both ends of the transfer arcs, shaped (..., 2)."""
+
+    departure_velocity: np.ndarray
+    arrival_velocity: np.ndarray
+
+
+def solve_lambert(
+    departure_position: ArrayLike,
+    arrival_position: ArrayLike,
+    flight_time: ArrayLike,
+    gravitational_parameter: float,
+) -> LambertTransfer:
+    """
+    Find the prograde (counterclockwise) single-revolution arcs between two positions.
+
+    Positions are relative to the attracting body and shaped (..., 2), all inputs are broadcast
+    against each other. The universal Kepler equation is solved by bisection over the whole
+    batch at once. Velocities are NaN where there is no such arc and for transfer angles of
+    exactly 0 or 180 deg, where the Lagrange coefficients degenerate.
+    """
+    departure_position = np.asarray(departure_position, dtype=float)
+    arrival_position = np.asarray(arrival_position, dtype=float)
+    flight_time = np.asarray(flight_time, dtype=float)[..., np.newaxis]
+
+    departure_radius = np.hypot(*np.moveaxis(departure_position, -1, 0))[..., np.newaxis]
+    arrival_radius = np.hypot(*np.moveaxis(arrival_position, -1, 0))[..., np.newaxis]
+    cross = (
+        departure_position[..., :1] * arrival_position[..., 1:]
+        - departure_position[..., 1:] * arrival_position[..., :1]
+    )
+    cos_angle = np.sum(departure_position * arrival_position, axis=-1, keepdims=True) / (
+        departure_radius * arrival_radius
+    )
+    # Prograde arcs sweep more than 180 deg when the arrival is clockwise from the departure
+    a = np.where(cross >= 0, 1, -1) * np.sqrt(
+        departure_radius * arrival_radius * np.maximum(1 + cos_angle, 0)
+    )
+    a, departure_radius, arrival_radius, flight_time = np.broadcast_arrays(
+        a, departure_radius, arrival_radius, flight_time
+    )
+
+    def y_of(z: np.ndarray) -> np.ndarray:
+        return (
+            departure_radius + arrival_radius + a * (z * stumpff_s(z) - 1) / np.sqrt(stumpff_c(z))
+        )
+
+    sqrt_mu = np.sqrt(gravitational_parameter)
+    low, high = np.full(a.shape, float(MIN_Z)), np.full(a.shape, MAX_Z)
+    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+        for _ in range(BISECTION_COUNT):
+            z = (low + high) / 2
+            y = y_of(z)
+            # Negative `y` is only reached below the solution, the arc is too fast there
+            too_fast = (y < 0) | (
+                (y / stumpff_c(z)) ** 1.5 * stumpff_s(z) + a * np.sqrt(y) < sqrt_mu * flight_time
+            )
+            low, high = np.where(too_fast, z, low), np.where(too_fast, high, z)
+
+        z = (low + high) / 2
+        y = y_of(z)
+        solved = (y > 0) & (low > MIN_Z) & (high < MAX_Z)
+        f = 1 - y / departure_radius
+        g = a * np.sqrt(y / gravitational_parameter)
+        g_dot = 1 - y / arrival_radius
+        departure_velocity = (arrival_position - f * departure_position) / g
+        arrival_velocity = (g_dot * arrival_position - departure_position) / g
+
+    return LambertTransfer(
+        departure_velocity=np.where(solved, departure_velocity, np.nan),
+        arrival_velocity=np.where(solved, arrival_velocity, np.nan),
+    )
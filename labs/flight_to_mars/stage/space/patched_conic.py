@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.event import find_first_crossing
+from labs.flight_to_mars.stage.space.kepler import KeplerOrbit
+
+MAX_LEG_COUNT = 2**6
+
+
+@dataclass(frozen=True)
+class ConicLeg:
+    start: float
+    end: float
+    body: Planet
+    orbit: KeplerOrbit
+
+
+@dataclass(frozen=True)
+class PatchedConicSolution:
+    """Flight made of Kepler orbits, each one around the body dominating its time span."""
+
+    legs: tuple[ConicLeg, ...]
+
+    def __call__(self, time: ArrayLike) -> np.ndarray:
+        """Calculate (x, y, velocity_x, velocity_y) states at `time`, shaped (4, time) or (4,)."""
+        time = np.asarray(time, dtype=float)
+        if time.ndim == 0:
+            return self(time[np.newaxis])[:, 0]
+
+        starts = np.array([leg.start for leg in self.legs])
+        leg_indices = np.clip(np.searchsorted(starts, time, side="right") - 1, 0, None)
+        states = np.empty((4, time.size))
+        for index in np.unique(leg_indices):
+            leg = self.legs[index]
+            mask = leg_indices == index
+            states[:, mask] = leg.orbit(time[mask] - leg.start)
+        return states
+
+
+def sphere_of_influence(planet: Planet, central_body: Planet) -> float:
+    """Radius of the region where the planet, not the central body, dominates the motion."""
+    distance = np.hypot(planet.x - central_body.x, planet.y - central_body.y)
+    return float(distance * (planet.mass / central_body.mass) ** (2 / 5))
+
+
+def propagate_patched_conics(
+    state: np.ndarray, planets: list[Planet], duration: float
+) -> PatchedConicSolution:
+    """
+    Propagate the state by switching the attracting body at spheres of influence.
+
+    The most massive body is the central one, every leg inside a sphere of influence is a conic
+    around its planet and every leg outside is a conic around the central body. Bodies do not
+    move, so no leg needs a numerical integration.
+    """
+    central_body = max(planets, key=lambda planet: planet.mass)
+    spheres = [
+        (planet, sphere_of_influence(planet, central_body))
+        for planet in planets
+        if planet is not central_body
+    ]
+
+    body, radius = next(
+        (
+            (planet, radius)
+            for planet, radius in spheres
+            if _distance(state[0], state[1], planet) < radius
+        ),
+        (central_body, None),
+    )
+
+    legs: list[ConicLeg] = []
+    start = 0.0
+    while start < duration and len(legs) < MAX_LEG_COUNT:
+        orbit = KeplerOrbit.from_state(state, body)
+        end, next_body, next_radius = duration, central_body, None
+
+        if radius is None:
+            entry_time = find_first_crossing(
+                orbit, 0, duration - start, partial(_outside_all, spheres=spheres)
+            )
+            if entry_time is not None:
+                end = start + entry_time
+                x, y, _, _ = orbit(entry_time)
+                next_body, next_radius = min(spheres, key=lambda sphere: _outside(x, y, *sphere))
+        else:
+            exit_time = find_first_crossing(
+                orbit, 0, duration - start, partial(_inside, planet=body, radius=radius)
+            )
+            if exit_time is None:
+                next_body, next_radius = body, radius
+            else:
+                end = start + exit_time
+
+        legs.append(ConicLeg(start=start, end=end, body=body, orbit=orbit))
+        state = orbit(end - start)
+        start, body, radius = end, next_body, next_radius
+
+    return PatchedConicSolution(legs=tuple(legs))
+
+
+def _distance[T: (float, np.ndarray)](x: T, y: T, planet: Planet) -> T:
+    return np.hypot(x - planet.x, y - planet.y)
+
+
+def _outside(x: np.ndarray, y: np.ndarray, planet: Planet, radius: float) -> np.ndarray:
+    return _distance(x, y, planet) - radius
+
+
+def _outside_all(x: np.ndarray, y: np.ndarray, spheres: list[tuple[Planet, float]]) -> np.ndarray:
+    return np.min([_outside(x, y, planet, radius) for planet, radius in spheres], axis=0)
+
+
+def _inside(x: np.ndarray, y: np.ndarray, planet: Planet, radius: float) -> np.ndarray:
+    return radius - _distance(x, y, planet)
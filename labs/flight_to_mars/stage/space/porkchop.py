@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from labs.flight_to_mars.stage.planet.criteria import get_planet_escape_velocity
+from labs.flight_to_mars.stage.space.lambert import solve_lambert
+from labs.model.constant import (
+    DAY,
+    EARTH_MASS,
+    EARTH_ORBIT_RADIUS,
+    EARTH_ORBITAL_VELOCITY,
+    MARS_ORBIT_RADIUS,
+    SUN_MASS,
+    G,
+)
+
+
+def compute_porkchop(
+    earth_angle: np.ndarray, flight_time: np.ndarray, launch_radius: float | None = None
+) -> pd.DataFrame:
+    """
+    Solve the Sun-only Earth to Mars transfer for every (Earth position, flight time) pair.
+
+    `earth_angle` is the Sun to Earth radius-vector angle in radians, Mars is at 0 as on the page.
+    The relative velocity and angle are the launch parameters of the space stage. With
+    `launch_radius` the launch overcomes Earth gravity from that distance to its center, the
+    launch is radial, so it does not change the velocity direction.
+    Columns: earth_position (deg), flight_time (days), departure_delta_v, arrival_delta_v,
+    delta_v (km/s), relative_velocity (km/s), relative_angle (deg)
+    """
+    angle_grid, time_grid = np.meshgrid(earth_angle, flight_time, indexing="ij")
+    earth_position = EARTH_ORBIT_RADIUS * np.stack((np.cos(angle_grid), np.sin(angle_grid)), -1)
+    mars_position = np.array((MARS_ORBIT_RADIUS, 0))
+    transfer = solve_lambert(earth_position, mars_position, time_grid, G * SUN_MASS)
+
+    earth_velocity = EARTH_ORBITAL_VELOCITY * np.stack(
+        (-np.sin(angle_grid), np.cos(angle_grid)), -1
+    )
+    mars_velocity = np.array((0, np.sqrt(G * SUN_MASS / MARS_ORBIT_RADIUS)))
+
+    launch_velocity = transfer.departure_velocity
+    if launch_radius is not None:
+        excess_velocity = np.linalg.norm(launch_velocity, axis=-1, keepdims=True)
+        launch_velocity = launch_velocity * (
+            np.hypot(excess_velocity, get_planet_escape_velocity(launch_radius, EARTH_MASS))
+            / excess_velocity
+        )
+    relative_velocity = launch_velocity - earth_velocity
+
+    departure_delta_v = np.linalg.norm(transfer.departure_velocity - earth_velocity, axis=-1)
+    arrival_delta_v = np.linalg.norm(transfer.arrival_velocity - mars_velocity, axis=-1)
+    return pd.DataFrame(
+        {
+            "earth_position": np.degrees(angle_grid.ravel()),
+            "flight_time": time_grid.ravel() / DAY,
+            "departure_delta_v": departure_delta_v.ravel() / 1000,
+            "arrival_delta_v": arrival_delta_v.ravel() / 1000,
+            "delta_v": (departure_delta_v + arrival_delta_v).ravel() / 1000,
+            "relative_velocity": np.linalg.norm(relative_velocity, axis=-1).ravel() / 1000,
+            "relative_angle": np.degrees(
+                np.arctan2(relative_velocity[..., 1], relative_velocity[..., 0])
+            ).ravel(),
+        }
+    )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import DOP853, OdeSolution
+
+from labs.flight_to_mars.model.flight import PropagationType
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.stage.space.ephemeris import Ephemeris
+from labs.flight_to_mars.stage.space.equation import interplanetary_engine_off_equation
+from labs.flight_to_mars.stage.space.event import (
+    Solution,
+    find_closest_approach,
+    find_first_closest_approach,
+    find_first_orbit_entry,
+    find_orbit_entry,
+)
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.flight_to_mars.stage.space.kepler import KeplerOrbit
+from labs.flight_to_mars.stage.space.patched_conic import propagate_patched_conics
+from labs.model.constant import HUMAN_EXPIRATION_TIME
+
+RELATIVE_TOLERANCE = 10 ** (-9)
+ABSOLUTE_TOLERANCE = 10 ** (-3)
+STEP_CHORD_COUNT = 2**4  # an integrator step is checked for the orbit entry by that many chords
+
+
+@dataclass(frozen=True)
+class InterplanetaryFlight:
+    """Flight solved with dense output, it can be sampled at any density afterwards."""
+
+    rocket: Rocket
+    gravity: GravityKernel
+    solution: Solution
+    flight_time: float
+    final_state: np.ndarray
+    reached_planet: bool
+    ephemeris: Ephemeris | None = None
+
+    def sample_time(self, sampling_delta: float) -> np.ndarray:
+        return np.append(np.arange(0, self.flight_time, sampling_delta), self.flight_time)
+
+    def sample(self, sampling_delta: float) -> RocketLog:
+        """Sample the flight every `sampling_delta`, the last sample is the final state."""
+        time = self.sample_time(sampling_delta)
+        states = self.solution(time)
+        states[:, -1] = self.final_state
+        acceleration_x, acceleration_y = self.gravity(states[:2].T, time).T
+        return RocketLog.from_arrays(
+            self.rocket, time, *states, acceleration_x, acceleration_y, self.rocket.mass
+        )
+
+    def planet_solution(self, planet: Planet) -> Solution:
+        return planet_solution(planet, self.ephemeris)
+
+    def relative_solution(self, planet: Planet) -> Solution:
+        """Make the flight states relative to the planet, which moves by the ephemeris if any."""
+        return relative_solution(self.solution, planet, self.ephemeris)
+
+
+def propagate_interplanetary_flight(
+    rocket: Rocket,
+    planets: list[Planet],
+    target_planet: Planet,
+    propagation: PropagationType = PropagationType.N_BODY,
+    ephemeris: Ephemeris | None = None,
+    *,
+    stop_at_closest_approach: bool = False,
+) -> InterplanetaryFlight:
+    """
+    Propagate the engine-off flight with adaptive steps until the target planet orbit is entered.
+
+    The flight is cut at `HUMAN_EXPIRATION_TIME` if the orbit is not reached by then. Every step
+    is checked for the orbit entry as soon as it is made, so the integration ends there.
+    A flight around a single body is a Kepler orbit, it is solved in closed form instead.
+    Patched conics approximate the other flights by Kepler orbits joined at spheres of influence.
+    The entry is searched on a grid of both closed form solutions.
+    With the ephemeris planets, the target one included, move. Both closed form solutions need
+    the attracting bodies to stand still, otherwise the flight is integrated.
+    With `stop_at_closest_approach` a flight missing the orbit ends as soon as its distance to the
+    target planet grows again, that is enough to measure the miss.
+    """
+    gravity = GravityKernel.from_planets(planets, ephemeris)
+    state = np.array((rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y))
+    static = ephemeris is None or not any(ephemeris.is_moving(planet) for planet in planets)
+
+    def relative_to_target(solution: Solution) -> Solution:
+        return relative_solution(solution, target_planet, ephemeris)
+
+    if static and len(planets) == 1:
+        solution = KeplerOrbit.from_rocket(rocket, planets[0])
+        duration, entry_time = _search_orbit_entry(
+            relative_to_target(solution),
+            target_planet.orbit_radius,
+            stop_at_closest_approach=stop_at_closest_approach,
+        )
+    elif static and propagation == PropagationType.PATCHED_CONICS:
+        solution = propagate_patched_conics(state, planets, HUMAN_EXPIRATION_TIME)
+        duration, entry_time = _search_orbit_entry(
+            relative_to_target(solution),
+            target_planet.orbit_radius,
+            stop_at_closest_approach=stop_at_closest_approach,
+        )
+    else:
+        solution, duration, entry_time = _integrate_until_orbit_entry(
+            state,
+            gravity,
+            relative_to_target,
+            target_planet.orbit_radius,
+            stop_at_closest_approach=stop_at_closest_approach,
+        )
+    flight_time = duration if entry_time is None else entry_time
+
+    return InterplanetaryFlight(
+        rocket=rocket,
+        gravity=gravity,
+        solution=solution,
+        flight_time=flight_time,
+        final_state=solution(flight_time),
+        reached_planet=entry_time is not None,
+        ephemeris=ephemeris,
+    )
+
+
+def _search_orbit_entry(
+    relative_solution: Solution, orbit_radius: float, *, stop_at_closest_approach: bool
+) -> tuple[float, float | None]:
+    """Search the closed form solution for the entry, the end time is returned too."""
+    entry_time = find_first_orbit_entry(relative_solution, 0, HUMAN_EXPIRATION_TIME, orbit_radius)
+    if entry_time is None and stop_at_closest_approach:
+        approach_time = find_first_closest_approach(relative_solution, 0, HUMAN_EXPIRATION_TIME)
+        if approach_time is not None:
+            return approach_time, None
+
+    return HUMAN_EXPIRATION_TIME, entry_time
+
+
+def _integrate_until_orbit_entry(
+    state: np.ndarray,
+    gravity: GravityKernel,
+    relative_to_target: Callable[[Solution], Solution],
+    orbit_radius: float,
+    *,
+    stop_at_closest_approach: bool,
+) -> tuple[OdeSolution, float, float | None]:
+    """Integrate step by step, each one is checked for the entry, the end time is returned too."""
+    solver = DOP853(
+        lambda time, state: interplanetary_engine_off_equation(state, gravity, time),
+        0,
+        state,
+        HUMAN_EXPIRATION_TIME,
+        rtol=RELATIVE_TOLERANCE,
+        atol=ABSOLUTE_TOLERANCE,
+    )
+    step_ends, steps = [0.0], []
+    entry_time = None
+    while entry_time is None and solver.status == "running":
+        solver.step()
+        step_ends.append(solver.t)
+        steps.append(solver.dense_output())
+        step_solution = relative_to_target(steps[-1])
+        time = np.linspace(solver.t_old, solver.t, STEP_CHORD_COUNT + 1)
+        entry_time = find_orbit_entry(step_solution, time, orbit_radius)
+        if entry_time is None and stop_at_closest_approach:
+            approach_time = find_closest_approach(step_solution, time)
+            if approach_time is not None:
+                return OdeSolution(step_ends, steps), approach_time, None
+
+    return OdeSolution(step_ends, steps), solver.t, entry_time
+
+
+def planet_solution(planet: Planet, ephemeris: Ephemeris | None) -> Solution:
+    """Make the planet states a flight-like solution, the planet stands still without ephemeris."""
+    if ephemeris is None:
+        return lambda time: np.multiply.outer(
+            (planet.x, planet.y, 0, 0), np.ones_like(time, dtype=float)
+        )
+    return ephemeris.solution_of(planet)
+
+
+def relative_solution(solution: Solution, planet: Planet, ephemeris: Ephemeris | None) -> Solution:
+    planet_states = planet_solution(planet, ephemeris)
+    return lambda time: solution(time) - planet_states(time)
@@ -1,22 +1,37 @@
-from collections.abc import Generator
-
 from labs.flight_to_mars.model.planet import Planet
-from labs.flight_to_mars.model.rocket import Rocket
-from labs.flight_to_mars.stage.criteria import get_is_astronaut_dead_from_hunger_checker
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.stage.criteria import AstronautMonitor
 from labs.flight_to_mars.stage.space.calculator import RocketInterplanetaryFlightCalculator
 from labs.flight_to_mars.stage.space.criteria import get_planet_reach_checker
 
 
 def simulate_interplanetary_flight(
-    calculator: RocketInterplanetaryFlightCalculator, sampling_delta: float, target_planet: Planet
-) -> Generator[Rocket]:
-    yield calculator(0)
-    rocket = calculator(sampling_delta)
-    is_astronaut_dead_from_hunger_checker = get_is_astronaut_dead_from_hunger_checker(
-        sampling_delta
+    calculator: RocketInterplanetaryFlightCalculator,
+    sampling_delta: float,
+    target_planet: Planet,
+    monitor: AstronautMonitor | None = None,
+) -> RocketLog:
+    """Simulate the flight until it reaches the target planet or the astronaut starves."""
+    rocket = calculator.rocket
+    monitor = monitor or AstronautMonitor(sampling_delta)
+    rocket_log = RocketLog.for_rocket(rocket)
+    rocket_log.append(
+        calculator.time,
+        rocket.x,
+        rocket.y,
+        rocket.velocity_x,
+        rocket.velocity_y,
+        rocket.acceleration_x,
+        rocket.acceleration_y,
+        rocket.mass,
     )
+    monitor.record(rocket.acceleration_x or 0.0, rocket.acceleration_y or 0.0)
+    x, y, *_ = calculator.advance(sampling_delta)
     planet_reach_checker = get_planet_reach_checker(target_planet)
 
-    while not (planet_reach_checker(rocket) or is_astronaut_dead_from_hunger_checker()):
-        rocket = calculator(sampling_delta)
-        yield rocket
+    while not (planet_reach_checker(x, y) or monitor.is_dead_from_hunger or monitor.should_stop):
+        state = calculator.advance(sampling_delta)
+        rocket_log.append(calculator.time, *state, rocket.mass)
+        x, y, _, _, acceleration_x, acceleration_y = state
+        monitor.record(acceleration_x, acceleration_y)
+    return rocket_log
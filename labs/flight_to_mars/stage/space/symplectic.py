@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import numpy as np
+
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+
+LEAPFROG_WEIGHTS = (1.0,)
+# Yoshida 4th order: three leapfrog sub-steps, the middle one goes backwards in time
+_YOSHIDA_OUTER = 1 / (2 - 2 ** (1 / 3))
+YOSHIDA_WEIGHTS = (_YOSHIDA_OUTER, 1 - 2 * _YOSHIDA_OUTER, _YOSHIDA_OUTER)
+
+
+def propagate_symplectic(
+    state: np.ndarray,
+    duration: float,
+    step_count: int,
+    gravity: GravityKernel,
+    weights: tuple[float, ...] = LEAPFROG_WEIGHTS,
+) -> np.ndarray:
+    """
+    Propagate the (x, y, velocity_x, velocity_y) state with velocity Verlet (kick-drift-kick).
+
+    Each of `step_count` steps is composed of leapfrog sub-steps scaled by `weights`. Symplectic
+    steps keep the orbital energy bounded instead of letting it drift, even if they are large.
+    """
+    position, velocity = state[:2].copy(), state[2:].copy()
+    step = duration / step_count
+    acceleration = gravity(position)
+
+    for _ in range(step_count):
+        for weight in weights:
+            half_kick = 0.5 * weight * step
+            velocity += half_kick * acceleration
+            position += weight * step * velocity
+            acceleration = gravity(position)
+            velocity += half_kick * acceleration
+
+    return np.concatenate((position, velocity))
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.optimize import OptimizeResult, minimize, minimize_scalar
+
+from labs.flight_to_mars.model.flight import PropagationType
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.space.ephemeris import Ephemeris
+from labs.flight_to_mars.stage.space.event import EVENT_SEARCH_STEP
+from labs.flight_to_mars.stage.space.propagation import (
+    InterplanetaryFlight,
+    propagate_interplanetary_flight,
+)
+
+MAX_PROPAGATION_COUNT = 2**6
+INITIAL_VELOCITY_STEP = 100  # m/s
+INITIAL_ANGLE_STEP = math.radians(1)
+
+
+@dataclass(frozen=True)
+class TargetingResult:
+    relative_velocity: float  # m/s
+    angle: float  # rad
+    approach_distance: float  # to the target planet center, m
+    reached_planet: bool
+    propagation_count: int
+
+
+def target_planet(
+    launch_rocket: Callable[[float, float], Rocket],
+    planets: list[Planet],
+    target: Planet,
+    relative_velocity: float,
+    angle: float,
+    bounds: tuple[tuple[float, float], tuple[float, float]],
+    propagation: PropagationType = PropagationType.N_BODY,
+    ephemeris: Ephemeris | None = None,
+) -> TargetingResult:
+    """
+    Search the launch (relative velocity, angle) around the guess to enter the target planet orbit.
+
+    `launch_rocket` creates the rocket from the relative velocity and angle, `bounds` limit them.
+    The closest approach is minimized by the Nelder-Mead method, which stops as soon as a flight
+    enters the orbit or after `MAX_PROPAGATION_COUNT` propagations. The closest one is returned.
+    Missing flights are propagated only up to their first closest approach.
+    """
+    approaches: dict[tuple[float, float], tuple[float, bool]] = {}  # simplex points repeat
+
+    def objective(parameters: np.ndarray) -> float:
+        key = (float(parameters[0]), float(parameters[1]))
+        if key not in approaches:
+            flight = propagate_interplanetary_flight(
+                launch_rocket(*key),
+                planets,
+                target,
+                propagation,
+                ephemeris,
+                stop_at_closest_approach=True,
+            )
+            approaches[key] = (closest_approach(flight, target), flight.reached_planet)
+        return approaches[key][0]
+
+    def stop_on_hit(_: OptimizeResult) -> None:
+        if any(reached_planet for _, reached_planet in approaches.values()):
+            raise StopIteration
+
+    minimize(
+        objective,
+        (relative_velocity, angle),
+        method="Nelder-Mead",
+        bounds=bounds,
+        callback=stop_on_hit,
+        options={
+            "maxfev": MAX_PROPAGATION_COUNT,
+            "initial_simplex": np.array((relative_velocity, angle))
+            + np.array(((0, 0), (INITIAL_VELOCITY_STEP, 0), (0, INITIAL_ANGLE_STEP))),
+        },
+    )
+
+    (best_velocity, best_angle), (distance, reached_planet) = min(
+        approaches.items(), key=lambda item: (not item[1][1], item[1][0])
+    )
+    return TargetingResult(
+        relative_velocity=best_velocity,
+        angle=best_angle,
+        approach_distance=distance,
+        reached_planet=reached_planet,
+        propagation_count=len(approaches),
+    )
+
+
+def closest_approach(flight: InterplanetaryFlight, planet: Planet) -> float:
+    """Find the minimal distance to the planet center, the flight is cut at its orbit entry."""
+    relative_solution = flight.relative_solution(planet)
+
+    def distance(time: float | np.ndarray) -> float | np.ndarray:
+        x, y, _, _ = relative_solution(time)
+        return np.hypot(x, y)
+
+    time = np.append(np.arange(0, flight.flight_time, EVENT_SEARCH_STEP), flight.flight_time)
+    index = int(np.argmin(distance(time)))
+    if index in (0, time.size - 1):
+        return float(distance(time[index]))
+
+    return float(
+        minimize_scalar(distance, bounds=(time[index - 1], time[index + 1]), method="bounded").fun
+    )
@@ -0,0 +1,52 @@
+import base64
+import io
+import mimetypes
+from pathlib import Path
+
+import streamlit as st
+from cachetools.func import lru_cache
+from PIL import Image
+
+# Streamlit serves this folder next to the main script at `STATIC_URL`
+STATIC_DIR = Path(__file__).parents[3] / "static"
+STATIC_URL = "app/static"
+# Streamlit serves other files as plain text, so SVG images are always inlined
+STATIC_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".gif", ".webp"))
+
+
+def image_source(filename: str, pixel_size: int | None = None) -> str:
+    """
+    Get the image source for a Plotly figure.
+
+    With Streamlit static file serving raster images are referenced by URL, so the browser loads
+    them once. Otherwise images are inlined as data URIs, raster ones are downscaled to
+    `pixel_size` first. Vector ones are kept as is, they do not get lighter.
+    """
+    if Path(filename).suffix.lower() in STATIC_SUFFIXES and st.get_option(
+        "server.enableStaticServing"
+    ):
+        return f"{STATIC_URL}/{filename}"
+    return encode_image(filename, _variant_size(pixel_size))
+
+
+@lru_cache
+def encode_image(filename: str, pixel_size: int | None = None) -> str:
+    """Encode the image as a data URI once per process and size."""
+    image_path = STATIC_DIR / filename
+    data = image_path.read_bytes()
+    if pixel_size is not None and image_path.suffix.lower() != ".svg":
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((pixel_size, pixel_size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format=image.format or "PNG", optimize=True)
+            data = buffer.getvalue()
+
+    mime, _ = mimetypes.guess_type(image_path)
+    return f"data:{mime};base64,{base64.b64encode(data).decode()}"
+
+
+def _variant_size(pixel_size: int | None) -> int | None:
+    """Round the size up to a power of two to reuse variants, twice as large for dense screens."""
+    if pixel_size is None:
+        return None
+    return 1 << max(2 * pixel_size - 1, 1).bit_length()
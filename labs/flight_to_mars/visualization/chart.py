@@ -1,25 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-
-import streamlit as st
+import numpy as np
 from streamlit.delta_generator import DeltaGenerator
 
-from labs.flight_to_mars.model.planet import Planet, norm
-from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket_log import RocketLog
 from labs.flight_to_mars.stage.planet.criteria import get_planet_escape_velocity
 from labs.model.constant import DAY, g
 
 
-def _time_axis(rockets: Sequence[Rocket]) -> list[float]:
-    """Generate time axis."""
-    sampling_delta = float(st.session_state.get("sampling_delta", 1))
-    return [i * sampling_delta for i in range(len(rockets))]
+def _time_axis(rockets: RocketLog) -> np.ndarray:
+    """
+    Generate time axis from the logged sample times.
+
+    A reversed log, like the Mars landing replayed from the simulated ascent, has its times
+    decreasing, so they are counted from its first sample instead.
+    """
+    time = rockets.time
+    if len(time) > 1 and time[-1] < time[0]:
+        return time[0] - time
+    return time
 
 
 def plot_velocity(
     container: DeltaGenerator,
-    rockets: Sequence[Rocket],
+    rockets: RocketLog,
     planet_mass: float | None = None,
     *,
     in_days: bool = False,
@@ -31,13 +36,13 @@ def plot_velocity(
     time = _time_axis(rockets)
     time_label = "Time (s)"
     if in_days:
-        time = [t / DAY for t in time]
+        time = time / DAY
         time_label = "Time (days)"
 
-    velocity = [r.velocity / 1000 for r in rockets]
+    velocity = rockets.velocity / 1000
     if planet_mass:
-        escape_velocity = [get_planet_escape_velocity(r.y, planet_mass) / 1000 for r in rockets]
-        velocity_gap = [e - v for v, e in zip(velocity, escape_velocity, strict=True)]
+        escape_velocity = get_planet_escape_velocity(rockets.y, planet_mass) / 1000
+        velocity_gap = escape_velocity - velocity
 
     container.line_chart(
         {
@@ -58,14 +63,14 @@ def plot_velocity(
     )
 
 
-def plot_mass(container: DeltaGenerator, rockets: Sequence[Rocket]) -> None:
+def plot_mass(container: DeltaGenerator, rockets: RocketLog) -> None:
     """Plot mass chart."""
     if not rockets:
         return
 
     time = _time_axis(rockets)
-    mass = [r.mass / 1000 for r in rockets]
-    netto_mass = [r.netto_mass / 1000 for r in rockets]
+    mass = rockets.mass / 1000
+    netto_mass = np.full(len(rockets), rockets.netto_mass / 1000)
     container.line_chart(
         {"Time (s)": time, "Mass (ton)": mass, "Netto Mass (ton)": netto_mass},
         x="Time (s)",
@@ -73,36 +78,36 @@ def plot_mass(container: DeltaGenerator, rockets: Sequence[Rocket]) -> None:
     )
 
 
-def plot_y_position(
-    container: DeltaGenerator, rockets: Sequence[Rocket], planet_radius: float
-) -> None:
+def plot_y_position(container: DeltaGenerator, rockets: RocketLog, planet_radius: float) -> None:
     """Plot height chart."""
     if not rockets:
         return
 
     time = _time_axis(rockets)
-    y_values = [(r.y - planet_radius) / 1000 for r in rockets]
+    y_values = (rockets.y - planet_radius) / 1000
     container.line_chart({"Time (s)": time, "Height (km)": y_values}, x="Time (s)", y="Height (km)")
 
 
 def plot_distance_to_target_chart(
     container: DeltaGenerator,
-    rockets: Sequence[Rocket],
+    rockets: RocketLog,
     target_planet: Planet,
     *,
     in_days: bool = False,
+    target_positions: np.ndarray | None = None,
 ) -> None:
-    """Plot distance to target chart."""
+    """Plot distance to target chart, `target_positions` follow a moving target at every sample."""
     if not rockets:
         return
 
     time = _time_axis(rockets)
-    distance_to_target = [
-        norm(target_planet.x - r.x, target_planet.y - r.y) / 1000 for r in rockets
-    ]
+    target_x, target_y = (
+        (target_planet.x, target_planet.y) if target_positions is None else target_positions.T
+    )
+    distance_to_target = np.hypot(target_x - rockets.x, target_y - rockets.y) / 1000
     time_label = "Time (s)"
     if in_days:
-        time = [t / DAY for t in time]
+        time = time / DAY
         time_label = "Time (days)"
     container.line_chart(
         {time_label: time, "Distance to Target (km)": distance_to_target},
@@ -111,15 +116,16 @@ def plot_distance_to_target_chart(
     )
     container.markdown(
         f"**Minimal** distance to target planet (radius): "
-        f"{(min(distance_to_target) * 1000 - target_planet.radius) / target_planet.radius:.02f}"
+        f"{(distance_to_target.min() * 1000 - target_planet.radius) / target_planet.radius:.02f}"
     )
     container.markdown(
-        "(Use this value to adjust the initial velocity and the rocket launch angle)"
+        "(Use this value to adjust the initial velocity and the rocket launch angle, "
+        "or let Mars be targeted automatically)"
     )
 
 
 def plot_acceleration(
-    container: DeltaGenerator, rockets: Sequence[Rocket], *, in_days: bool = False
+    container: DeltaGenerator, rockets: RocketLog, *, in_days: bool = False
 ) -> None:
     """Plot acceleration chart."""
     if not rockets:
@@ -128,10 +134,10 @@ def plot_acceleration(
     time = _time_axis(rockets)
     time_label = "Time (s)"
     if in_days:
-        time = [t / DAY for t in time]
+        time = time / DAY
         time_label = "Time (days)"
 
-    acceleration = [abs(rockets[i].acceleration / g) for i in range(len(rockets))]
+    acceleration = rockets.acceleration / g
     container.line_chart(
         {time_label: time, "Acceleration (g)": acceleration},
         x=time_label,
@@ -1,7 +1,7 @@
-__all__ = ["earth_shape", "mars_shape", "orbit_shape", "rocket_shape", "sun_shape"]
+__all__ = ["earth_shape", "mars_shape", "orbit_shape", "rocket_outline", "sun_shape"]
 
 from .earth import earth_shape
 from .mars import mars_shape
 from .orbit import orbit_shape
-from .rocket import rocket_shape
+from .rocket import rocket_outline
 from .sun import sun_shape
@@ -4,5 +4,7 @@ from labs.flight_to_mars.visualization.entity.planet import planet_shape
 from labs.model.constant import EARTH_RADIUS
 
 
-def earth_shape(x: float, y: float, radius: float = EARTH_RADIUS) -> dict[str, Any]:
-    return planet_shape("Earth.svg", x, y, radius)
+def earth_shape(
+    x: float, y: float, radius: float = EARTH_RADIUS, pixel_size: int | None = None
+) -> dict[str, Any]:
+    return planet_shape("Earth.svg", x, y, radius, pixel_size)
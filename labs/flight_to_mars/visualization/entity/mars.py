@@ -4,5 +4,7 @@ from labs.flight_to_mars.visualization.entity.planet import planet_shape
 from labs.model.constant import MARS_RADIUS
 
 
-def mars_shape(x: float, y: float, radius: float = MARS_RADIUS) -> dict[str, Any]:
-    return planet_shape("Mars.svg", x, y, radius)
+def mars_shape(
+    x: float, y: float, radius: float = MARS_RADIUS, pixel_size: int | None = None
+) -> dict[str, Any]:
+    return planet_shape("Mars.svg", x, y, radius, pixel_size)
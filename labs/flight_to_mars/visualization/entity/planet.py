@@ -1,20 +1,14 @@
-import base64
-from pathlib import Path
 from typing import Any
 
+from labs.flight_to_mars.visualization.asset import image_source
 
-def planet_shape(planet_filename: str, x: float, y: float, radius: float) -> dict[str, Any]:
-    image_path = Path(__file__).parent.parent / "image" / planet_filename
-
-    with image_path.open("rb") as img_file:
-        img_data = base64.b64encode(img_file.read()).decode()
-
-    ext = image_path.suffix.lower()
-    mime = "image/svg+xml" if ext == ".svg" else "image/png"
-    img_url = f"data:{mime};base64,{img_data}"
 
+def planet_shape(
+    planet_filename: str, x: float, y: float, radius: float, pixel_size: int | None = None
+) -> dict[str, Any]:
+    """Place the planet image, `pixel_size` is its expected size on the screen if known."""
     return {
-        "source": img_url,
+        "source": image_source(planet_filename, pixel_size),
         "xref": "x",
         "yref": "y",
         "x": x - radius,
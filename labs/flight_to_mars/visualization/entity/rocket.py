@@ -1,24 +1,34 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 from cachetools.func import lru_cache
 
 
-def rocket_shape(
-    x: float, y: float, angle: float, size: float = 0.2, color: str = "#ff4b4b"
-) -> dict[str, Any]:
+def rocket_outline(
+    x: float | np.ndarray, y: float | np.ndarray, angle: float | np.ndarray, size: float = 0.2
+) -> np.ndarray:
+    """Closed rocket polygons for filled scatter traces, shaped (..., vertex, 2)."""
     rocket = move_shape(_rocket_shape(size), x, y, angle)
-    path = "M " + " L ".join(f"{px} {py}" for px, py in rocket) + " Z"
-    return {"type": "path", "path": path, "fillcolor": color, "line_color": color}
+    return np.concatenate((rocket, rocket[..., :1, :]), axis=-2)
 
 
-def move_shape(shape: np.ndarray, x: float, y: float, angle: float) -> np.ndarray:
-    angle -= np.pi / 2
+def move_shape(
+    shape: np.ndarray,
+    x: float | np.ndarray,
+    y: float | np.ndarray,
+    angle: float | np.ndarray,
+) -> np.ndarray:
+    """Turn the upward shape to `angle` and move it to (x, y), all broadcast to (..., vertex, 2)."""
+    angle = np.asarray(angle, dtype=float)[..., np.newaxis] - np.pi / 2
     cos, sin = np.cos(angle), np.sin(angle)
-    rotation = np.array([[cos, -sin], [sin, cos]])
-    return shape @ rotation.T + [x, y]
+    shape_x, shape_y = shape[:, 0], shape[:, 1]
+    return np.stack(
+        (
+            shape_x * cos - shape_y * sin + np.asarray(x, dtype=float)[..., np.newaxis],
+            shape_x * sin + shape_y * cos + np.asarray(y, dtype=float)[..., np.newaxis],
+        ),
+        axis=-1,
+    )
 
 
 @lru_cache
@@ -4,5 +4,7 @@ from labs.flight_to_mars.visualization.entity.planet import planet_shape
 from labs.model.constant import SUN_RADIUS
 
 
-def sun_shape(x: float, y: float, radius: float = SUN_RADIUS) -> dict[str, Any]:
-    return planet_shape("Sun.png", x, y, radius)
+def sun_shape(
+    x: float, y: float, radius: float = SUN_RADIUS, pixel_size: int | None = None
+) -> dict[str, Any]:
+    return planet_shape("Sun.png", x, y, radius, pixel_size)
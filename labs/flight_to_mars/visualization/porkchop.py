@@ -0,0 +1,38 @@
+import altair as alt
+import pandas as pd
+
+TRANSFER_SELECTION = "transfer"
+
+
+def create_porkchop_chart(
+    porkchop_df: pd.DataFrame, angle_step: float, time_step: float
+) -> alt.Chart:
+    """Create an Earth position-flight time heatmap of the total delta-v, cells are selectable."""
+    return (
+        alt.Chart(porkchop_df, title="Total Δv, km/s")
+        .mark_rect()
+        .transform_calculate(
+            angle_start=f"datum.earth_position - {angle_step / 2}",
+            angle_end=f"datum.earth_position + {angle_step / 2}",
+            time_start=f"datum.flight_time - {time_step / 2}",
+            time_end=f"datum.flight_time + {time_step / 2}",
+        )
+        .encode(
+            x=alt.X("angle_start:Q", title="Earth position (deg)"),
+            x2="angle_end:Q",
+            y=alt.Y("time_start:Q", title="Flight time (days)"),
+            y2="time_end:Q",
+            color=alt.Color("delta_v:Q", title=None).scale(type="log", scheme="viridis"),
+            tooltip=[
+                alt.Tooltip("earth_position:Q", title="Earth position", format=".1f"),
+                alt.Tooltip("flight_time:Q", title="Flight time", format=".1f"),
+                alt.Tooltip("departure_delta_v:Q", title="Departure Δv", format=".2f"),
+                alt.Tooltip("arrival_delta_v:Q", title="Arrival Δv", format=".2f"),
+                alt.Tooltip("relative_velocity:Q", title="Relative velocity", format=".2f"),
+                alt.Tooltip("relative_angle:Q", title="Relative angle", format=".2f"),
+            ],
+        )
+        .add_params(
+            alt.selection_point(name=TRANSFER_SELECTION, fields=["earth_position", "flight_time"])
+        )
+    )
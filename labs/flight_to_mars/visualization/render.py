@@ -1,46 +1,69 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
+import math
+from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
 
-from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.visualization.entity import rocket_outline
+
+FIGURE_WIDTH = 1024  # px, the page content is not wider
+AXIS_ZOOM = 1.1
+MAX_FRAME_COUNT = 2**8
+ANIMATION_DURATION = 4000  # ms
+ROCKET_COLOR = "#ff4b4b"
 
 
 def render_animation(
-    rockets: Sequence[Rocket],
-    rocket_shape_at: Callable[..., ...],
+    rockets: RocketLog,
+    rocket_size: float,
     planets: list[dict[str, Any]],
     orbits: Iterable[dict[str, Any]] = (),
+    *,
+    frame_count: int = MAX_FRAME_COUNT,
+    duration: int = ANIMATION_DURATION,
 ) -> go.Figure:
-    """Create animated Plotly figure with frames for rocket flight."""
-    max_x = max(*(abs(rocket.x) for rocket in rockets), *(abs(planet["x"]) for planet in planets))
-    max_y = max(*(abs(rocket.y) for rocket in rockets), *(abs(planet["y"]) for planet in planets))
-    x_range, y_range = _adjust_axes(max_x, max_y)
+    """
+    Create animated Plotly figure of the rocket flight.
 
-    frames = []
-    for i, rocket in enumerate(rockets):
-        rocket_shape = rocket_shape_at(x=rocket.x, y=rocket.y, angle=rocket.angle)
-        frames.append(
-            go.Frame(
-                data=[],  # No data needed, shapes are in layout
-                name=str(i),
-                layout={"shapes": [*orbits, rocket_shape]},
-            )
-        )
+    The flight is decimated to at most `frame_count` evenly spaced samples, the first and the last
+    ones included, which are played in about `duration` ms. The rocket is a filled scatter trace
+    and frames only carry its outline coordinates, so the figure size does not depend on the
+    flight length.
+    """
+    max_x = max(float(abs(rockets.x).max()), *(abs(planet["x"]) for planet in planets))
+    max_y = max(float(abs(rockets.y).max()), *(abs(planet["y"]) for planet in planets))
+    x_range, y_range = _adjust_axes(max_x, max_y)
 
-    # Initial frame
-    initial_rocket = rockets[0]
-    initial_rocket_shape = rocket_shape_at(
-        x=initial_rocket.x, y=initial_rocket.y, angle=initial_rocket.angle
+    indices = decimate(len(rockets), frame_count)
+    outlines = rocket_outline(
+        rockets.x[indices], rockets.y[indices], rockets.angle[indices], rocket_size
     )
+    frames = [
+        go.Frame(data=[{"x": outline[:, 0], "y": outline[:, 1]}], traces=[0], name=str(i))
+        for i, outline in enumerate(outlines)
+    ]
+    frame_duration = max(duration // len(frames), 1)
 
     return go.Figure(
-        data=[],  # No data needed, shapes are in layout
+        data=[
+            go.Scatter(
+                x=outlines[0][:, 0],
+                y=outlines[0][:, 1],
+                mode="lines",
+                fill="toself",
+                fillcolor=ROCKET_COLOR,
+                line={"color": ROCKET_COLOR},
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        ],
         frames=frames,
         layout={
-            "shapes": [*orbits, initial_rocket_shape],
+            "shapes": list(orbits),
             "images": planets,
             "xaxis": {"range": x_range},
             "yaxis": {"range": y_range, "scaleanchor": "x", "scaleratio": 1},
@@ -52,7 +75,14 @@ def render_animation(
                         {
                             "label": "Play",
                             "method": "animate",
-                            "args": [None, {"frame": {"duration": 3}}],
+                            "args": [
+                                None,
+                                {
+                                    "frame": {"duration": frame_duration, "redraw": False},
+                                    "fromcurrent": True,
+                                    "transition": {"duration": 0},
+                                },
+                            ],
                         },
                     ],
                 }
@@ -61,9 +91,20 @@ def render_animation(
     )
 
 
+def decimate(sample_count: int, frame_count: int) -> np.ndarray:
+    """Pick at most `frame_count` evenly spaced sample indices, the first and the last included."""
+    return np.unique(
+        np.linspace(0, sample_count - 1, min(sample_count, frame_count)).round().astype(int)
+    )
+
+
+def on_screen_size(radius: float, extent: float) -> int:
+    """Estimate the diameter in pixels of a body in a figure showing `extent` from the origin."""
+    return math.ceil(FIGURE_WIDTH * radius / (extent * AXIS_ZOOM))
+
+
 def _adjust_axes(x: float, y: float) -> tuple[tuple[float, float], tuple[float, float]]:
     """Compute dynamic ranges to keep planet and rocket visible."""
-    zoom = 1.1
-    x_range = (-x * zoom, x * zoom)
-    y_range = (-y * zoom, y * zoom)
+    x_range = (-x * AXIS_ZOOM, x * AXIS_ZOOM)
+    y_range = (-y * AXIS_ZOOM, y * AXIS_ZOOM)
     return x_range, y_range
@@ -4,3 +4,8 @@ from enum import StrEnum
 class CorrelationType(StrEnum):
     LINEAR = "linear"
     QUADRATIC = "quadratic"
+
+
+class SolverType(StrEnum):
+    STEPWISE = "stepwise"
+    COUPLED = "coupled"
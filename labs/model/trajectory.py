@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from labs.model.vector import Vector2D
+
+COLUMNS = ("time", "x", "y", "velocity_norm", "velocity_angle")
+INITIAL_CAPACITY = 2**10
+
+
+class Trajectory:
+    """
+    Columnar flight log: time, position, velocity norm and angle (in degrees) per sample.
+
+    Samples are stored as rows of a single float64 array, so each one takes 40 bytes.
+    The array is preallocated and grows geometrically when appended to.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self._data = np.empty((max(capacity, 1), len(COLUMNS)))
+        self._size = 0
+
+    @classmethod
+    def from_arrays(
+        cls,
+        time: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        velocity_x: np.ndarray,
+        velocity_y: np.ndarray,
+    ) -> Trajectory:
+        trajectory = cls(capacity=len(time))
+        data = trajectory._data[: len(time)]
+        data[:, 0] = time
+        data[:, 1] = x
+        data[:, 2] = y
+        np.hypot(velocity_x, velocity_y, out=data[:, 3])
+        np.degrees(np.arctan2(velocity_y, velocity_x), out=data[:, 4])
+        trajectory._size = len(time)
+        return trajectory
+
+    def append(self, time: float, point: Vector2D, velocity: Vector2D) -> None:
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, (2 * len(self._data), len(COLUMNS)))
+
+        self._data[self._size] = (
+            time,
+            point.x,
+            point.y,
+            velocity.norm,
+            math.degrees(velocity.angle),
+        )
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def make_read_only(self) -> None:
+        """Protect the samples of a shared trajectory, writing to them raises afterwards."""
+        self._data.setflags(write=False)
+
+    @property
+    def data(self) -> np.ndarray:
+        """All samples as a (len, 5) array view, columns are ordered as in `COLUMNS`."""
+        return self._data[: self._size]
+
+    @property
+    def time(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def velocity_norm(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    @property
+    def velocity_angle(self) -> np.ndarray:
+        return self.data[:, 4]
+
+    @property
+    def flight_time(self) -> float:
+        return float(self.time[-1])
+
+    @property
+    def grounding_point(self) -> Vector2D:
+        return Vector2D(float(self.x[-1]), float(self.y[-1]))
+
+
+def trajectory_to_df(trajectory: Trajectory) -> pd.DataFrame:
+    """
+    Wrap the trajectory columns into a DataFrame without copying them.
+
+    Columns: time, x, y, velocity_norm, velocity_angle
+    """
+    return pd.DataFrame(trajectory.data, columns=list(COLUMNS), copy=False)
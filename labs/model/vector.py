@@ -5,7 +5,6 @@ from dataclasses import dataclass
 from functools import cached_property
 
 import pandas as pd
-import streamlit as st
 
 from labs.util.trigonometry import cos_rounded, sin_rounded
 
@@ -49,23 +48,3 @@ class Vector2D:
         norm, angle = self.to_polar()
         angle += delta_angle
         return Vector2D.from_polar(norm, angle)
-
-
-def trajectory_to_df(trajectory_data: list[tuple[Vector2D, Vector2D]]) -> pd.DataFrame:
-    """
-    Build a DataFrame with time, position, and velocity characteristics.
-
-    Columns: time, x, y, velocity, velocity_angle
-    """
-    return pd.DataFrame(
-        [
-            {
-                "time": index / st.session_state.sampling_steps,
-                "x": point.x,
-                "y": point.y,
-                "velocity_norm": velocity.norm,
-                "velocity_angle": math.degrees(velocity.angle),
-            }
-            for index, (point, velocity) in enumerate(trajectory_data)
-        ]
-    )
@@ -1,3 +1,4 @@
-__all__ = ["page"]
+__all__ = ["ThrowBatch", "page", "simulate_throws"]
 
+from .motion.batch import ThrowBatch, simulate_throws
 from .page import page
@@ -1,12 +1,16 @@
-__all__ = ["AccelerationVariationLaw", "acceleration_law_by_resistance_type"]
+__all__ = ["AccelerationVariationLaw", "DragParameters", "acceleration_law_by_resistance_type"]
+
+from collections.abc import Callable
 
 from labs.model.enum import CorrelationType
 
 from .linear import linear_acceleration_law
 from .quadratic import quadratic_acceleration_law
-from .variation_law import AccelerationVariationLaw
+from .variation_law import AccelerationVariationLaw, DragParameters
 
-acceleration_law_by_resistance_type: dict[CorrelationType, AccelerationVariationLaw] = {
+acceleration_law_by_resistance_type: dict[
+    CorrelationType, Callable[[DragParameters], AccelerationVariationLaw]
+] = {
     CorrelationType.LINEAR: linear_acceleration_law,
     CorrelationType.QUADRATIC: quadratic_acceleration_law,
 }
@@ -1,15 +1,23 @@
+from functools import partial
+
+import numpy as np
+
 from labs.model.constant import g
 
-from .drag import drag_factor
-from .variation_law import AccelerationVariationLaw
+from .variation_law import AccelerationVariationLaw, DragParameters
 
 
-def acceleration_y(velocity: float) -> float:
-    return -(drag_factor() * velocity) - g
+def acceleration_y(velocity: float | np.ndarray, drag_factor: float) -> float | np.ndarray:
+    return -(drag_factor * velocity) - g
 
 
-def acceleration_x(velocity: float) -> float:
-    return -(drag_factor() * velocity)
+def acceleration_x(velocity: float | np.ndarray, drag_factor: float) -> float | np.ndarray:
+    return -(drag_factor * velocity)
 
 
-linear_acceleration_law = AccelerationVariationLaw(x=acceleration_x, y=acceleration_y)
+def linear_acceleration_law(parameters: DragParameters) -> AccelerationVariationLaw:
+    return AccelerationVariationLaw(
+        x=partial(acceleration_x, drag_factor=parameters.drag_factor),
+        y=partial(acceleration_y, drag_factor=parameters.drag_factor),
+        parameters=parameters,
+    )
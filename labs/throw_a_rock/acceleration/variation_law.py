@@ -3,8 +3,25 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
+class DragParameters:
+    """Air resistance parameters, captured once per simulation, arrays hold them per batch throw."""
+
+    resistance_rate: float | np.ndarray
+    mass: float | np.ndarray
+
+    @property
+    def drag_factor(self) -> float | np.ndarray:
+        return self.resistance_rate / self.mass
+
+
+@dataclass(frozen=True)
 class AccelerationVariationLaw:
-    x: Callable[[float], float]
-    y: Callable[[float], float]
+    """Acceleration by velocity along each axis, works both with floats and NumPy arrays."""
+
+    x: Callable[[float | np.ndarray], float | np.ndarray]
+    y: Callable[[float | np.ndarray], float | np.ndarray]
+    parameters: DragParameters
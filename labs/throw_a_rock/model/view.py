@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class ThrowView(StrEnum):
+    SINGLE_THROW = "Single throw"
+    RANGE_MAP = "Range map"
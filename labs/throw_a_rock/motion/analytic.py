@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.special import lambertw
+
+from labs.model.constant import g
+from labs.model.trajectory import Trajectory
+from labs.model.vector import Vector2D
+
+NEWTON_ITERATIONS = 32
+NEWTON_TOLERANCE = 10 ** (-12)
+
+
+@dataclass(frozen=True)
+class LinearDragFlight:
+    """
+    Exact solution of a throw under linear air resistance.
+
+    `drag_factor` is the resistance rate divided by the rock mass, zero means no resistance.
+    """
+
+    initial_velocity: Vector2D
+    drag_factor: float
+    flight_time: float
+
+    @property
+    def grounding_point(self) -> Vector2D:
+        point, _ = self.evaluate(np.array([self.flight_time]))
+        return Vector2D(float(point[0, 0]), 0.0)
+
+    @property
+    def grounding_velocity(self) -> Vector2D:
+        _, velocity = self.evaluate(np.array([self.flight_time]))
+        return Vector2D(float(velocity[0, 0]), float(velocity[1, 0]))
+
+    def evaluate(self, time: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (x, y) and (vx, vy) rows evaluated at every moment of `time`."""
+        return _evaluate(self.initial_velocity, self.drag_factor, time)
+
+    def sample(self, sampling_delta: float) -> Trajectory:
+        """Evaluate the trajectory on the sampling grid, the last sample is on the ground."""
+        time = np.append(np.arange(0.0, self.flight_time, sampling_delta), self.flight_time)
+        (x, y), (velocity_x, velocity_y) = self.evaluate(time)
+        y[-1] = 0.0
+        return Trajectory.from_arrays(time, x, y, velocity_x, velocity_y)
+
+
+def solve_linear_drag_flight(initial_velocity: Vector2D, drag_factor: float) -> LinearDragFlight:
+    """Find the landing time of a throw under linear air resistance without integration."""
+    flight_time, _ = solve_linear_drag_landing(initial_velocity.x, initial_velocity.y, drag_factor)
+    return LinearDragFlight(
+        initial_velocity=initial_velocity,
+        drag_factor=drag_factor,
+        flight_time=float(flight_time),
+    )
+
+
+def solve_linear_drag_landing(
+    velocity_x: ArrayLike, velocity_y: ArrayLike, drag_factor: ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find flight time and distance of many throws under linear air resistance at once.
+
+    The Lambert W root is refined by Newton iterations, which is needed close to the
+    branch point of W, i.e. when the resistance is weak.
+    """
+    velocity_x, velocity_y, drag_factor = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (velocity_x, velocity_y, drag_factor))
+    )
+    vacuum_time = np.maximum(2 * velocity_y / g, 0)
+
+    # y(t) = 0  <=>  B - u = B * exp(-u), where u = k t and B = 1 + k vy / g
+    with np.errstate(all="ignore"):
+        b = np.where(drag_factor > 0, 1 + drag_factor * velocity_y / g, 2)  # W is slow near -1/e
+        lambert_time = (b + lambertw(-b * np.exp(-b)).real) / drag_factor
+        _, lambert_height, _, _ = _evaluate_components(
+            velocity_x, velocity_y, drag_factor, lambert_time
+        )
+
+    # The trajectory is concave and lands before it would in vacuum,
+    # so Newton converges from any moment after the landing
+    time = np.where(
+        (drag_factor > 0) & (lambert_time > 0) & (lambert_height <= 0), lambert_time, vacuum_time
+    )
+    for _ in range(NEWTON_ITERATIONS):
+        _, height, _, landing_velocity_y = _evaluate_components(
+            velocity_x, velocity_y, drag_factor, time
+        )
+        step = np.divide(height, landing_velocity_y, out=np.zeros_like(time), where=time > 0)
+        time = time - step
+        if (np.abs(step) <= NEWTON_TOLERANCE * time).all():
+            break
+
+    time = np.where(velocity_y > 0, time, 0.0)
+    distance, _, _, _ = _evaluate_components(velocity_x, velocity_y, drag_factor, time)
+    return time, distance
+
+
+def _evaluate(
+    initial_velocity: Vector2D, drag_factor: float, time: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    x, y, velocity_x, velocity_y = _evaluate_components(
+        initial_velocity.x, initial_velocity.y, drag_factor, time
+    )
+    return np.stack((x, y)), np.stack((velocity_x, velocity_y))
+
+
+def _evaluate_components(
+    velocity_x: ArrayLike, velocity_y: ArrayLike, drag_factor: ArrayLike, time: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Exact x, y, vx, vy at `time`, all the arguments are broadcast against each other."""
+    drag_factor = np.asarray(drag_factor, dtype=float)
+    has_drag = drag_factor > 0
+    safe_drag_factor = np.where(has_drag, drag_factor, 1.0)
+
+    decay = np.exp(-drag_factor * time)
+    decay_integral = np.where(has_drag, -np.expm1(-drag_factor * time) / safe_drag_factor, time)
+    free_fall_integral = np.where(has_drag, (time - decay_integral) / safe_drag_factor, time**2 / 2)
+
+    return (
+        velocity_x * decay_integral,
+        velocity_y * decay_integral - g * free_fall_integral,
+        velocity_x * decay,
+        velocity_y * decay - g * decay_integral,
+    )
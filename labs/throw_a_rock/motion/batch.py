@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.integrate import RK45
+
+from labs.model.enum import CorrelationType
+
+from ..acceleration import DragParameters, acceleration_law_by_resistance_type
+from ..acceleration.variation_law import AccelerationVariationLaw
+from .analytic import solve_linear_drag_landing
+
+RELATIVE_TOLERANCE = 10 ** (-9)
+ABSOLUTE_TOLERANCE = 10 ** (-9)
+INITIAL_STEP = 2 ** (-10)
+MAX_STEP_COUNT = 2**20
+NEWTON_ITERATIONS = 4
+
+# Dormand-Prince 5(4) tableau, the same one `RK45` uses
+_C, _A, _B, _E = RK45.C, RK45.A, RK45.B, RK45.E
+_ERROR_EXPONENT = -1 / (RK45.error_estimator_order + 1)
+
+
+@dataclass(frozen=True)
+class ThrowBatch:
+    """Landing characteristics of every throw of a batch, in the order of the input arrays."""
+
+    flight_time: np.ndarray
+    flight_distance: np.ndarray
+
+
+def simulate_throws(
+    velocity: ArrayLike,
+    angle: ArrayLike,
+    mass: ArrayLike,
+    resistance_rate: ArrayLike,
+    resistance_type: CorrelationType,
+) -> ThrowBatch:
+    """
+    Integrate many throws at once as a single vectorized ODE system.
+
+    Inputs are broadcast against each other, `angle` is in radians. All throws share an adaptive
+    step, the ones that hit the ground are located exactly and masked out of the system.
+    Linear resistance is solved in closed form instead.
+    """
+    velocity, angle, mass, resistance_rate = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (velocity, angle, mass, resistance_rate))
+    )
+    shape = velocity.shape
+    velocity, angle, mass, resistance_rate = (
+        value.ravel() for value in (velocity, angle, mass, resistance_rate)
+    )
+
+    velocity_x, velocity_y = velocity * np.cos(angle), velocity * np.sin(angle)
+
+    if resistance_type == CorrelationType.LINEAR:
+        flight_time, flight_distance = solve_linear_drag_landing(
+            velocity_x, velocity_y, resistance_rate / mass
+        )
+        return ThrowBatch(
+            flight_time=flight_time.reshape(shape), flight_distance=flight_distance.reshape(shape)
+        )
+
+    flight_time = np.zeros(velocity.size)
+    flight_distance = np.zeros(velocity.size)
+    (members,) = np.nonzero(velocity_y > 0)  # the others do not leave the ground at all
+    state = np.stack(
+        (np.zeros(members.size), np.zeros(members.size), velocity_x[members], velocity_y[members])
+    )
+
+    def law_for(members: np.ndarray) -> AccelerationVariationLaw:
+        return acceleration_law_by_resistance_type[resistance_type](
+            DragParameters(resistance_rate=resistance_rate[members], mass=mass[members])
+        )
+
+    acceleration_law = law_for(members)
+    time, step = 0.0, INITIAL_STEP
+
+    for _ in range(MAX_STEP_COUNT):
+        if not members.size:
+            break
+
+        new_state, error = _step(state, step, acceleration_law)
+        scale = ABSOLUTE_TOLERANCE + RELATIVE_TOLERANCE * np.maximum(
+            np.abs(state), np.abs(new_state)
+        )
+        error_norm = float(np.sqrt(np.mean((error / scale) ** 2, axis=0)).max())
+
+        if error_norm <= 1:
+            landed = new_state[1] < 0
+            if landed.any():
+                landing_delta = _landing_delta(
+                    state[:, landed], new_state[:, landed], step, law_for(members[landed])
+                )
+                landing_state, _ = _step(state[:, landed], landing_delta, law_for(members[landed]))
+                flight_time[members[landed]] = time + landing_delta
+                flight_distance[members[landed]] = landing_state[0]
+
+                members, new_state = members[~landed], new_state[:, ~landed]
+                acceleration_law = law_for(members)
+
+            state = new_state
+            time += step
+
+        step *= float(np.clip(0.9 * max(error_norm, 1e-10) ** _ERROR_EXPONENT, 0.2, 10))
+    else:
+        raise RuntimeError(f"{members.size} throws have not landed in {MAX_STEP_COUNT} steps")
+
+    return ThrowBatch(
+        flight_time=flight_time.reshape(shape), flight_distance=flight_distance.reshape(shape)
+    )
+
+
+def _derivative(state: np.ndarray, acceleration_law: AccelerationVariationLaw) -> np.ndarray:
+    _, _, velocity_x, velocity_y = state
+    return np.stack(
+        (
+            velocity_x,
+            velocity_y,
+            acceleration_law.x(velocity_x),
+            acceleration_law.y(velocity_y),
+        )
+    )
+
+
+def _step(
+    state: np.ndarray, step: float | np.ndarray, acceleration_law: AccelerationVariationLaw
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Make a Dormand-Prince step, `step` may differ per member.
+
+    Returns the new state and the local error estimate, both shaped (component, member).
+    """
+    stages = np.empty((len(_C) + 1, *state.shape))
+    stages[0] = _derivative(state, acceleration_law)
+    for i in range(1, len(_C)):
+        stages[i] = _derivative(
+            state + step * np.tensordot(_A[i, :i], stages[:i], axes=1), acceleration_law
+        )
+    new_state = state + step * np.tensordot(_B, stages[:-1], axes=1)
+    stages[-1] = _derivative(new_state, acceleration_law)
+    return new_state, step * np.tensordot(_E, stages, axes=1)
+
+
+def _landing_delta(
+    state: np.ndarray,
+    new_state: np.ndarray,
+    step: float,
+    acceleration_law: AccelerationVariationLaw,
+) -> np.ndarray:
+    """Time from the step start to the ground contact, found by Newton iterations."""
+    delta = step * state[1] / (state[1] - new_state[1])
+    for _ in range(NEWTON_ITERATIONS):
+        (_, height, _, velocity_y), _ = _step(state, delta, acceleration_law)
+        delta = np.clip(delta - height / velocity_y, 0, step)
+    return delta
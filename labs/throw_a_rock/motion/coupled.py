@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import OdeSolution, solve_ivp
+
+from labs.model.trajectory import Trajectory
+from labs.model.vector import Vector2D
+
+from ..acceleration.variation_law import AccelerationVariationLaw
+
+MAX_FLIGHT_TIME = 2.0**16  # far beyond any throw allowed in the ui
+RELATIVE_TOLERANCE = 10 ** (-10)
+ABSOLUTE_TOLERANCE = 10 ** (-10)
+
+
+@dataclass(frozen=True)
+class CoupledFlight:
+    """Dense solution of a throw, cut exactly at the ground contact."""
+
+    dense_solution: OdeSolution
+    flight_time: float
+    grounding_point: Vector2D
+    grounding_velocity: Vector2D
+
+    def sample(self, sampling_delta: float) -> Trajectory:
+        """
+        Evaluate the trajectory on the sampling grid at once.
+
+        The last sample is the exact ground contact, so it is no farther than a sampling delta
+        from the previous one.
+        """
+        time = np.append(np.arange(0.0, self.flight_time, sampling_delta), self.flight_time)
+        x, y, velocity_x, velocity_y = self.dense_solution(time)
+        x[-1], y[-1] = self.grounding_point.x, self.grounding_point.y
+        velocity_x[-1], velocity_y[-1] = self.grounding_velocity.x, self.grounding_velocity.y
+        return Trajectory.from_arrays(time, x, y, velocity_x, velocity_y)
+
+
+def solve_coupled_flight(
+    initial_velocity: Vector2D, acceleration_law: AccelerationVariationLaw
+) -> CoupledFlight:
+    """
+    Integrate the whole (x, y, vx, vy) state in a single solver call.
+
+    The solver stops on the root-found y = 0 terminal event, so flight time and distance
+    do not depend on the sampling rate.
+    """
+
+    def equation(_: float, state: np.ndarray) -> list[float]:
+        _, _, velocity_x, velocity_y = state
+        return [
+            velocity_x,
+            velocity_y,
+            acceleration_law.x(velocity_x),
+            acceleration_law.y(velocity_y),
+        ]
+
+    def hit_ground(_: float, state: np.ndarray) -> float:
+        return state[1]
+
+    hit_ground.terminal = True
+    hit_ground.direction = -1
+
+    solution = solve_ivp(
+        equation,
+        (0.0, MAX_FLIGHT_TIME),
+        [0.0, 0.0, initial_velocity.x, initial_velocity.y],
+        method="LSODA",
+        dense_output=True,
+        events=hit_ground,
+        rtol=RELATIVE_TOLERANCE,
+        atol=ABSOLUTE_TOLERANCE,
+    )
+
+    (grounding_times,) = solution.t_events
+    (grounding_states,) = solution.y_events
+    if not grounding_times.size:
+        raise RuntimeError(f"The rock has not landed in {MAX_FLIGHT_TIME} s")
+
+    grounding_x, _, grounding_velocity_x, grounding_velocity_y = map(float, grounding_states[0])
+    return CoupledFlight(
+        dense_solution=solution.sol,
+        flight_time=float(grounding_times[0]),
+        grounding_point=Vector2D(grounding_x, 0.0),
+        grounding_velocity=Vector2D(grounding_velocity_x, grounding_velocity_y),
+    )
+
+
+def simulate_coupled_flight(
+    initial_velocity: Vector2D,
+    acceleration_law: AccelerationVariationLaw,
+    sampling_delta: float,
+) -> Trajectory:
+    """Returns a trajectory like `simulate_flight`, the last sample lies exactly on the ground."""
+    return solve_coupled_flight(initial_velocity, acceleration_law).sample(sampling_delta)
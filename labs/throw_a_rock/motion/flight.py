@@ -0,0 +1,23 @@
+from labs.model.enum import CorrelationType
+from labs.model.vector import Vector2D
+
+from ..acceleration import DragParameters, acceleration_law_by_resistance_type
+from .analytic import LinearDragFlight, solve_linear_drag_flight
+from .coupled import CoupledFlight, solve_coupled_flight
+
+type Flight = CoupledFlight | LinearDragFlight
+
+
+def solve_flight(
+    initial_velocity: Vector2D, resistance_type: CorrelationType, parameters: DragParameters
+) -> Flight:
+    """
+    Solve the flight until ground contact.
+
+    Linear resistance has a closed-form solution, so no integration is done for it.
+    """
+    if resistance_type == CorrelationType.LINEAR:
+        return solve_linear_drag_flight(initial_velocity, parameters.drag_factor)
+
+    acceleration_law = acceleration_law_by_resistance_type[resistance_type](parameters)
+    return solve_coupled_flight(initial_velocity, acceleration_law)
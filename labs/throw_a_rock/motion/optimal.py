@@ -0,0 +1,65 @@
+import math
+from dataclasses import dataclass
+from functools import cache
+
+from scipy.optimize import minimize_scalar
+
+from labs.model.enum import CorrelationType
+from labs.model.vector import Vector2D
+
+from ..acceleration import DragParameters
+from .flight import Flight, solve_flight
+
+MIN_ANGLE = math.radians(0.1)
+MAX_ANGLE = math.radians(90.0)
+ANGLE_TOLERANCE = math.radians(10 ** (-3))
+
+
+@dataclass(frozen=True)
+class OptimalThrow:
+    """The farthest throw for the given speed, `angle` is in radians."""
+
+    angle: float
+    flight: Flight
+    simulation_count: int
+
+    @property
+    def flight_distance(self) -> float:
+        return self.flight.grounding_point.x
+
+    @property
+    def flight_time(self) -> float:
+        return self.flight.flight_time
+
+
+def find_optimal_angle(
+    initial_velocity_norm: float,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+    bounds: tuple[float, float] = (MIN_ANGLE, MAX_ANGLE),
+) -> OptimalThrow:
+    """
+    Find the launch angle of the maximum flight distance with the bounded Brent method.
+
+    Every angle is simulated once, its flight is reused when the optimizer comes back to it.
+    """
+
+    @cache
+    def flight_at(angle: float) -> Flight:
+        return solve_flight(
+            Vector2D.from_polar(initial_velocity_norm, angle), resistance_type, parameters
+        )
+
+    result = minimize_scalar(
+        lambda angle: -flight_at(float(angle)).grounding_point.x,
+        bounds=bounds,
+        method="bounded",
+        options={"xatol": ANGLE_TOLERANCE},
+    )
+    angle = float(result.x)
+
+    return OptimalThrow(
+        angle=angle,
+        flight=flight_at(angle),
+        simulation_count=flight_at.cache_info().currsize,
+    )
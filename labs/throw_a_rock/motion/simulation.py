@@ -1,24 +1,30 @@
-from collections.abc import Generator
-
+from labs.model.trajectory import Trajectory
 from labs.model.vector import Vector2D
 
 from ..velocity import VelocityCalculator
-from .compute import compute_grounding_point, compute_next_point
+from .compute import compute_grounding_point, compute_grounding_time, compute_next_point
 
 
-def simulate_flight(
-    velocity_calculator: VelocityCalculator,
-) -> Generator[tuple[Vector2D, Vector2D]]:
-    """Returns a generator that yields a tuple of (point, velocity) at each time step."""
+def simulate_flight(velocity_calculator: VelocityCalculator) -> Trajectory:
+    """Returns a trajectory filled with (point, velocity) at each time step."""
+    trajectory = Trajectory()
+    step = 0
     point = Vector2D(0.0, 0.0)
     previous_point = Vector2D(0.0, 0.0)
     velocity = velocity_calculator.initial_velocity
 
     while point.y >= 0.0:
-        yield point, velocity
+        trajectory.append(step * velocity_calculator.sampling_delta, point, velocity)
         previous_point = point
 
         velocity = velocity_calculator()
         point = compute_next_point(previous_point, velocity, velocity_calculator.sampling_delta)
+        step += 1
 
-    yield compute_grounding_point(previous_point, velocity), velocity
+    trajectory.append(
+        (step - 1) * velocity_calculator.sampling_delta
+        + compute_grounding_time(previous_point, velocity),
+        compute_grounding_point(previous_point, velocity),
+        velocity,
+    )
+    return trajectory
@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+from concurrent.futures import Executor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from labs.model.enum import CorrelationType
+
+from ..acceleration import DragParameters
+from .batch import simulate_throws
+
+
+def sweep_throws(
+    velocity: np.ndarray,
+    angle: np.ndarray,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+    executor: Executor | None = None,
+    chunk_count: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Simulate every (velocity, angle) pair of the grid, `angle` is in radians.
+
+    The velocity axis is split into chunks, each one is simulated as a batch, on the executor
+    if given. Chunks are yielded as soon as they are ready, so their order is arbitrary.
+    Columns: velocity, angle (in degrees), flight_time, flight_distance
+    """
+    chunks = [chunk for chunk in np.array_split(velocity, chunk_count) if chunk.size]
+
+    if executor is None:
+        for chunk in chunks:
+            yield sweep_chunk(chunk, angle, resistance_type, parameters)
+        return
+
+    futures = [
+        executor.submit(sweep_chunk, chunk, angle, resistance_type, parameters) for chunk in chunks
+    ]
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def sweep_chunk(
+    velocity: np.ndarray,
+    angle: np.ndarray,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+) -> pd.DataFrame:
+    velocity_grid, angle_grid = np.meshgrid(velocity, angle, indexing="ij")
+    batch = simulate_throws(
+        velocity_grid,
+        angle_grid,
+        parameters.mass,
+        parameters.resistance_rate,
+        resistance_type,
+    )
+    return pd.DataFrame(
+        {
+            "velocity": velocity_grid.ravel(),
+            "angle": np.degrees(angle_grid.ravel()),
+            "flight_time": batch.flight_time.ravel(),
+            "flight_distance": batch.flight_distance.ravel(),
+        }
+    )
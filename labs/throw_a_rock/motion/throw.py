@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
+from scipy.integrate import OdeSolution
+
+from labs.model.enum import CorrelationType, SolverType
+from labs.model.trajectory import Trajectory
+from labs.model.vector import Vector2D
+
+from ..acceleration import (
+    AccelerationVariationLaw,
+    DragParameters,
+    acceleration_law_by_resistance_type,
+)
+from ..velocity import VelocityCalculator
+from .coupled import CoupledFlight
+from .flight import Flight, solve_flight
+from .optimal import OptimalThrow, find_optimal_angle
+from .simulation import simulate_flight
+
+POINT_COUNT_THRESHOLD = 2**6
+CACHE_MEMORY_LIMIT = 2**27  # bytes of trajectory and dense solution data
+
+
+@dataclass(frozen=True)
+class ThrowResult:
+    trajectory: Trajectory
+    sampling_delta: float  # finer than the requested one if it gave too few points
+    optimal_throw: OptimalThrow | None = None
+
+
+def _result_size(result: ThrowResult) -> int:
+    """Count the trajectory and the dense solution of the optimal throw flight, if it has one."""
+    size = result.trajectory.data.nbytes
+    if result.optimal_throw is not None and isinstance(result.optimal_throw.flight, CoupledFlight):
+        size += _dense_solution_size(result.optimal_throw.flight.dense_solution)
+    return size
+
+
+def _dense_solution_size(solution: OdeSolution) -> int:
+    return solution.ts.nbytes + sum(
+        value.nbytes
+        for interpolant in solution.interpolants
+        for value in vars(interpolant).values()
+        if isinstance(value, np.ndarray)
+    )
+
+
+def _throw_key(
+    initial_velocity_norm: float,
+    angle: float,
+    sampling_delta: float,
+    solver_type: SolverType,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+    *,
+    find_optimal: bool,
+) -> tuple:
+    """Key the throw by its arguments, the ignored angle of an optimal throw is left out."""
+    return hashkey(
+        initial_velocity_norm,
+        0.0 if find_optimal else angle,
+        sampling_delta,
+        solver_type,
+        resistance_type,
+        parameters,
+        find_optimal=find_optimal,
+    )
+
+
+@cached(LRUCache(maxsize=CACHE_MEMORY_LIMIT, getsizeof=_result_size), key=_throw_key, lock=Lock())
+def compute_throw(
+    initial_velocity_norm: float,
+    angle: float,
+    sampling_delta: float,
+    solver_type: SolverType,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+    *,
+    find_optimal: bool,
+) -> ThrowResult:
+    """
+    Compute the sampled trajectory of a throw, `angle` is ignored if `find_optimal` is set.
+
+    The optimal angle is always found with the coupled solver, so with the stepwise one the
+    sampled trajectory may fall short of, or overshoot, the optimal flight distance.
+
+    Results are memoized per process, so they are shared by all sessions, and their trajectories
+    are read-only. The least recently used ones are evicted once their trajectories and dense
+    solutions exceed `CACHE_MEMORY_LIMIT` bytes in total.
+    """
+    optimal_throw: OptimalThrow | None = None
+    if find_optimal:
+        optimal_throw = find_optimal_angle(initial_velocity_norm, resistance_type, parameters)
+        angle = optimal_throw.angle
+
+    initial_velocity = Vector2D.from_polar(initial_velocity_norm, angle)
+
+    if solver_type == SolverType.COUPLED:
+        flight = (
+            optimal_throw.flight
+            if optimal_throw is not None
+            else solve_flight(initial_velocity, resistance_type, parameters)
+        )
+        trajectory, sampling_delta = sample_flight(flight, sampling_delta)
+    else:
+        acceleration_law = acceleration_law_by_resistance_type[resistance_type](parameters)
+        trajectory, sampling_delta = simulate_stepwise(
+            initial_velocity, acceleration_law, sampling_delta
+        )
+
+    trajectory.make_read_only()
+    return ThrowResult(
+        trajectory=trajectory, sampling_delta=sampling_delta, optimal_throw=optimal_throw
+    )
+
+
+def sample_flight(flight: Flight, sampling_delta: float) -> tuple[Trajectory, float]:
+    """Sample the solved flight, the sampling is refined if it gives too few points."""
+    if flight.flight_time / sampling_delta < POINT_COUNT_THRESHOLD:
+        sampling_delta = _refined_sampling_delta(flight.flight_time)
+
+    return flight.sample(sampling_delta), sampling_delta
+
+
+def simulate_stepwise(
+    initial_velocity: Vector2D,
+    acceleration_law: AccelerationVariationLaw,
+    sampling_delta: float,
+) -> tuple[Trajectory, float]:
+    """Simulate the flight step by step, it is re-run with a finer sampling if needed."""
+    velocity_calculator = VelocityCalculator(
+        initial_velocity=initial_velocity,
+        acceleration_law=acceleration_law,
+        sampling_delta=sampling_delta,
+    )
+    trajectory = simulate_flight(velocity_calculator)
+
+    if len(trajectory) < POINT_COUNT_THRESHOLD:
+        sampling_delta = _refined_sampling_delta(trajectory.flight_time)
+
+        velocity_calculator = VelocityCalculator(
+            initial_velocity=initial_velocity,
+            acceleration_law=acceleration_law,
+            sampling_delta=sampling_delta,
+        )
+        trajectory = simulate_flight(velocity_calculator)
+
+    return trajectory, sampling_delta
+
+
+def _refined_sampling_delta(flight_time: float) -> float:
+    return max(flight_time, 2 ** (-16)) / POINT_COUNT_THRESHOLD
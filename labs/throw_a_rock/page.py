@@ -1,25 +1,40 @@
 import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import streamlit as st
 
 from labs.model.constant import g
-from labs.model.enum import CorrelationType
-from labs.model.vector import Vector2D, trajectory_to_df
+from labs.model.enum import CorrelationType, SolverType
+from labs.model.trajectory import trajectory_to_df
 from labs.util.accuracy import round_to_significant
 
-from .acceleration import acceleration_law_by_resistance_type
-from .motion.compute import compute_flight_time
-from .motion.simulation import simulate_flight
-from .velocity import VelocityCalculator
-from .visualization import create_trajectory_chart, create_velocity_chart
+from .acceleration import DragParameters
+from .model.view import ThrowView
+from .motion.sweep import sweep_throws
+from .motion.throw import compute_throw
+from .visualization import create_heatmap_chart, create_trajectory_chart, create_velocity_chart
+from .visualization.util import MAX_CHART_POINTS
 
-POINT_COUNT_THRESHOLD = 2**6
+CHUNKS_PER_WORKER = 4
 
 
 def page() -> None:
     st.set_page_config(page_title="Throw a rock", page_icon="🪨", layout="wide")
 
     with st.sidebar:
+        view: ThrowView | None = st.segmented_control(
+            "View",
+            options=list(ThrowView),
+            default=ThrowView.SINGLE_THROW,
+            help="Range map shows the flight distance and time over the velocity-angle grid.",
+        )
+        if view is None:
+            st.warning("Choose the view! Single throw one is used now.")
+            view = ThrowView.SINGLE_THROW
+
         resistance_type: CorrelationType | None = st.segmented_control(
             "Air resistance type",
             options=list(CorrelationType),
@@ -29,69 +44,126 @@ def page() -> None:
             st.warning("Choose the resistance type! Linear one is used now.")
             resistance_type = CorrelationType.LINEAR
 
-        st.slider(
+        air_resistance_rate: float = st.slider(
             "Air resistance rate",
             min_value=0.0,
             max_value=2.0,
             value=0.5,
             step=0.01,
-            key="air_resistance_rate",
-        )
-        initial_velocity_norm: float = st.slider(
-            "Velocity, m/s", min_value=0.1, max_value=343.0, value=30.0, step=0.1
-        )
-        angle: float = math.radians(
-            st.slider("Angle, deg", min_value=0.1, max_value=90.0, value=30.0, step=0.1)
         )
-        st.slider(
+        if view == ThrowView.SINGLE_THROW:
+            initial_velocity_norm: float = st.slider(
+                "Velocity, m/s", min_value=0.1, max_value=343.0, value=30.0, step=0.1
+            )
+            find_optimal: bool = st.toggle(
+                "Find optimal angle",
+                help="Launch angle of the maximum flight distance is found automatically.",
+            )
+            angle: float = math.radians(
+                st.slider(
+                    "Angle, deg",
+                    min_value=0.1,
+                    max_value=90.0,
+                    value=30.0,
+                    step=0.1,
+                    disabled=find_optimal,
+                )
+            )
+        rock_mass: float = st.slider(
             "Mass, kg",
             min_value=0.01,
             max_value=10.0,
             value=1.0,
             step=0.01,
-            key="rock_mass",
-        )
-        sampling_delta: float = 1.0 / st.select_slider(
-            "Sampling steps per second",
-            options=(2**x for x in range(6, 11)),
-            value=2**8,
-            key="sampling_steps",
         )
+        if view == ThrowView.SINGLE_THROW:
+            sampling_delta: float = 1.0 / st.select_slider(
+                "Sampling steps per second",
+                options=(2**x for x in range(6, 11)),
+                value=2**8,
+                key="sampling_steps",
+            )
+            chart_points: int = st.select_slider(
+                "Chart points",
+                options=(2**x for x in range(8, 13)),
+                value=MAX_CHART_POINTS,
+                help="Charts are downsampled to this number of points, keeping their shape.",
+            )
+            solver_type: SolverType | None = st.segmented_control(
+                "Solver",
+                options=list(SolverType),
+                default=SolverType.COUPLED,
+                help=(
+                    "Stepwise solver integrates each velocity component step by step, "
+                    "coupled one integrates the whole flight at once and samples it afterwards "
+                    "(linear resistance is solved exactly, with no integration at all)."
+                ),
+            )
+            if solver_type is None:
+                st.warning("Choose the solver! Coupled one is used now.")
+                solver_type = SolverType.COUPLED
+        else:
+            grid_size: int = st.slider(
+                "Grid resolution",
+                min_value=10,
+                max_value=200,
+                value=100,
+                step=10,
+                help="Number of velocity and angle values simulated.",
+            )
 
         with st.expander("Constants used"):
             st.html(f"g = {g} m/s<sup>2</sup>")
 
-    velocity_calculator = VelocityCalculator(
-        initial_velocity=Vector2D.from_polar(initial_velocity_norm, angle),
-        acceleration_law=acceleration_law_by_resistance_type[resistance_type],
-        sampling_delta=sampling_delta,
-    )
-    trajectory_data = list(simulate_flight(velocity_calculator))
-    flight_time = compute_flight_time(trajectory_data, sampling_delta)
-
-    if len(trajectory_data) < POINT_COUNT_THRESHOLD:
-        sampling_delta = max(flight_time, 2 ** (-16)) / POINT_COUNT_THRESHOLD
+    parameters = DragParameters(resistance_rate=air_resistance_rate, mass=rock_mass)
 
-        st.sidebar.warning(
-            "With this parameters, the simulation is not precise enough.  "
-            f"Sampling steps per second is increased to roughly {round(1 / sampling_delta)}."
-        )
+    st.title("Throw a rock 🪨")
 
-        velocity_calculator = VelocityCalculator(
-            initial_velocity=Vector2D.from_polar(initial_velocity_norm, angle),
-            acceleration_law=acceleration_law_by_resistance_type[resistance_type],
-            sampling_delta=sampling_delta,
+    if view == ThrowView.SINGLE_THROW:
+        render_single_throw(
+            initial_velocity_norm,
+            angle,
+            sampling_delta,
+            chart_points,
+            solver_type,
+            resistance_type,
+            parameters,
+            find_optimal=find_optimal,
         )
-        trajectory_data = list(simulate_flight(velocity_calculator))
-        flight_time = compute_flight_time(trajectory_data, sampling_delta)
-
-    grounding_point = trajectory_data[-1][0]
-    trajectory_df = trajectory_to_df(trajectory_data)
+    else:
+        render_range_map(grid_size, resistance_type, parameters)
+
+
+def render_single_throw(
+    initial_velocity_norm: float,
+    angle: float,
+    sampling_delta: float,
+    chart_points: int,
+    solver_type: SolverType,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+    *,
+    find_optimal: bool,
+) -> None:
+    result = compute_throw(
+        initial_velocity_norm,
+        angle,
+        sampling_delta,
+        solver_type,
+        resistance_type,
+        parameters,
+        find_optimal=find_optimal,
+    )
+    if result.sampling_delta != sampling_delta:
+        warn_about_increased_sampling(result.sampling_delta)
 
-    st.title("Throw a rock 🪨")
+    trajectory, optimal_throw = result.trajectory, result.optimal_throw
+    flight_time = trajectory.flight_time
+    grounding_point = trajectory.grounding_point
+    trajectory_df = trajectory_to_df(trajectory)
 
-    st.altair_chart(create_trajectory_chart(trajectory_df))
-    st.altair_chart(create_velocity_chart(trajectory_df))
+    st.altair_chart(create_trajectory_chart(trajectory_df, chart_points))
+    st.altair_chart(create_velocity_chart(trajectory_df, chart_points))
 
     st.markdown(
         f"""
@@ -101,3 +173,78 @@ def page() -> None:
         | Flight distance | {round_to_significant(grounding_point.x)} m |
         """
     )
+
+    if optimal_throw is not None:
+        st.success(
+            f"Optimal angle is {round_to_significant(math.degrees(optimal_throw.angle))}°, "
+            f"found in {optimal_throw.simulation_count} simulations."
+        )
+        if solver_type == SolverType.STEPWISE:
+            st.info(
+                "Optimal angle is found with the coupled solver, its flight distance is "
+                f"{round_to_significant(optimal_throw.flight_distance)} m. "
+                "Stepwise trajectory above may differ from it."
+            )
+
+
+def render_range_map(
+    grid_size: int, resistance_type: CorrelationType, parameters: DragParameters
+) -> None:
+    """Sweep the velocity-angle grid on the process pool, chunks are appended to the charts."""
+    velocity = np.linspace(1.0, 343.0, grid_size)
+    angle = np.linspace(0.5, 90.0, grid_size)
+    velocity_step, angle_step = velocity[1] - velocity[0], angle[1] - angle[0]
+
+    distance_column, time_column = st.columns(2)
+    chunk_count = min(grid_size, CHUNKS_PER_WORKER * (os.cpu_count() or 1))
+    progress = st.progress(0.0, text="Simulating throws...")
+
+    charts = []
+    for index, chunk in enumerate(
+        sweep_throws(
+            velocity,
+            np.radians(angle),
+            resistance_type,
+            parameters,
+            executor=process_pool(),
+            chunk_count=chunk_count,
+        ),
+        start=1,
+    ):
+        if not charts:
+            charts = [
+                distance_column.altair_chart(
+                    create_heatmap_chart(
+                        chunk, "flight_distance", "Flight distance, m", velocity_step, angle_step
+                    )
+                ),
+                time_column.altair_chart(
+                    create_heatmap_chart(
+                        chunk, "flight_time", "Flight time, s", velocity_step, angle_step
+                    )
+                ),
+            ]
+        else:
+            for chart in charts:
+                chart.add_rows(chunk)
+        progress.progress(index / chunk_count, text="Simulating throws...")
+
+    progress.empty()
+
+
+@st.cache_resource
+def process_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by all sessions.
+
+    Workers are spawned, forking the multithreaded server may deadlock them. They import the app
+    script as `__mp_main__`, which builds the navigation only under `__main__`.
+    """
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def warn_about_increased_sampling(sampling_delta: float) -> None:
+    st.sidebar.warning(
+        "With this parameters, the simulation is not precise enough.  "
+        f"Sampling steps per second is increased to roughly {round(1 / sampling_delta)}."
+    )
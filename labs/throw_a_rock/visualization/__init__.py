@@ -1,4 +1,5 @@
-__all__ = ["create_trajectory_chart", "create_velocity_chart"]
+__all__ = ["create_heatmap_chart", "create_trajectory_chart", "create_velocity_chart"]
 
+from .heatmap import create_heatmap_chart
 from .trajectory import create_trajectory_chart
 from .velocity import create_velocity_chart
@@ -0,0 +1,35 @@
+import altair as alt
+import pandas as pd
+
+
+def create_heatmap_chart(
+    sweep_df: pd.DataFrame,
+    field: str,
+    title: str,
+    velocity_step: float,
+    angle_step: float,
+) -> alt.Chart:
+    """Create a velocity-angle heatmap, cell bounds are computed on the client side."""
+    return (
+        alt.Chart(sweep_df, title=title)
+        .mark_rect()
+        .transform_calculate(
+            velocity_start=f"datum.velocity - {velocity_step / 2}",
+            velocity_end=f"datum.velocity + {velocity_step / 2}",
+            angle_start=f"datum.angle - {angle_step / 2}",
+            angle_end=f"datum.angle + {angle_step / 2}",
+        )
+        .encode(
+            x=alt.X("velocity_start:Q", title="Velocity (m/s)"),
+            x2="velocity_end:Q",
+            y=alt.Y("angle_start:Q", title="Angle (deg)"),
+            y2="angle_end:Q",
+            color=alt.Color(f"{field}:Q", title=None).scale(scheme="viridis"),
+            tooltip=[
+                alt.Tooltip("velocity:Q", title="Velocity"),
+                alt.Tooltip("angle:Q", title="Angle"),
+                alt.Tooltip("flight_distance:Q", title="Flight distance"),
+                alt.Tooltip("flight_time:Q", title="Flight time"),
+            ],
+        )
+    )
@@ -1,11 +1,20 @@
 import altair as alt
 import pandas as pd
 
-from .util import hover_selection, interactive_points, tooltip_rule
+from .util import (
+    MAX_CHART_POINTS,
+    downsample,
+    hover_selection,
+    interactive_points,
+    tooltip_rule,
+)
 
 
-def create_trajectory_chart(trajectory_df: pd.DataFrame) -> alt.LayerChart:
-    """Create an interactive trajectory chart with velocity tooltips."""
+def create_trajectory_chart(
+    trajectory_df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> alt.LayerChart:
+    """Create an interactive trajectory chart with velocity tooltips, of `max_points` at most."""
+    trajectory_df = downsample(trajectory_df, "x", "y", max_points)
     hover = hover_selection("x")
 
     lines = (
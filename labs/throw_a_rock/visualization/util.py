@@ -1,6 +1,10 @@
 import altair as alt
 import pandas as pd
 
+from labs.util.downsampling import largest_triangle_three_buckets
+
+MAX_CHART_POINTS = 2**10
+
 
 def hover_selection(field: str) -> alt.Parameter:
     return alt.selection_point(fields=[field], nearest=True, on="mouseover", empty=False)
@@ -23,3 +27,11 @@ def tooltip_rule(data: pd.DataFrame, hover: alt.Parameter, x_field: str, y_field
         ],
     }
     return alt.Chart(data).mark_rule().encode(**encode_kwargs).add_params(hover)
+
+
+def downsample(data: pd.DataFrame, x_field: str, y_field: str, max_points: int) -> pd.DataFrame:
+    """Keep at most `max_points` rows, chosen to preserve the shape of the `y_field` line."""
+    indices = largest_triangle_three_buckets(
+        data[x_field].to_numpy(), data[y_field].to_numpy(), max_points
+    )
+    return data.iloc[indices]
@@ -1,11 +1,20 @@
 import altair as alt
 import pandas as pd
 
-from .util import hover_selection, interactive_points, tooltip_rule
+from .util import (
+    MAX_CHART_POINTS,
+    downsample,
+    hover_selection,
+    interactive_points,
+    tooltip_rule,
+)
 
 
-def create_velocity_chart(velocity_df: pd.DataFrame) -> alt.LayerChart:
-    """Create a velocity magnitude chart."""
+def create_velocity_chart(
+    velocity_df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> alt.LayerChart:
+    """Create a velocity magnitude chart, of `max_points` at most."""
+    velocity_df = downsample(velocity_df, "time", "velocity_norm", max_points)
     hover = hover_selection("time")
 
     lines = (
@@ -0,0 +1,33 @@
+from itertools import pairwise
+
+import numpy as np
+
+
+def largest_triangle_three_buckets(x: np.ndarray, y: np.ndarray, point_count: int) -> np.ndarray:
+    """
+    Select indices of `point_count` points preserving the visual shape of the (x, y) line.
+
+    The first and the last points are always kept, the others are split into buckets, one point
+    per bucket forming the largest triangle with the previously selected point and the average
+    of the next bucket is kept. All indices are returned if there are not more points than asked.
+    """
+    size = len(x)
+    if point_count >= size or point_count < 3:
+        return np.arange(size)
+
+    bounds = np.linspace(1, size - 1, point_count - 1).astype(int)
+    next_bounds = np.append(bounds[2:], size)
+    indices = np.empty(point_count, dtype=int)
+    indices[0], indices[-1] = 0, size - 1
+
+    for bucket, (start, end) in enumerate(pairwise(bounds), start=1):
+        previous = indices[bucket - 1]
+        next_x = x[end : next_bounds[bucket - 1]].mean()
+        next_y = y[end : next_bounds[bucket - 1]].mean()
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        indices[bucket] = start + int(area.argmax())
+
+    return indices
@@ -25,5 +25,6 @@ pages = [
     *lab_pages,
 ]
 
-nav = st.navigation(pages, position="sidebar", expanded=True)
-nav.run()
+if __name__ == "__main__":  # process pool workers import the script as __mp_main__
+    nav = st.navigation(pages, position="sidebar", expanded=True)
+    nav.run()
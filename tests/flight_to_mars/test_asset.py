@@ -0,0 +1,35 @@
+import base64
+import io
+
+import pytest
+import streamlit as st
+from PIL import Image
+
+from labs.flight_to_mars.visualization.asset import STATIC_URL, encode_image, image_source
+
+
+def _set_static_serving(monkeypatch: pytest.MonkeyPatch, *, enabled: bool) -> None:
+    get_option = st.get_option
+    monkeypatch.setattr(
+        st,
+        "get_option",
+        lambda key: enabled if key == "server.enableStaticServing" else get_option(key),
+    )
+
+
+def test_raster_image_is_downscaled_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_static_serving(monkeypatch, enabled=False)
+    source = image_source("Sun.png", pixel_size=20)
+    header, data = source.split(",")
+    with Image.open(io.BytesIO(base64.b64decode(data))) as image:
+        assert max(image.size) == 64
+
+    assert header == "data:image/png;base64"
+    assert image_source("Sun.png", pixel_size=30) is source
+    assert len(source) < len(encode_image("Sun.png")) / 50
+
+
+def test_static_serving_references_raster_images(monkeypatch: pytest.MonkeyPatch) -> None:
+    _set_static_serving(monkeypatch, enabled=True)
+    assert image_source("Sun.png", pixel_size=20) == f"{STATIC_URL}/Sun.png"
+    assert image_source("Earth.svg").startswith("data:image/svg+xml;base64,")
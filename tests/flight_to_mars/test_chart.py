@@ -0,0 +1,17 @@
+import numpy as np
+
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.visualization.chart import _time_axis
+
+ROCKET = Rocket(
+    x=0, y=1, velocity_x=0, velocity_y=0, netto_mass=1, fuel_mass=1, stream_velocity=4500
+)
+
+
+def test_time_axis_follows_logged_times() -> None:
+    time = np.array([4.0, 8.0, 12.0, 13.5])  # the last sample is an exact event
+    rocket_log = RocketLog.from_arrays(ROCKET, time, 0, 1, 0, 0, 0, 0, 2)
+
+    np.testing.assert_allclose(_time_axis(rocket_log), time)
+    np.testing.assert_allclose(_time_axis(rocket_log[::-1]), [0.0, 1.5, 5.5, 9.5])
@@ -1,8 +1,16 @@
+import math
+
+import numpy as np
 import pytest
 
 from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.criteria import AstronautMonitor
+from labs.flight_to_mars.stage.planet.ascent import simulate_ascent
 from labs.flight_to_mars.stage.planet.calculator import RocketFlightCalculator
-from labs.flight_to_mars.stage.planet.equation import fixed_acceleration_flight_equation
+from labs.flight_to_mars.stage.planet.equation import (
+    fixed_acceleration_flight_equation,
+    fixed_fuel_rate_flight_equation,
+)
 from labs.flight_to_mars.stage.planet.simulation import simulate_flight
 from labs.model.constant import EARTH_MASS, EARTH_RADIUS, G, g
 from tests.util import relative_error_check
@@ -73,3 +81,94 @@ def test_earth_stage_physics(
 
     assert last_rocket.velocity >= escape_velocity, "Rocket should escape Earth's gravity"
     assert relative_error_check(len(rockets) - 1, expected_time / sampling_delta, 0.01)
+
+
+@pytest.mark.parametrize("stop_on_death", [False, True])
+def test_earth_stage_overload(*, stop_on_death: bool) -> None:
+    initial_rocket = Rocket(
+        x=0,
+        y=EARTH_RADIUS,
+        velocity_x=0,
+        velocity_y=0,
+        netto_mass=4_000,
+        fuel_mass=96_000,
+        stream_velocity=4_500,
+        acceleration_x=0,
+        acceleration_y=6 * g,
+    )
+    calculator = RocketFlightCalculator(
+        initial_rocket, EARTH_MASS, fixed_acceleration_flight_equation
+    )
+    monitor = AstronautMonitor(1, stop_on_death=stop_on_death)
+    ascent_monitor = AstronautMonitor(1, stop_on_death=stop_on_death)
+
+    rockets = simulate_flight(calculator, 1, monitor)
+    ascent_rockets = simulate_ascent(initial_rocket, EARTH_MASS, 1, ascent_monitor)
+
+    assert monitor.is_dead_from_overload
+    assert not monitor.is_dead_from_hunger
+    assert math.isclose(monitor.max_acceleration, 6 * g)
+    assert monitor.sample_count == len(rockets)
+    assert (len(rockets) == 1) == stop_on_death
+    assert vars(ascent_monitor) == vars(monitor)
+    assert len(ascent_rockets) == len(rockets)
+
+
+@pytest.mark.parametrize(
+    ("initial_mass", "fuel_ratio", "acceleration", "stream_velocity"),
+    [
+        (100_000, 0.90,  3 * g, 6500),
+        (300_000, 0.98,  5 * g, 6000),
+        (80_000,  0.80,  1 * g, 1000),  # burns out before the escape
+        (80_000,  0.90,  1 * g, 4500),  # burns out before the escape
+        (80_000,  0.96, 10 * g, 4500),
+    ],
+)  # fmt: skip
+def test_ascent_matches_integration(
+    initial_mass: float, fuel_ratio: float, acceleration: float, stream_velocity: float
+) -> None:
+    initial_rocket = Rocket(
+        x=0,
+        y=EARTH_RADIUS,
+        velocity_x=0,
+        velocity_y=0,
+        netto_mass=initial_mass * (1 - fuel_ratio),
+        fuel_mass=initial_mass * fuel_ratio,
+        stream_velocity=stream_velocity,
+        acceleration_x=0,
+        acceleration_y=acceleration,
+    )
+    calculator = RocketFlightCalculator(
+        initial_rocket, EARTH_MASS, fixed_acceleration_flight_equation
+    )
+
+    expected_rockets = simulate_flight(calculator, 1)
+    rockets = simulate_ascent(initial_rocket, EARTH_MASS, 1)
+
+    assert len(rockets) == len(expected_rockets)
+    np.testing.assert_array_equal(rockets.time, expected_rockets.time)
+    for column in ("y", "velocity_y", "mass"):
+        np.testing.assert_allclose(
+            getattr(rockets, column), getattr(expected_rockets, column), rtol=1e-4
+        )
+
+
+def test_earth_stage_accepts_rocket_without_acceleration() -> None:
+    initial_rocket = Rocket(
+        x=0,
+        y=EARTH_RADIUS,
+        velocity_x=0,
+        velocity_y=0,
+        netto_mass=4_000,
+        fuel_mass=96_000,
+        stream_velocity=4_500,
+        fuel_consumption=800,
+    )
+    calculator = RocketFlightCalculator(initial_rocket, EARTH_MASS, fixed_fuel_rate_flight_equation)
+    monitor = AstronautMonitor(1)
+
+    rockets = simulate_flight(calculator, 1, monitor)
+
+    assert len(rockets) > 1
+    assert monitor.sample_count == len(rockets)
+    assert not monitor.is_dead_from_overload
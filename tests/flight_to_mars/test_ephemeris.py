@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.ephemeris import Ephemeris
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.model.constant import (
+    DAY,
+    EARTH_ORBITAL_VELOCITY,
+    HUMAN_EXPIRATION_TIME,
+    MARS_MASS,
+    MARS_ORBIT_RADIUS,
+    MARS_RADIUS,
+    SUN_MASS,
+    G,
+)
+
+from .util import EARTH, SUN, launch_rocket
+
+MARS_ORBITAL_VELOCITY = math.sqrt(G * SUN_MASS / MARS_ORBIT_RADIUS)
+
+
+def moving_planets(mars_angle: float) -> tuple[list[Planet], Ephemeris]:
+    """Place Mars at the angle from Sun and let Earth and Mars circle it."""
+    mars = Planet(
+        x=SUN.x + MARS_ORBIT_RADIUS * math.cos(mars_angle),
+        y=SUN.y + MARS_ORBIT_RADIUS * math.sin(mars_angle),
+        mass=MARS_MASS,
+        radius=MARS_RADIUS,
+    )
+    planets = [EARTH, mars, SUN]
+    velocities = [
+        (0, -EARTH_ORBITAL_VELOCITY),
+        (
+            -MARS_ORBITAL_VELOCITY * math.sin(mars_angle),
+            MARS_ORBITAL_VELOCITY * math.cos(mars_angle),
+        ),
+        (0, 0),
+    ]
+    return planets, Ephemeris.from_orbits(planets, velocities, SUN, HUMAN_EXPIRATION_TIME)
+
+
+def test_circular_orbit_interpolation() -> None:
+    _, ephemeris = moving_planets(0)
+    time = np.random.default_rng(42).uniform(0, HUMAN_EXPIRATION_TIME, 64)
+    angular_velocity = MARS_ORBITAL_VELOCITY / MARS_ORBIT_RADIUS
+
+    position, velocity = ephemeris.interpolate(time)
+
+    expected_position = np.stack(
+        (
+            SUN.x + MARS_ORBIT_RADIUS * np.cos(angular_velocity * time),
+            SUN.y + MARS_ORBIT_RADIUS * np.sin(angular_velocity * time),
+        ),
+        -1,
+    )
+    expected_velocity = MARS_ORBITAL_VELOCITY * np.stack(
+        (-np.sin(angular_velocity * time), np.cos(angular_velocity * time)), -1
+    )
+    np.testing.assert_allclose(position[:, 1], expected_position, rtol=0, atol=1)
+    np.testing.assert_allclose(velocity[:, 1], expected_velocity, rtol=0, atol=1e-3)
+    np.testing.assert_array_equal(position[:, 2], np.broadcast_to((SUN.x, SUN.y), (64, 2)))
+
+
+def test_kernel_follows_ephemeris() -> None:
+    planets, ephemeris = moving_planets(0)
+    points = np.random.default_rng(42).uniform(-3e11, 3e11, (16, 2))
+    moving_kernel = GravityKernel.from_planets(planets, ephemeris)
+
+    for time in (0, 30 * DAY, 0.3 * HUMAN_EXPIRATION_TIME):
+        moved_planets = [
+            Planet(x=x, y=y, mass=planet.mass, radius=planet.radius)
+            for planet, (x, y) in zip(planets, ephemeris(time), strict=True)
+        ]
+        np.testing.assert_allclose(
+            moving_kernel(points, time), GravityKernel.from_planets(moved_planets)(points)
+        )
+
+
+def test_flight_reaches_moving_mars() -> None:
+    planets, ephemeris = moving_planets(math.radians(-145))
+    mars = planets[1]
+    rocket = launch_rocket(12_083, math.radians(-72.19))
+
+    flight = propagate_interplanetary_flight(rocket, planets, mars, ephemeris=ephemeris)
+
+    assert flight.reached_planet
+    assert flight.flight_time < 100 * DAY
+    assert not propagate_interplanetary_flight(rocket, planets, mars).reached_planet
+    mars_x, mars_y, *_ = flight.planet_solution(mars)(flight.flight_time)
+    assert math.isclose(
+        math.hypot(flight.final_state[0] - mars_x, flight.final_state[1] - mars_y),
+        mars.orbit_radius,
+    )
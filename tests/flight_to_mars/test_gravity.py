@@ -0,0 +1,40 @@
+import numpy as np
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.model.constant import (
+    EARTH_MASS,
+    EARTH_ORBIT_RADIUS,
+    EARTH_RADIUS,
+    MARS_MASS,
+    MARS_ORBIT_RADIUS,
+    MARS_RADIUS,
+    SUN_MASS,
+    SUN_RADIUS,
+)
+
+PLANETS = [
+    Planet(x=0, y=0, mass=EARTH_MASS, radius=EARTH_RADIUS),
+    Planet(x=MARS_ORBIT_RADIUS, y=0, mass=MARS_MASS, radius=MARS_RADIUS),
+    Planet(x=-EARTH_ORBIT_RADIUS, y=0, mass=SUN_MASS, radius=SUN_RADIUS),
+]
+
+
+def test_kernel_matches_planet_gravity() -> None:
+    points = np.random.default_rng(42).uniform(-3e11, 3e11, (16, 2))
+    kernel = GravityKernel.from_planets(PLANETS)
+
+    for point in points:
+        gravities = [planet.calculate_gravity(*point) for planet in PLANETS]
+        expected_x = sum(gravity.x for gravity in gravities)
+        expected_y = sum(gravity.y for gravity in gravities)
+        np.testing.assert_allclose(kernel(point), [expected_x, expected_y], rtol=1e-12)
+
+    batch = kernel(points.reshape(4, 4, 2))
+    assert batch.shape == (4, 4, 2)
+    np.testing.assert_allclose(batch.reshape(16, 2), [kernel(point) for point in points])
+
+
+def test_kernel_ignores_body_center() -> None:
+    kernel = GravityKernel.from_planets(PLANETS[:1])
+    np.testing.assert_array_equal(kernel(np.zeros(2)), [0, 0])
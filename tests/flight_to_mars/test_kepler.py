@@ -0,0 +1,80 @@
+import math
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from labs.flight_to_mars.stage.space.equation import interplanetary_engine_off_equation
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.flight_to_mars.stage.space.kepler import KeplerOrbit
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.model.constant import DAY, HUMAN_EXPIRATION_TIME
+
+from .util import DEFAULT_ANGLE, DEFAULT_VELOCITY, EARTH, MARS, SUN, launch_rocket
+
+
+@pytest.mark.parametrize(
+    ("relative_velocity_norm", "angle_deg"),
+    [
+        (0,      0.0),    # Earth orbit
+        (11_300, -18.19),
+        (5_000,  120.0),  # retrograde ellipse
+        (40_000, 30.0),   # hyperbola
+    ],
+)  # fmt: skip
+def test_kepler_matches_integration(relative_velocity_norm: float, angle_deg: float) -> None:
+    rocket = launch_rocket(relative_velocity_norm, math.radians(angle_deg))
+    orbit = KeplerOrbit.from_rocket(rocket, SUN)
+    gravity = GravityKernel.from_planets([SUN])
+    time = np.linspace(0, HUMAN_EXPIRATION_TIME, 181)
+
+    expected = solve_ivp(
+        lambda _, state: interplanetary_engine_off_equation(state, gravity),
+        (0, HUMAN_EXPIRATION_TIME),
+        orbit(0),
+        method="DOP853",
+        t_eval=time,
+        rtol=1e-13,
+        atol=1e-6,
+    ).y
+    states = orbit(time)
+
+    assert states.shape == (4, time.size)
+    np.testing.assert_allclose(states[:2], expected[:2], rtol=0, atol=1e-9 * np.abs(expected).max())
+    np.testing.assert_allclose(states[2:], expected[2:], rtol=1e-8)
+
+
+def test_sun_only_flight_matches_integration() -> None:
+    """The pass through Mars orbit is shorter than solver steps, it must be found anyway."""
+    rocket = launch_rocket(13_000, math.radians(-10))
+    half_sun = replace(SUN, mass=SUN.mass / 2)
+
+    analytic = propagate_interplanetary_flight(rocket, [SUN], MARS)
+    numeric = propagate_interplanetary_flight(rocket, [half_sun, half_sun], MARS)
+
+    assert analytic.reached_planet
+    assert numeric.reached_planet
+    assert math.isclose(analytic.flight_time, numeric.flight_time, abs_tol=DAY / 1000)
+    np.testing.assert_allclose(analytic.final_state[:2], numeric.final_state[:2], atol=1e3)
+    np.testing.assert_allclose(analytic.final_state[2:], numeric.final_state[2:], rtol=1e-6)
+
+
+def test_kepler_escape_hyperbola_matches_integration() -> None:
+    """Far from periapsis the anomaly of the Earth escape overflows the elliptic guess."""
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    orbit = KeplerOrbit.from_rocket(rocket, EARTH)
+    gravity = GravityKernel.from_planets([EARTH])
+    time = np.linspace(0, 30 * DAY, 31)
+
+    expected = solve_ivp(
+        lambda _, state: interplanetary_engine_off_equation(state, gravity),
+        (0, 30 * DAY),
+        orbit(0),
+        method="DOP853",
+        t_eval=time,
+        rtol=1e-13,
+        atol=1e-6,
+    ).y
+
+    np.testing.assert_allclose(orbit(time), expected, rtol=1e-8)
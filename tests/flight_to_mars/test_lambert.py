@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.space.kepler import KeplerOrbit
+from labs.flight_to_mars.stage.space.lambert import solve_lambert
+from labs.flight_to_mars.stage.space.porkchop import compute_porkchop
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.model.constant import (
+    DAY,
+    EARTH_ORBIT_RADIUS,
+    EARTH_ORBITAL_VELOCITY,
+    MARS_MASS,
+    MARS_ORBIT_RADIUS,
+    MARS_RADIUS,
+    SUN_MASS,
+    SUN_RADIUS,
+    G,
+)
+from labs.model.vector import Vector2D
+
+SUN = Planet(x=0, y=0, mass=SUN_MASS, radius=SUN_RADIUS)
+MARS = Planet(x=MARS_ORBIT_RADIUS, y=0, mass=MARS_MASS, radius=MARS_RADIUS)
+
+
+def test_lambert_arcs_reach_arrival() -> None:
+    angle = np.radians(np.arange(-175, 180, 10))
+    flight_time = np.linspace(10, 300, 30) * DAY
+    departure = EARTH_ORBIT_RADIUS * np.stack((np.cos(angle), np.sin(angle)), -1)
+    arrival = np.array((MARS_ORBIT_RADIUS, 0))
+
+    transfer = solve_lambert(departure[:, np.newaxis], arrival, flight_time, G * SUN_MASS)
+
+    assert transfer.departure_velocity.shape == (angle.size, flight_time.size, 2)
+    for index in np.ndindex(angle.size, flight_time.size):
+        orbit = KeplerOrbit.from_state(
+            np.concatenate((departure[index[0]], transfer.departure_velocity[index])), SUN
+        )
+        state = orbit(flight_time[index[1]])
+        np.testing.assert_allclose(state[:2], arrival, rtol=0, atol=1e-9 * MARS_ORBIT_RADIUS)
+        np.testing.assert_allclose(state[2:], transfer.arrival_velocity[index], rtol=1e-6)
+
+
+def test_lambert_approaches_hohmann_transfer() -> None:
+    semi_major_axis = (EARTH_ORBIT_RADIUS + MARS_ORBIT_RADIUS) / 2
+    flight_time = math.pi * math.sqrt(semi_major_axis**3 / (G * SUN_MASS))
+    angle = math.radians(-179.99)
+
+    transfer = solve_lambert(
+        EARTH_ORBIT_RADIUS * np.array((math.cos(angle), math.sin(angle))),
+        (MARS_ORBIT_RADIUS, 0),
+        flight_time,
+        G * SUN_MASS,
+    )
+
+    velocity = math.sqrt(G * SUN_MASS * (2 / EARTH_ORBIT_RADIUS - 1 / semi_major_axis))
+    np.testing.assert_allclose(
+        transfer.departure_velocity, (0, -velocity), rtol=0, atol=velocity * 1e-3
+    )
+
+
+@pytest.mark.parametrize(
+    ("earth_position", "flight_time"),
+    [
+        (-142.5, 180),
+        (-87.5,  140),
+        (132.5,  90),
+    ],
+)  # fmt: skip
+def test_porkchop_launch_reaches_mars(earth_position: float, flight_time: float) -> None:
+    (transfer,) = compute_porkchop(
+        np.radians([earth_position]), np.array([flight_time]) * DAY
+    ).itertuples()
+
+    earth = Vector2D.from_polar(EARTH_ORBIT_RADIUS, math.radians(earth_position))
+    velocity = Vector2D.from_polar(
+        1000 * transfer.relative_velocity, math.radians(transfer.relative_angle)
+    ) + Vector2D.from_polar(EARTH_ORBITAL_VELOCITY, earth.angle + math.pi / 2)
+    rocket = Rocket(
+        x=earth.x,
+        y=earth.y,
+        velocity_x=velocity.x,
+        velocity_y=velocity.y,
+        netto_mass=0,
+        fuel_mass=0,
+        stream_velocity=0,
+        acceleration_x=0,
+        acceleration_y=0,
+    )
+    flight = propagate_interplanetary_flight(rocket, [SUN], MARS)
+
+    assert flight.reached_planet
+    # The orbit around Mars is entered a bit before reaching its center
+    assert flight_time - 1 < flight.flight_time / DAY <= flight_time
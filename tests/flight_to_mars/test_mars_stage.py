@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from labs.flight_to_mars.model.rocket import Rocket
@@ -55,3 +57,49 @@ def test_mars_stage_physics(
     achieved_altitude = max_altitude - MARS_RADIUS
 
     assert achieved_altitude >= 0, "Rocket should achieve positive altitude during simulation"
+
+
+@pytest.mark.parametrize(
+    ("initial_mass", "stream_velocity", "acceleration"),
+    [
+        (80_000, 1500, 2 * g),
+        (80_000, 1000, 4 * g),
+        (200_000, 6000, 4 * g),
+    ],
+)  # fmt: skip
+def test_mars_stage_stops_at_mass_budget(
+    initial_mass: float,
+    stream_velocity: float,
+    acceleration: float,
+) -> None:
+    initial_rocket = Rocket(
+        x=0,
+        y=MARS_RADIUS,
+        velocity_x=0,
+        velocity_y=0,
+        netto_mass=initial_mass / 25,
+        fuel_mass=1,
+        stream_velocity=stream_velocity * -1,
+        acceleration_x=0,
+        acceleration_y=acceleration,
+    )
+    raw_rockets = list(
+        simulate_flight(
+            RocketFlightCalculator(initial_rocket, MARS_MASS, fixed_acceleration_flight_equation),
+            1,
+        )
+    )
+    expected_rockets = [r for r in raw_rockets if r.mass <= initial_mass]
+
+    calculator = RocketFlightCalculator(
+        initial_rocket, MARS_MASS, fixed_acceleration_flight_equation, max_mass=initial_mass
+    )
+    rockets = list(simulate_flight(calculator, 1))
+
+    if calculator.reached_max_mass:
+        assert len(rockets) == len(expected_rockets) + 1
+        assert math.isclose(rockets[-1].mass, initial_mass)
+        assert expected_rockets[-1].y < rockets[-1].y < raw_rockets[len(rockets) - 1].y
+    else:
+        assert len(rockets) == len(expected_rockets) == len(raw_rockets)
+    assert [r.y for r in rockets[: len(expected_rockets)]] == [r.y for r in expected_rockets]
@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from labs.flight_to_mars.model.flight import PropagationType
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.event import find_first_crossing
+from labs.flight_to_mars.stage.space.patched_conic import (
+    propagate_patched_conics,
+    sphere_of_influence,
+)
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.model.constant import DAY, HUMAN_EXPIRATION_TIME
+
+from .util import DEFAULT_ANGLE, DEFAULT_VELOCITY, EARTH, MARS, PLANETS, SUN, launch_rocket
+
+
+@pytest.mark.parametrize(
+    ("planet", "expected_radius"),
+    [
+        (EARTH, 9.25e8),
+        (MARS,  5.20e8),
+    ],
+)  # fmt: skip
+def test_sphere_of_influence(planet: Planet, expected_radius: float) -> None:
+    assert math.isclose(sphere_of_influence(planet, SUN), expected_radius, rel_tol=1e-2)
+
+
+def test_patched_conics_switch_bodies_continuously() -> None:
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    state = np.array((rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y))
+
+    solution = propagate_patched_conics(state, PLANETS, HUMAN_EXPIRATION_TIME)
+
+    assert [leg.body for leg in solution.legs] == [EARTH, SUN, MARS, SUN]
+    assert solution.legs[-1].end == HUMAN_EXPIRATION_TIME
+    np.testing.assert_allclose(solution(0), state)
+    for previous, leg in zip(solution.legs, solution.legs[1:], strict=False):
+        assert previous.end == leg.start
+        np.testing.assert_allclose(previous.orbit(previous.end - previous.start), leg.orbit(0))
+
+
+def test_patched_conics_approximate_n_body() -> None:
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    flights = {
+        propagation: propagate_interplanetary_flight(rocket, PLANETS, MARS, propagation)
+        for propagation in PropagationType
+    }
+    radius = sphere_of_influence(MARS, SUN)
+
+    arrival_times = [
+        find_first_crossing(
+            flight.solution,
+            0,
+            HUMAN_EXPIRATION_TIME,
+            lambda x, y: np.hypot(x - MARS.x, y - MARS.y) - radius,
+        )
+        for flight in flights.values()
+    ]
+
+    assert arrival_times[0] is not None
+    assert arrival_times[1] is not None
+    assert abs(arrival_times[0] - arrival_times[1]) < 2 * DAY
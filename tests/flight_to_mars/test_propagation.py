@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.stage.space.calculator import RocketInterplanetaryFlightCalculator
+from labs.flight_to_mars.stage.space.equation import interplanetary_engine_off_equation
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.flight_to_mars.stage.space.simulation import simulate_interplanetary_flight
+from labs.model.constant import DAY, HUMAN_EXPIRATION_TIME, SUN_MASS, SUN_RADIUS
+
+from .util import (
+    DEFAULT_ANGLE,
+    DEFAULT_VELOCITY,
+    MARS,
+    PLANETS,
+    SAMPLING_DELTA,
+    SUN,
+    launch_rocket,
+)
+
+
+@pytest.mark.parametrize(
+    ("relative_velocity_norm", "angle_deg", "reached_planet"),
+    [
+        (11_300, -18.19, True),
+        (10_000, 0.0, False),
+    ],
+)  # fmt: skip
+def test_propagation_stops_at_events(
+    relative_velocity_norm: float,
+    angle_deg: float,
+    reached_planet: bool,  # noqa: FBT001
+) -> None:
+    rocket = launch_rocket(relative_velocity_norm, math.radians(angle_deg))
+    flight = propagate_interplanetary_flight(rocket, PLANETS, MARS)
+    rockets = flight.sample(SAMPLING_DELTA)
+
+    assert flight.reached_planet == reached_planet
+    assert len(rockets) == math.ceil(flight.flight_time / SAMPLING_DELTA) + 1
+    if reached_planet:
+        assert flight.flight_time < HUMAN_EXPIRATION_TIME
+        assert math.isclose(
+            math.hypot(rockets[-1].x - MARS.x, rockets[-1].y - MARS.y), MARS.orbit_radius
+        )
+    else:
+        assert flight.flight_time == HUMAN_EXPIRATION_TIME
+
+
+def test_propagation_matches_stepwise_simulation() -> None:
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    sample_count = 30 * DAY // SAMPLING_DELTA
+
+    rockets = propagate_interplanetary_flight(rocket, PLANETS, MARS).sample(SAMPLING_DELTA)
+    stepwise_rockets = list(
+        simulate_interplanetary_flight(
+            RocketInterplanetaryFlightCalculator(
+                rocket, interplanetary_engine_off_equation, PLANETS
+            ),
+            SAMPLING_DELTA,
+            MARS,
+        )
+    )
+
+    # The stepwise simulation does not yield its first step
+    np.testing.assert_allclose(
+        [(r.x, r.y) for r in rockets[2:sample_count]],
+        [(r.x, r.y) for r in stepwise_rockets[1 : sample_count - 1]],
+        rtol=1e-4,
+    )
+
+
+def test_propagation_catches_pass_between_steps() -> None:
+    # Steps are days long far from the planets, the pass through Mars orbit takes hours
+    half_sun = Planet(x=SUN.x, y=SUN.y, mass=SUN_MASS / 2, radius=SUN_RADIUS)
+    rocket = launch_rocket(13_000, math.radians(-10))
+
+    flight = propagate_interplanetary_flight(rocket, [half_sun, half_sun], MARS)
+
+    assert flight.reached_planet
+    assert flight.flight_time < 150 * DAY
+    assert math.isclose(
+        math.hypot(flight.final_state[0] - MARS.x, flight.final_state[1] - MARS.y),
+        MARS.orbit_radius,
+    )
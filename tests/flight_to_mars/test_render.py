@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from labs.flight_to_mars.model.rocket_log import RocketLog
+from labs.flight_to_mars.visualization.render import MAX_FRAME_COUNT, decimate, render_animation
+
+from .util import launch_rocket
+
+
+@pytest.mark.parametrize(
+    ("sample_count", "frame_count", "expected"),
+    [
+        (1,  8, [0]),
+        (5,  8, [0, 1, 2, 3, 4]),
+        (9,  3, [0, 4, 8]),
+        (10, 4, [0, 3, 6, 9]),
+    ],
+)  # fmt: skip
+def test_decimate(sample_count: int, frame_count: int, expected: list[int]) -> None:
+    np.testing.assert_array_equal(decimate(sample_count, frame_count), expected)
+
+
+@pytest.mark.parametrize("sample_count", [10, 10_000, 100_000])
+def test_animation_size_is_bounded(sample_count: int) -> None:
+    time = np.arange(sample_count, dtype=float)
+    rockets = RocketLog.from_arrays(launch_rocket(11_300, 0), time, time, time, 1, 1, 0, 0, 1)
+
+    figure = render_animation(rockets, 1, [{"x": 0, "y": 0}], duration=1000)
+
+    assert len(figure.frames) == min(sample_count, MAX_FRAME_COUNT)
+    assert len(figure.to_json()) < 2**17
+    assert figure.frames[-1].data[0].x.max() > sample_count - 2
+    play_button = figure.layout.updatemenus[0].buttons[0]
+    assert play_button.args[1]["frame"]["duration"] == 1000 // len(figure.frames)
@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.model.rocket_log import RocketLog
+
+ROCKET = Rocket(
+    x=1,
+    y=2,
+    velocity_x=3,
+    velocity_y=4,
+    netto_mass=10,
+    fuel_mass=5,
+    stream_velocity=4500,
+    acceleration_x=-6,
+    acceleration_y=8,
+)
+
+
+def test_append_grows_capacity() -> None:
+    rocket_log = RocketLog.for_rocket(ROCKET, capacity=2)
+    for i in range(5):
+        rocket_log.append(i, i, 2 * i, 3, 4, -6, 8, 15 - i)
+
+    assert len(rocket_log) == 5
+    np.testing.assert_allclose(rocket_log.y, [0, 2, 4, 6, 8])
+    np.testing.assert_allclose(rocket_log.velocity, 5)
+    np.testing.assert_allclose(rocket_log.acceleration, 10)
+    np.testing.assert_allclose(rocket_log.fuel_mass, [5, 4, 3, 2, 1])
+    assert rocket_log.data.nbytes == 64 * len(rocket_log)
+
+
+def test_rocket_view_matches_rocket() -> None:
+    rocket_log = RocketLog.from_arrays(ROCKET, *np.array([[0.0, 1, 2, 3, 4, -6, 8]]).T, ROCKET.mass)
+
+    (rocket,) = rocket_log
+    assert rocket == ROCKET
+    assert rocket_log[-1] == ROCKET
+    assert math.isclose(rocket_log.angle[0], ROCKET.angle)
+
+
+def test_slice_shares_samples() -> None:
+    rocket_log = RocketLog.from_arrays(ROCKET, *np.arange(35.0).reshape(7, 5), ROCKET.mass)
+
+    reversed_log = rocket_log[::-1]
+    assert len(reversed_log) == 5
+    assert np.shares_memory(reversed_log.data, rocket_log.data)
+    np.testing.assert_array_equal(reversed_log.x, rocket_log.x[::-1])
+    assert reversed_log[0] == rocket_log[-1]
+    assert reversed_log.netto_mass == ROCKET.netto_mass
@@ -0,0 +1,16 @@
+import math
+
+import numpy as np
+
+from labs.flight_to_mars.visualization.entity import rocket_outline
+
+
+def test_outline_broadcasts_positions() -> None:
+    x, y, angle = np.linspace(-1, 1, 5), 2.0, np.linspace(0, math.pi, 5)
+
+    outlines = rocket_outline(x, y, angle)
+
+    assert outlines.shape[0] == 5
+    np.testing.assert_array_equal(outlines[:, 0], outlines[:, -1])
+    for outline, *position in zip(outlines, x, np.broadcast_to(y, 5), angle, strict=True):
+        np.testing.assert_allclose(outline, rocket_outline(*position))
@@ -107,3 +107,24 @@ def test_space_stage_physics(
                 f"expected {expected_initial_velocity}, "
                 f"got ({actual_rocket.velocity_x}, {actual_rocket.velocity_y})"
             )
+
+
+def test_space_stage_accepts_rocket_without_acceleration() -> None:
+    rocket = Rocket(
+        x=EARTH_ORBIT_RADIUS + EARTH_RADIUS + 2_336_000,
+        y=0,
+        velocity_x=0,
+        velocity_y=EARTH_ORBITAL_VELOCITY + 11_300,
+        netto_mass=0,
+        fuel_mass=0,
+        stream_velocity=0,
+    )
+    mars = Planet(x=MARS_ORBIT_RADIUS, y=0, mass=MARS_MASS, radius=MARS_RADIUS)
+    sun = Planet(x=0, y=0, mass=SUN_MASS, radius=SUN_RADIUS)
+    calculator = RocketInterplanetaryFlightCalculator(
+        rocket, interplanetary_engine_off_equation, [mars, sun]
+    )
+
+    rocket_log = simulate_interplanetary_flight(calculator, 60 * 60 * 4, target_planet=mars)
+
+    assert len(rocket_log) > 1
@@ -0,0 +1,67 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from labs.flight_to_mars.model.flight import IntegratorType
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.flight_to_mars.stage.space.calculator import RocketInterplanetaryFlightCalculator
+from labs.flight_to_mars.stage.space.equation import interplanetary_engine_off_equation
+from labs.flight_to_mars.stage.space.gravity import GravityKernel
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.model.constant import DAY
+
+from .util import DEFAULT_ANGLE, DEFAULT_VELOCITY, MARS, PLANETS, SAMPLING_DELTA, launch_rocket
+
+COAST_DURATION = 120 * DAY
+
+
+def _coasting_rocket() -> Rocket:
+    """Rocket far enough from Earth for fixed steps of hours to make sense."""
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE)
+    x, y, velocity_x, velocity_y = propagate_interplanetary_flight(rocket, PLANETS, MARS).solution(
+        5 * DAY
+    )
+    return replace(rocket, x=x, y=y, velocity_x=velocity_x, velocity_y=velocity_y)
+
+
+@pytest.mark.parametrize(
+    ("integrator", "max_step", "energy_error"),
+    [
+        (IntegratorType.LEAPFROG, 4 * 60 * 60, 10 ** (-5)),
+        (IntegratorType.YOSHIDA,  4 * 60 * 60, 10 ** (-9)),
+    ],
+)  # fmt: skip
+def test_symplectic_energy_is_bounded(
+    integrator: IntegratorType, max_step: float, energy_error: float
+) -> None:
+    rocket = _coasting_rocket()
+    gravity = GravityKernel.from_planets(PLANETS)
+    calculator = RocketInterplanetaryFlightCalculator(
+        rocket, interplanetary_engine_off_equation, PLANETS, integrator, max_step
+    )
+
+    def energy(state: np.ndarray) -> float:
+        return 0.5 * state[2:] @ state[2:] + gravity.potential(state[:2])
+
+    initial_energy = energy(calculator.state)
+    for _ in range(int(COAST_DURATION // SAMPLING_DELTA)):
+        calculator(SAMPLING_DELTA)
+        assert abs(energy(calculator.state) / initial_energy - 1) < energy_error
+
+
+def test_yoshida_matches_dopri5() -> None:
+    rocket = _coasting_rocket()
+    calculators = [
+        RocketInterplanetaryFlightCalculator(
+            rocket, interplanetary_engine_off_equation, PLANETS, integrator
+        )
+        for integrator in (IntegratorType.DOPRI5, IntegratorType.YOSHIDA)
+    ]
+
+    for _ in range(int(COAST_DURATION // SAMPLING_DELTA)):
+        dopri5_rocket, yoshida_rocket = (calculator(SAMPLING_DELTA) for calculator in calculators)
+
+    np.testing.assert_allclose(
+        (yoshida_rocket.x, yoshida_rocket.y), (dopri5_rocket.x, dopri5_rocket.y), rtol=1e-7
+    )
@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+from labs.flight_to_mars.model.flight import PropagationType
+from labs.flight_to_mars.stage.space.propagation import propagate_interplanetary_flight
+from labs.flight_to_mars.stage.space.targeting import (
+    MAX_PROPAGATION_COUNT,
+    closest_approach,
+    target_planet,
+)
+
+from .util import DEFAULT_ANGLE, DEFAULT_VELOCITY, MARS, PLANETS, launch_rocket
+
+BOUNDS = ((10_000, 20_000), (-math.pi / 2, math.pi / 2))
+
+
+@pytest.mark.parametrize(
+    ("relative_velocity_norm", "angle_deg"),
+    [
+        (11_300, -17.5),
+        (11_600, -19.0),
+        (12_000, -10.0),
+    ],
+)  # fmt: skip
+def test_targeting_reaches_mars(relative_velocity_norm: float, angle_deg: float) -> None:
+    guess = launch_rocket(relative_velocity_norm, math.radians(angle_deg))
+    assert not propagate_interplanetary_flight(guess, PLANETS, MARS).reached_planet
+
+    result = target_planet(
+        launch_rocket, PLANETS, MARS, relative_velocity_norm, math.radians(angle_deg), BOUNDS
+    )
+
+    assert result.reached_planet
+    assert result.propagation_count <= MAX_PROPAGATION_COUNT
+    flight = propagate_interplanetary_flight(
+        launch_rocket(result.relative_velocity, result.angle), PLANETS, MARS
+    )
+    assert flight.reached_planet
+    assert math.isclose(result.approach_distance, MARS.orbit_radius)
+
+
+def test_closest_approach_of_missed_flight() -> None:
+    flight = propagate_interplanetary_flight(
+        launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE + math.radians(0.5)), PLANETS, MARS
+    )
+    sampled_approach = min(
+        math.hypot(rocket.x - MARS.x, rocket.y - MARS.y) for rocket in flight.sample(60)
+    )
+
+    assert not flight.reached_planet
+    assert math.isclose(closest_approach(flight, MARS), sampled_approach, rel_tol=1e-6)
+
+
+@pytest.mark.parametrize("propagation", list(PropagationType))
+def test_missed_flight_stops_at_closest_approach(propagation: PropagationType) -> None:
+    rocket = launch_rocket(DEFAULT_VELOCITY, DEFAULT_ANGLE + math.radians(0.5))
+    flight = propagate_interplanetary_flight(rocket, PLANETS, MARS, propagation)
+    stopped_flight = propagate_interplanetary_flight(
+        rocket, PLANETS, MARS, propagation, stop_at_closest_approach=True
+    )
+    x, y, _, _ = stopped_flight.final_state
+
+    assert not stopped_flight.reached_planet
+    assert stopped_flight.flight_time < flight.flight_time
+    assert math.isclose(
+        math.hypot(x - MARS.x, y - MARS.y), closest_approach(flight, MARS), rel_tol=1e-6
+    )
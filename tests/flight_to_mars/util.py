@@ -0,0 +1,44 @@
+import math
+
+from labs.flight_to_mars.model.planet import Planet
+from labs.flight_to_mars.model.rocket import Rocket
+from labs.model.constant import (
+    EARTH_MASS,
+    EARTH_ORBIT_RADIUS,
+    EARTH_ORBITAL_VELOCITY,
+    EARTH_RADIUS,
+    MARS_MASS,
+    MARS_ORBIT_RADIUS,
+    MARS_RADIUS,
+    SUN_MASS,
+    SUN_RADIUS,
+)
+from labs.model.vector import Vector2D
+
+# The page default: Earth is at -180 deg from Sun, so Mars is behind Sun
+EARTH = Planet(x=0, y=0, mass=EARTH_MASS, radius=EARTH_RADIUS)
+MARS = Planet(x=EARTH_ORBIT_RADIUS + MARS_ORBIT_RADIUS, y=0, mass=MARS_MASS, radius=MARS_RADIUS)
+SUN = Planet(x=EARTH_ORBIT_RADIUS, y=0, mass=SUN_MASS, radius=SUN_RADIUS)
+PLANETS = [EARTH, MARS, SUN]
+
+DEFAULT_VELOCITY = 11_300
+DEFAULT_ANGLE = math.radians(-18.19)
+SAMPLING_DELTA = 4 * 60 * 60
+
+
+def launch_rocket(relative_velocity_norm: float, angle: float) -> Rocket:
+    velocity = Vector2D.from_polar(relative_velocity_norm, angle) + Vector2D(
+        0, -EARTH_ORBITAL_VELOCITY
+    )
+    start = Vector2D.from_polar(EARTH_RADIUS + 2_336_000, velocity.angle)
+    return Rocket(
+        x=start.x,
+        y=start.y,
+        velocity_x=velocity.x,
+        velocity_y=velocity.y,
+        netto_mass=0,
+        fuel_mass=0,
+        stream_velocity=0,
+        acceleration_x=0,
+        acceleration_y=0,
+    )
@@ -0,0 +1,26 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from labs.model.enum import CorrelationType
+from labs.throw_a_rock.acceleration import DragParameters, acceleration_law_by_resistance_type
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+def test_acceleration_law_is_array_aware(correlation_type: CorrelationType) -> None:
+    law = acceleration_law_by_resistance_type[correlation_type](DragParameters(0.5, 2))
+    velocity = np.linspace(-30, 30, 7)
+
+    np.testing.assert_allclose(law.x(velocity), [law.x(float(v)) for v in velocity])
+    np.testing.assert_allclose(law.y(velocity), [law.y(float(v)) for v in velocity])
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+def test_acceleration_law_can_be_sent_to_worker_process(correlation_type: CorrelationType) -> None:
+    law = acceleration_law_by_resistance_type[correlation_type](DragParameters(0.5, 2))
+    restored = pickle.loads(pickle.dumps(law))  # noqa: S301
+
+    assert restored.parameters == law.parameters
+    assert restored.x(10.0) == law.x(10.0)
+    assert restored.y(10.0) == law.y(10.0)
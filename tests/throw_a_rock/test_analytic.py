@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from labs.model.enum import CorrelationType
+from labs.model.vector import Vector2D
+from labs.throw_a_rock.acceleration import DragParameters
+from labs.throw_a_rock.motion.analytic import solve_linear_drag_flight
+
+from .util import SAMPLING_DELTA, assert_accuracy, solve_coupled
+
+
+@pytest.mark.parametrize(
+    (
+        "initial_velocity",
+        "angle",
+        "mass",
+        "resistance_rate",
+        "expected_flight_time",
+        "expected_flight_distance",
+    ),
+    [
+        (42,   42,  4.2,   0.42,  5.27,     127.83),
+        (69,   69,  6.9,   0.69,  11.12,    165.91),
+        (228,  28,  2.28,  0.28,  16.56,    1424.79),
+        (42,   42,  1,     0,     5.73,     178.83),
+        (69,   69,  1,     0,     13.13,    324.74),
+        (228,  28,  1,     0,     21.82,    4393.13),
+    ],
+)  # fmt: skip
+def test_analytic_linear(
+    initial_velocity: float,
+    angle: float,
+    mass: float,
+    resistance_rate: float,
+    expected_flight_time: float,
+    expected_flight_distance: float,
+) -> None:
+    flight = solve_linear_drag_flight(
+        Vector2D.from_polar(initial_velocity, math.radians(angle)), resistance_rate / mass
+    )
+    trajectory = flight.sample(SAMPLING_DELTA)
+
+    assert trajectory.grounding_point == flight.grounding_point
+    assert_accuracy(
+        flight.flight_time,
+        flight.grounding_point.x,
+        expected_flight_time,
+        expected_flight_distance,
+    )
+
+
+@pytest.mark.parametrize(
+    ("initial_velocity", "angle", "mass", "resistance_rate"),
+    [
+        (30,   30,   1,     0.5),
+        (343,  0.1,  0.01,  2),
+        (343,  89,   10,    0.01),
+        (0.1,  45,   10,    0.01),
+    ],
+)  # fmt: skip
+def test_analytic_matches_coupled(
+    initial_velocity: float,
+    angle: float,
+    mass: float,
+    resistance_rate: float,
+) -> None:
+    parameters = DragParameters(resistance_rate=resistance_rate, mass=mass)
+    coupled = solve_coupled(initial_velocity, angle, CorrelationType.LINEAR, parameters)
+    analytic = solve_linear_drag_flight(
+        Vector2D.from_polar(initial_velocity, math.radians(angle)), resistance_rate / mass
+    )
+
+    assert math.isclose(analytic.flight_time, coupled.flight_time, rel_tol=1e-6)
+    assert math.isclose(analytic.grounding_point.x, coupled.grounding_point.x, rel_tol=1e-6)
+
+    time = np.linspace(0, coupled.flight_time, 16)
+    point, velocity = analytic.evaluate(time)
+    np.testing.assert_allclose(
+        np.vstack((point, velocity)), coupled.dense_solution(time), rtol=1e-6, atol=1e-6
+    )
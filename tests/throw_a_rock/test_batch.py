@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from labs.model.enum import CorrelationType
+from labs.throw_a_rock import simulate_throws
+from labs.throw_a_rock.acceleration import DragParameters
+
+from .util import assert_accuracy, solve_coupled
+
+
+def test_batch_linear() -> None:
+    batch = simulate_throws(
+        velocity=[42, 69, 228, 42, 69, 228],
+        angle=np.radians([42, 69, 28, 42, 69, 28]),
+        mass=[4.2, 6.9, 2.28, 1, 1, 1],
+        resistance_rate=[0.42, 0.69, 0.28, 0, 0, 0],
+        resistance_type=CorrelationType.LINEAR,
+    )
+    expected_flight_time = [5.27, 11.12, 16.56, 5.73, 13.13, 21.82]
+    expected_flight_distance = [127.83, 165.91, 1424.79, 178.83, 324.74, 4393.13]
+
+    for values in zip(
+        batch.flight_time,
+        batch.flight_distance,
+        expected_flight_time,
+        expected_flight_distance,
+        strict=True,
+    ):
+        assert_accuracy(*values)
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+def test_batch_matches_single_throws(correlation_type: CorrelationType) -> None:
+    rng = np.random.default_rng(42)
+    velocity = rng.uniform(0.1, 343, 16)
+    angle = rng.uniform(0.1, 90, 16)
+    mass = rng.uniform(0.01, 10, 16)
+    resistance_rate = rng.uniform(0, 2, 16)
+
+    batch = simulate_throws(velocity, np.radians(angle), mass, resistance_rate, correlation_type)
+
+    for i in range(16):
+        flight = solve_coupled(
+            velocity[i], angle[i], correlation_type, DragParameters(resistance_rate[i], mass[i])
+        )
+        assert math.isclose(batch.flight_time[i], flight.flight_time, rel_tol=1e-6)
+        assert math.isclose(batch.flight_distance[i], flight.grounding_point.x, rel_tol=1e-6)
+
+
+def test_batch_broadcasts_inputs() -> None:
+    batch = simulate_throws(
+        velocity=[[10], [20]],
+        angle=np.radians([0, 30, 60]),
+        mass=1,
+        resistance_rate=0.5,
+        resistance_type=CorrelationType.QUADRATIC,
+    )
+
+    assert batch.flight_time.shape == (2, 3)
+    assert (batch.flight_time[:, 0] == 0).all()
+    assert (batch.flight_distance[:, 0] == 0).all()
+    assert (batch.flight_time[1, 1:] > batch.flight_time[0, 1:]).all()
@@ -0,0 +1,130 @@
+import pytest
+
+from labs.model.enum import CorrelationType
+from labs.throw_a_rock.acceleration import DragParameters
+
+from ..util import relative_error_check
+from .util import (
+    assert_accuracy,
+    compute_coupled_trajectory,
+    compute_trajectory,
+    solve_coupled,
+)
+
+STEPWISE_RELATIVE_ERROR = 10 ** (-2)
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+@pytest.mark.parametrize(
+    ("initial_velocity", "angle", "expected_flight_time", "expected_flight_distance"),
+    [
+        (42,   42,  5.73,   178.83),
+        (69,   69,  13.13,  324.74),
+        (228,  28,  21.82,  4393.13),
+    ],
+)  # fmt: skip
+def test_coupled_simple(
+    initial_velocity: float,
+    angle: float,
+    expected_flight_time: float,
+    expected_flight_distance: float,
+    correlation_type: CorrelationType,
+) -> None:
+    parameters = DragParameters(resistance_rate=0, mass=1)
+    trajectory = compute_coupled_trajectory(initial_velocity, angle, correlation_type, parameters)
+
+    flight_distance = trajectory.grounding_point.x
+    flight_time = trajectory.flight_time
+
+    assert_accuracy(flight_time, flight_distance, expected_flight_time, expected_flight_distance)
+
+
+@pytest.mark.parametrize(
+    (
+        "initial_velocity",
+        "angle",
+        "mass",
+        "resistance_rate",
+        "expected_flight_time",
+        "expected_flight_distance",
+    ),
+    [
+        (42,   42,  4.2,   0.42,  5.27,   127.83),
+        (69,   69,  6.9,   0.69,  11.12,  165.91),
+        (228,  28,  2.28,  0.28,  16.56,  1424.79),
+    ],
+)  # fmt: skip
+def test_coupled_linear(
+    initial_velocity: float,
+    angle: float,
+    mass: float,
+    resistance_rate: float,
+    expected_flight_time: float,
+    expected_flight_distance: float,
+) -> None:
+    parameters = DragParameters(resistance_rate=resistance_rate, mass=mass)
+    trajectory = compute_coupled_trajectory(
+        initial_velocity, angle, CorrelationType.LINEAR, parameters
+    )
+
+    flight_distance = trajectory.grounding_point.x
+    flight_time = trajectory.flight_time
+
+    assert_accuracy(flight_time, flight_distance, expected_flight_time, expected_flight_distance)
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+def test_coupled_matches_stepwise(correlation_type: CorrelationType) -> None:
+    parameters = DragParameters(resistance_rate=0.5, mass=1)
+    coupled = compute_coupled_trajectory(30, 30, correlation_type, parameters)
+    stepwise = compute_trajectory(30, 30, correlation_type, parameters)
+
+    # stepwise solver moves the point with the velocity at the end of each step, hence the bias
+    assert abs(len(coupled) - len(stepwise)) <= 1
+    assert relative_error_check(
+        coupled.flight_time,
+        stepwise.flight_time,
+        STEPWISE_RELATIVE_ERROR,
+    )
+    assert relative_error_check(
+        coupled.grounding_point.x, stepwise.grounding_point.x, STEPWISE_RELATIVE_ERROR
+    )
+
+
+@pytest.mark.parametrize("sampling_delta", [2 ** (-10), 2 ** (-4), 1.0, 4.0])
+@pytest.mark.parametrize(
+    (
+        "initial_velocity",
+        "angle",
+        "mass",
+        "resistance_rate",
+        "expected_flight_time",
+        "expected_flight_distance",
+    ),
+    [
+        (42,   42,  4.2,   0.42,  5.27,   127.83),
+        (228,  28,  2.28,  0.28,  16.56,  1424.79),
+    ],
+)  # fmt: skip
+def test_ground_impact_does_not_depend_on_sampling(
+    initial_velocity: float,
+    angle: float,
+    mass: float,
+    resistance_rate: float,
+    expected_flight_time: float,
+    expected_flight_distance: float,
+    sampling_delta: float,
+) -> None:
+    parameters = DragParameters(resistance_rate=resistance_rate, mass=mass)
+    flight = solve_coupled(initial_velocity, angle, CorrelationType.LINEAR, parameters)
+    trajectory = flight.sample(sampling_delta)
+
+    assert trajectory.grounding_point == flight.grounding_point
+    assert trajectory.grounding_point.y == 0
+    assert (trajectory.y >= 0).all()
+    assert_accuracy(
+        flight.flight_time,
+        trajectory.grounding_point.x,
+        expected_flight_time,
+        expected_flight_distance,
+    )
@@ -1,10 +1,9 @@
 import pytest
-import streamlit as st
 
 from labs.model.enum import CorrelationType
-from labs.throw_a_rock.motion.compute import compute_flight_time
+from labs.throw_a_rock.acceleration import DragParameters
 
-from .util import SAMPLING_DELTA, assert_accuracy, compute_trajectory
+from .util import assert_accuracy, compute_trajectory
 
 
 @pytest.mark.parametrize(
@@ -29,13 +28,11 @@ def test_linear(
     resistance_rate: float,
     expected_flight_time: float,
     expected_flight_distance: float,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setitem(st.session_state, "air_resistance_rate", resistance_rate)
-    monkeypatch.setitem(st.session_state, "rock_mass", mass)
-    trajectory = compute_trajectory(initial_velocity, angle, CorrelationType.LINEAR)
+    parameters = DragParameters(resistance_rate=resistance_rate, mass=mass)
+    trajectory = compute_trajectory(initial_velocity, angle, CorrelationType.LINEAR, parameters)
 
-    flight_distance = trajectory[-1][0].x
-    flight_time = compute_flight_time(trajectory, SAMPLING_DELTA)
+    flight_distance = trajectory.grounding_point.x
+    flight_time = trajectory.flight_time
 
     assert_accuracy(flight_time, flight_distance, expected_flight_time, expected_flight_distance)
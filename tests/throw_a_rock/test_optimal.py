@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from labs.model.constant import g
+from labs.model.enum import CorrelationType
+from labs.model.vector import Vector2D
+from labs.throw_a_rock.acceleration import DragParameters
+from labs.throw_a_rock.motion.flight import solve_flight
+from labs.throw_a_rock.motion.optimal import find_optimal_angle
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+@pytest.mark.parametrize("initial_velocity", [1, 42, 228])
+def test_optimal_angle_without_resistance(
+    initial_velocity: float, correlation_type: CorrelationType
+) -> None:
+    optimal = find_optimal_angle(initial_velocity, correlation_type, DragParameters(0, 1))
+
+    assert math.isclose(math.degrees(optimal.angle), 45, abs_tol=1e-2)
+    assert math.isclose(optimal.flight_distance, initial_velocity**2 / g, rel_tol=1e-6)
+    assert optimal.simulation_count < 20
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+@pytest.mark.parametrize(("mass", "resistance_rate"), [(1, 0.5), (0.1, 2), (10, 0.01)])
+def test_optimal_angle_with_resistance(
+    mass: float, resistance_rate: float, correlation_type: CorrelationType
+) -> None:
+    parameters = DragParameters(resistance_rate, mass)
+    optimal = find_optimal_angle(30, correlation_type, parameters)
+
+    assert optimal.angle < math.radians(45)
+    for delta in (-1, 1):
+        neighbour = solve_flight(
+            Vector2D.from_polar(30, optimal.angle + math.radians(delta)),
+            correlation_type,
+            parameters,
+        )
+        assert neighbour.grounding_point.x < optimal.flight_distance
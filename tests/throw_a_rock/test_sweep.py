@@ -0,0 +1,62 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from labs.model.enum import CorrelationType
+from labs.throw_a_rock import simulate_throws
+from labs.throw_a_rock.acceleration import DragParameters
+from labs.throw_a_rock.motion.sweep import sweep_throws
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_sweep_matches_batch(
+    correlation_type: CorrelationType,
+    use_executor: bool,  # noqa: FBT001
+) -> None:
+    velocity = np.linspace(1, 343, 7)
+    angle = np.radians(np.linspace(0.5, 90, 5))
+    parameters = DragParameters(resistance_rate=0.5, mass=1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        chunks = list(
+            sweep_throws(
+                velocity,
+                angle,
+                correlation_type,
+                parameters,
+                executor=executor if use_executor else None,
+                chunk_count=3,
+            )
+        )
+    sweep_df = pd.concat(chunks).sort_values(["velocity", "angle"])
+
+    batch = simulate_throws(velocity[:, None], angle, 1, 0.5, correlation_type)
+
+    assert len(chunks) == 3
+    np.testing.assert_allclose(sweep_df["flight_time"], batch.flight_time.ravel())
+    np.testing.assert_allclose(sweep_df["flight_distance"], batch.flight_distance.ravel())
+
+
+@pytest.mark.parametrize("correlation_type", list(CorrelationType))
+def test_sweep_on_spawned_process_pool(correlation_type: CorrelationType) -> None:
+    velocity = np.linspace(1, 343, 7)
+    angle = np.radians(np.linspace(0.5, 90, 5))
+    parameters = DragParameters(resistance_rate=0.5, mass=1)
+
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        chunks = list(
+            sweep_throws(
+                velocity, angle, correlation_type, parameters, executor=executor, chunk_count=3
+            )
+        )
+    sweep_df = pd.concat(chunks).sort_values(["velocity", "angle"], ignore_index=True)
+    expected_df = next(sweep_throws(velocity, angle, correlation_type, parameters))
+
+    assert len(chunks) == 3
+    pd.testing.assert_frame_equal(sweep_df, expected_df)
@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from labs.model.enum import CorrelationType, SolverType
+from labs.throw_a_rock.acceleration import DragParameters
+from labs.throw_a_rock.motion.throw import POINT_COUNT_THRESHOLD, _result_size, compute_throw
+
+
+@pytest.mark.parametrize("solver_type", list(SolverType))
+def test_throw_is_cached(solver_type: SolverType) -> None:
+    arguments = (30.0, math.radians(30), 2**-8, solver_type, CorrelationType.QUADRATIC)
+
+    first = compute_throw(*arguments, DragParameters(0.5, 1), find_optimal=False)
+    second = compute_throw(*arguments, DragParameters(0.5, 1), find_optimal=False)
+
+    assert second is first
+    assert compute_throw.cache.currsize >= first.trajectory.data.nbytes
+    with pytest.raises(ValueError, match="read-only"):
+        first.trajectory.x[0] = 1
+
+
+def test_optimal_throw_flight_is_counted_in_cache() -> None:
+    result = compute_throw(
+        30.0,
+        0.0,
+        2**-8,
+        SolverType.COUPLED,
+        CorrelationType.QUADRATIC,
+        DragParameters(0.5, 1),
+        find_optimal=True,
+    )
+
+    assert result.optimal_throw is not None
+    assert _result_size(result) > 2 * result.trajectory.data.nbytes
+
+
+def test_optimal_throw_is_cached_regardless_of_angle() -> None:
+    arguments = (2**-8, SolverType.COUPLED, CorrelationType.LINEAR, DragParameters(0.5, 1))
+
+    first = compute_throw(25.0, math.radians(10), *arguments, find_optimal=True)
+    second = compute_throw(25.0, math.radians(60), *arguments, find_optimal=True)
+
+    assert second is first
+
+
+@pytest.mark.parametrize("solver_type", list(SolverType))
+def test_short_throw_sampling_is_refined(solver_type: SolverType) -> None:
+    result = compute_throw(
+        1.0,
+        math.radians(10),
+        2**-6,
+        solver_type,
+        CorrelationType.LINEAR,
+        DragParameters(0.5, 1),
+        find_optimal=False,
+    )
+
+    assert result.sampling_delta < 2**-6
+    assert len(result.trajectory) >= POINT_COUNT_THRESHOLD
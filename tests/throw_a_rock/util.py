@@ -1,8 +1,14 @@
 import math
 
 from labs.model.enum import CorrelationType
+from labs.model.trajectory import Trajectory
 from labs.model.vector import Vector2D
-from labs.throw_a_rock.acceleration import acceleration_law_by_resistance_type
+from labs.throw_a_rock.acceleration import DragParameters, acceleration_law_by_resistance_type
+from labs.throw_a_rock.motion.coupled import (
+    CoupledFlight,
+    simulate_coupled_flight,
+    solve_coupled_flight,
+)
 from labs.throw_a_rock.motion.simulation import simulate_flight
 from labs.throw_a_rock.velocity import VelocityCalculator
 
@@ -19,13 +25,39 @@ def compute_trajectory(
     initial_velocity: float,
     angle: float,
     resistance_type: CorrelationType,
-) -> list[tuple[Vector2D, Vector2D]]:
+    parameters: DragParameters,
+) -> Trajectory:
     velocity_calculator = VelocityCalculator(
         initial_velocity=Vector2D.from_polar(initial_velocity, math.radians(angle)),
-        acceleration_law=acceleration_law_by_resistance_type[resistance_type],
+        acceleration_law=acceleration_law_by_resistance_type[resistance_type](parameters),
         sampling_delta=SAMPLING_DELTA,
     )
-    return list(simulate_flight(velocity_calculator))
+    return simulate_flight(velocity_calculator)
+
+
+def compute_coupled_trajectory(
+    initial_velocity: float,
+    angle: float,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+) -> Trajectory:
+    return simulate_coupled_flight(
+        initial_velocity=Vector2D.from_polar(initial_velocity, math.radians(angle)),
+        acceleration_law=acceleration_law_by_resistance_type[resistance_type](parameters),
+        sampling_delta=SAMPLING_DELTA,
+    )
+
+
+def solve_coupled(
+    initial_velocity: float,
+    angle: float,
+    resistance_type: CorrelationType,
+    parameters: DragParameters,
+) -> CoupledFlight:
+    return solve_coupled_flight(
+        initial_velocity=Vector2D.from_polar(initial_velocity, math.radians(angle)),
+        acceleration_law=acceleration_law_by_resistance_type[resistance_type](parameters),
+    )
 
 
 def assert_accuracy(
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from labs.util.downsampling import largest_triangle_three_buckets
+
+
+@pytest.mark.parametrize("point_count", [3, 10, 1000, 9999])
+def test_downsampling_keeps_ends(point_count: int) -> None:
+    x = np.linspace(0, 10, 10000)
+    indices = largest_triangle_three_buckets(x, np.sin(x), point_count)
+
+    assert len(indices) == point_count
+    assert indices[0] == 0
+    assert indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsampling_keeps_peak() -> None:
+    x = np.linspace(0, 1, 10001)
+    y = np.where(x == 0.5, 1.0, 0.0)
+
+    assert 5000 in largest_triangle_three_buckets(x, y, 16)
+
+
+def test_downsampling_keeps_small_data() -> None:
+    x = np.arange(5.0)
+    np.testing.assert_array_equal(largest_triangle_three_buckets(x, x, 8), np.arange(5))
@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+
+from labs.model.trajectory import Trajectory, trajectory_to_df
+from labs.model.vector import Vector2D
+
+
+def test_append_grows_capacity() -> None:
+    trajectory = Trajectory(capacity=2)
+    for i in range(5):
+        trajectory.append(i / 2, Vector2D(i, 2 * i), Vector2D(3, 4))
+
+    assert len(trajectory) == 5
+    np.testing.assert_allclose(trajectory.time, [0, 0.5, 1, 1.5, 2])
+    np.testing.assert_allclose(trajectory.y, [0, 2, 4, 6, 8])
+    np.testing.assert_allclose(trajectory.velocity_norm, 5)
+    assert trajectory.flight_time == 2
+    assert trajectory.grounding_point == Vector2D(4, 8)
+
+
+def test_from_arrays_matches_append() -> None:
+    velocity = Vector2D(-1, 1)
+    appended = Trajectory()
+    appended.append(0.0, Vector2D(1, 2), velocity)
+    built = Trajectory.from_arrays(
+        np.array([0.0]), np.array([1.0]), np.array([2.0]), np.array([-1.0]), np.array([1.0])
+    )
+
+    np.testing.assert_allclose(built.data, appended.data)
+    assert math.isclose(built.velocity_angle[0], 135)
+
+
+def test_df_wraps_columns_without_copy() -> None:
+    trajectory = Trajectory.from_arrays(*np.ones((5, 3)))
+    df = trajectory_to_df(trajectory)
+
+    assert list(df.columns) == ["time", "x", "y", "velocity_norm", "velocity_angle"]
+    assert np.shares_memory(df.to_numpy(), trajectory.data)
+    assert trajectory.data.nbytes == 40 * len(trajectory)